@@ -1,7 +1,7 @@
 from gui import GUI
 from admin import Admin
-from threads import ProxyAdmin, RealReceiver
-from public import init_logger, dc, gm, Work
+from threads import ProxyAdmin, RealReceiver, TickReader
+from public import init_logger, dc, gm, Work, TickRing, clear_bulk_files
 from classes import Toast, ProcessModel, QMainModel, KiwoomModel
 from tables import set_tables
 from dbm_server import DBMServer
@@ -37,6 +37,8 @@ class Main:
         gm.sim_no = 1 if 'sim1' in args else 2 if 'sim2' in args else 3 if 'sim3' in args else 0
         if 'sim' in args and gm.sim_no == 0: gm.sim_no = 1
         gm.sim_on = gm.sim_no > 0
+        gm.eval_pool_on = 'pool' in args
+        gm.tick_ring_on = 'ring' in args
         logging.info(f"### {'GUI' if gm.gui_on else 'CONSOLE'} Mode 로 시작 합니다. ###")
         logging.info(f"### {f'시뮬레이션 {gm.sim_no}번' if gm.sim_on else '실제 API'} 모드로 시작 합니다. ###")
 
@@ -86,6 +88,12 @@ class Main:
             gm.prx.start()
             gm.rcv = QMainModel('rcv', RealReceiver, gm.shared_qes)
             gm.rcv.start()
+            if gm.tick_ring_on:
+                # api 프로세스 시작 전에 rcv 큐에 링을 붙여야 api 쪽에도 전달됨
+                gm.tick_ring = TickRing()
+                gm.shared_qes['rcv'].attach_ring(gm.tick_ring)
+                gm.tkr = TickReader(gm.rcv, gm.tick_ring)
+                gm.tkr.start()
             gm.api = KiwoomModel('api', APIServer, gm.shared_qes)
             gm.api.start()
             gm.dbm = ProcessModel('dbm', DBMServer, gm.shared_qes)
@@ -199,7 +207,7 @@ class Main:
                             logging.debug(f'큐 닫기/종료 실패 : {name} {e}')
 
             # 1. QThread 기반 워커들 종료 (stop/quit/wait)
-            qthreads = ['rcv', 'cts', 'ctu', 'evl', 'odc', 'pri', 'prx']
+            qthreads = ['tkr', 'rcv', 'cts', 'ctu', 'evl', 'odc', 'pri', 'prx']
             for name in qthreads:
                 obj = getattr(gm, name, None)
                 if obj is not None:
@@ -230,6 +238,16 @@ class Main:
                     except Exception as e:
                         logging.debug(f'{name} Process 종료 실패: {e}')
 
+            if gm.tick_ring is not None:
+                gm.tick_ring.close()
+                gm.tick_ring = None
+            clear_bulk_files()
+
+            # 4. 스크립트 평가 풀 종료
+            if gm.scp is not None:
+                gm.scp.shutdown()
+                gm.scp = None
+
             #self.collect_thread_info()
             #self._force_exit()
 
@@ -0,0 +1,348 @@
+"""
+성능 측정 스크립트 (런타임 모듈과 분리 - 실행 파일 빌드에 포함하지 않음)
+
+사용법: python abench.py [항목 ...]   항목을 주지 않으면 전체 측정
+"""
+from public import dc, QData, QWork, TickRing, SharedQueue, pack_bulk, unpack_bulk
+import multiprocessing as mp
+import threading
+import tempfile
+import copy
+import pickle
+import json
+import time
+import sys
+import os
+
+def measure_wire_format(q_data=None, rounds=10000):
+    """QData 1건 직렬화/역직렬화 비용(마이크로초)과 전송 바이트 (mp.Queue와 같은 ForkingPickler 사용)"""
+    from multiprocessing.reduction import ForkingPickler
+    if q_data is None:
+        fids = {'체결시간': '093015', '현재가': 70100, '거래량': 15, '누적거래량': 1234567, '등락율': 1.23}
+        q_data = QData(sender='api', method='proxy_method', args=(QWork(method='on_receive_real_data', args=('005930', '주식체결', fids)),))
+    payload = bytes(ForkingPickler.dumps(q_data))
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        ForkingPickler.dumps(q_data)
+    dumps_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        pickle.loads(payload)
+    loads_time = time.perf_counter() - start_time
+    return {'bytes': len(payload), 'dumps_us': dumps_time / rounds * 1e6, 'loads_us': loads_time / rounds * 1e6}
+
+def measure_bulk_transfer(rows=50000):
+    """대량 결과 뒤에 보낸 작은 메시지 도착 시간과 전체 복원 시간(ms): 큐 직접 전송 vs BulkRef"""
+    sample = [{'체결시간': f'20250101{idx % 240000:06d}', '종목코드': '005930', '현재가': 70000 + idx % 100,
+               '거래량': idx % 50, '누적거래량': idx, '누적거래대금': idx * 70000, 'sim_no': 2} for idx in range(rows)]
+    result = {}
+    for kind in ('inline', 'bulk'):
+        channel = mp.Queue()
+        start_time = time.perf_counter()
+        payload = pack_bulk(sample) if kind == 'bulk' else sample
+        channel.put(payload)
+        channel.put('ping')
+        first = channel.get()
+        channel.get()
+        control_ms = (time.perf_counter() - start_time) * 1000  # 큐 뒤에 선 작은 메시지 도착
+        received = unpack_bulk(first)
+        result[kind] = {'control_ms': control_ms, 'total_ms': (time.perf_counter() - start_time) * 1000, 'rows': len(received)}
+        channel.close()
+    return result
+
+def _tick_producer(channel, count):
+    """tick_ring 보내는 쪽 (별도 프로세스)"""
+    fid = {'체결시간': '093015', '현재가': '+70100', '전일대비': '+100', '등락율': '+0.14', '매도호가': '+70200', '매수호가': '+70100',
+           '거래량': '+15', '누적거래량': '1234567', '누적거래대금': '86543', '시가': '+70000', '고가': '+70300', '저가': '-69900'}
+    for _ in range(count):
+        if type(channel) is TickRing:
+            while not channel.put('005930', fid):
+                time.sleep(0)
+        else:
+            channel.put_request(QData(sender='api', method='proxy_method', args=(QWork(method='on_receive_real_data', args=('005930', '주식체결', dict(fid))),)))
+
+def measure_tick_ring(count=100000):
+    """실시간 체결 전송: 공유메모리 링 vs mp.Queue(QData 피클) 초당 처리 건수/지연(ms)"""
+    result = {}
+    for kind in ('queue', 'ring'):
+        channel = TickRing() if kind == 'ring' else SharedQueue()
+        latency = []
+        producer = mp.Process(target=_tick_producer, args=(channel, count), daemon=True)
+        producer.start()
+        received, start_time = 0, None
+        while received < count:
+            if kind == 'ring':
+                if not channel.wait(dc.INTERVAL_SLOW): continue
+                now = time.time()
+                start_time = start_time or now
+                ticks = channel.read_batch(dc.QUEUE_BATCH_MAX)
+                received += len(ticks)
+            else:
+                q_data = channel.request.get()
+                now = time.time()
+                start_time = start_time or now
+                latency.append(now - q_data.sent_at)
+                received += 1
+        elapsed = (time.time() - start_time) or 1e-9
+        producer.join()
+        if kind == 'ring':
+            latency = list(channel.latency)
+            channel.close()
+        latency.sort()
+        result[kind] = {'ticks_per_sec': count / elapsed, 'latency_p50_ms': latency[len(latency) // 2] * 1000,
+                        'latency_p99_ms': latency[int(len(latency) * 0.99)] * 1000}
+    return result
+
+SAMPLE_SCRIPT = "m3 = CM(code,'mi',3)\nm1 = CM(code,'mi',1)\nret(m3.c() > m3.ma(5) and m1.c(1) < m1.ma(5, 1) and m3.h(1) > m3.l(1))"
+
+def _sample_codes(count):
+    return [f'{idx:06d}' for idx in range(1, count + 1)]
+
+def _sample_scripts(codes, script=SAMPLE_SCRIPT):
+    """측정용 ScriptManager - 임시 스크립트 파일('bench' 1개)과 종목별 1분봉 50개"""
+    from chart import ScriptManager, ChartData
+    script_file = os.path.join(tempfile.mkdtemp(prefix='abench_'), 'scripts.json')
+    with open(script_file, 'w', encoding='utf-8') as f:
+        json.dump({'bench': {'script': script, 'desc': ''}}, f, ensure_ascii=False)
+    chart_data = ChartData()
+    for code in codes:
+        rows = [{'종목코드': code, '체결시간': f'2026010110{59 - idx:02d}00', '시가': 100 + idx, '고가': 110 + idx, '저가': 90 + idx,
+                 '현재가': 100 + (idx * 7) % 13, '거래량': 10 + idx, '거래대금': 1000 + idx} for idx in range(50)]
+        chart_data.set_chart_data(code, rows, 'mi', 1)
+    return ScriptManager(script_file, cache_path=None)
+
+def measure_eval_pool(codes=20, concurrency=4, rounds=3, workers=2):
+    """동시 평가 처리량(초당 평가 수): 로컬 실행(ScriptManager) vs 평가 풀(ScriptEvalPool)"""
+    from chart import ScriptEvalPool
+    from concurrent.futures import ThreadPoolExecutor
+    codes = _sample_codes(codes)
+    scm = _sample_scripts(codes)
+    pool = ScriptEvalPool(scm, workers=workers)
+    jobs = [{'code': code} for code in codes] * rounds
+
+    def timed(runner):
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda kwargs: runner('bench', dict(kwargs)), jobs))
+        return len(jobs) / max(time.perf_counter() - start_time, 1e-9)
+
+    try:
+        for code in codes:
+            pool.run_script('bench', {'code': code})  # 워커 워밍업 (차트 복제본 전송)
+        return {'codes': len(codes), 'workers': workers, 'local_per_sec': timed(scm.run_script),
+                'pool_per_sec': timed(pool.run_script), 'fallbacks': pool.get_stats()['fallbacks']}
+    finally:
+        pool.shutdown()
+
+def measure_batch_eval(codes=20, rounds=20):
+    """종목별 run_script 반복 호출 vs run_script_many 일괄 평가 처리량(건/초)"""
+    scm = _sample_scripts(_sample_codes(codes))
+    kwargs_list = [{'code': code} for code in _sample_codes(codes)]
+    count = len(kwargs_list) * rounds
+    scm.run_script_many('bench', kwargs_list)  # 컴파일 워밍업
+
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        for kwargs in kwargs_list:
+            scm.run_script('bench', kwargs=kwargs)
+    loop_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        scm.run_script_many('bench', kwargs_list)
+    batch_time = time.perf_counter() - start_time
+    return {'evaluations': count, 'loop_per_sec': count / loop_time, 'batch_per_sec': count / batch_time,
+            'speedup': loop_time / batch_time}
+
+CSE_SCRIPT = """m3 = CM(code,'mi',3)
+a = m3.c() > m3.ma(5) and m3.c(1) < m3.ma(5, 1)
+b = m3.c() - m3.h(1) + m3.h(1) + CM(code,'mi',1).c() + CM(code,'mi',1).c()
+for i in range(3):
+    if m3.c(i) > m3.ma(5):
+        b += m3.c()
+ret((a, b))"""
+
+def measure_cse(script=CSE_SCRIPT):
+    """공통 호출 제거 전/후 1회 평가당 ChartManager 메서드 호출 수 (내부 호출 포함)"""
+    from chart import ChartManager
+    code = _sample_codes(1)[0]
+    scm = _sample_scripts([code], script)
+    kwargs = {'code': code}
+    call_count = [0]
+    method_names = {name for name in dir(ChartManager) if not name.startswith('_') and callable(getattr(ChartManager, name))}
+    class CountingChartManager(ChartManager):
+        def __getattribute__(self, name):
+            if name in method_names:
+                call_count[0] += 1
+            return super().__getattribute__(name)
+
+    stats = {}
+    for label, cse in (('without', False), ('with', True)):
+        code_obj = scm._build_code('bench', script, cse=cse)
+        scm._set_current_context(kwargs)
+        globals_dict, _ = scm._prepare_execution_globals('bench')
+        globals_dict.update({'ChartManager': CountingChartManager, 'CM': CountingChartManager,
+                             'kwargs': kwargs, '_current_kwargs': kwargs})
+        call_count[0] = 0
+        try:
+            exec(code_obj, globals_dict, {})
+        except SystemExit as e:
+            if str(e) != 'script_return':
+                raise
+        stats[f'calls_{label}'] = call_count[0]
+        stats[f'result_{label}'] = globals_dict.get('_script_result')
+    stats['same_result'] = stats['result_without'] == stats['result_with']
+    stats['reduction_pct'] = (1 - stats['calls_with'] / stats['calls_without']) * 100 if stats['calls_without'] else 0
+    return stats
+
+def measure_reload_latency(evaluations=2000, reloads=20):
+    """
+    스크립트 교체 중 평가 지연 (교체 없음 vs 백그라운드 교체 반복) - p50/p99/max(ms)
+    교체는 주석만 다른 스크립트를 publish_scripts로 반복 적용 (파일 저장 없음)
+    """
+    code = _sample_codes(1)[0]
+    scm = _sample_scripts([code])
+    original = scm.get_script('bench')
+    kwargs = {'code': code}
+
+    def run_evaluations():
+        latencies = []
+        for _ in range(evaluations):
+            start_time = time.perf_counter()
+            scm.run_script('bench', kwargs=kwargs)
+            latencies.append(time.perf_counter() - start_time)
+        latencies.sort()
+        return {'p50_ms': latencies[len(latencies) // 2] * 1000,
+                'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+                'max_ms': latencies[-1] * 1000}
+
+    stats = {'idle': run_evaluations()}
+    stop = threading.Event()
+    def reload_loop():
+        for idx in range(reloads):
+            if stop.wait(0.005):
+                break
+            scm.publish_scripts({'bench': {**original, 'script': f"{original['script']}\n# reload {idx}"}})
+
+    reloader = threading.Thread(target=reload_loop, daemon=True)
+    reloader.start()
+    try:
+        stats['reload'] = run_evaluations()
+    finally:
+        stop.set()
+        reloader.join()
+    return stats
+
+def _sample_holdings(table_class, rows=40):
+    from tables import tbl
+    table = table_class(tbl.hd잔고목록)
+    codes = _sample_codes(rows)
+    for idx, code in enumerate(codes):
+        table.set(key=code, data={'종목명': code, '보유수량': 10, '매입가': 1000, '매입금액': 10000, '현재가': 1000 + idx})
+    return table, codes
+
+def _read_cost(table, key=None, filter=None, rounds=1000):
+    """같은 조회 1회 비용(마이크로초): deepcopy(이전 get) / get(복사) / view(복사 없음)"""
+    def deepcopy_read():
+        if key is not None: return copy.deepcopy(table._find_items_by_key(key))
+        return copy.deepcopy(table.data if filter is None else table._filter_data(filter, copy_rows=False))
+    result = {}
+    for name, read in (('deepcopy', deepcopy_read),
+                       ('get', lambda: table.get(key=key, filter=filter)),
+                       ('view', lambda: table.view(key=key, filter=filter))):
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            read()
+        result[f'{name}_us'] = (time.perf_counter() - start_time) / rounds * 1e6
+    return result
+
+def measure_read_cost(rows=40, rounds=1000):
+    """잔고목록 조회 1회 비용(마이크로초) - 키 1건 / 전체, TableManager와 QTableManager"""
+    from tables import TableManager, QTableManager
+    result = {}
+    for table_class in (TableManager, QTableManager):
+        table, codes = _sample_holdings(table_class, rows)
+        result[f'{table_class.__name__}.key'] = _read_cost(table, key=codes[0], rounds=rounds)
+        result[f'{table_class.__name__}.all'] = _read_cost(table, rounds=rounds)
+    return result
+
+def _reader_wait(rows, seconds, readers, row_locking):
+    from tables import TableManager
+    table, codes = _sample_holdings(TableManager, rows)
+    table.row_locking = row_locking
+    stop = threading.Event()
+    elapsed = []
+
+    def ticker():
+        n = 0
+        while not stop.is_set():
+            n += 1
+            price = 1000 + n % 50
+            table.set(key=codes[n % rows], data={'현재가': price, '평가금액': price * 10, '평가손익': price * 10 - 10000})
+            if n % 500 == 0:  # 구조 변경 (편입/청산)
+                if table.in_key('999999'): table.delete(key='999999')
+                else: table.set(key='999999', data={'종목명': '편입', '보유수량': 1})
+
+    def reader(kind):
+        local = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            if kind == 0: table.get()
+            elif kind == 1: table.get(key=codes[len(local) % rows])
+            else: table.sum(column=['매입금액', '평가금액'])
+            local.append(time.perf_counter() - start)
+        elapsed.extend(local)
+
+    threads = [threading.Thread(target=ticker, daemon=True)]
+    threads += [threading.Thread(target=reader, args=(idx % 3,), daemon=True) for idx in range(readers)]
+    for thread in threads: thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads: thread.join()
+
+    elapsed.sort()
+    count = len(elapsed)
+    pct = lambda p: elapsed[min(count - 1, int(count * p))] * 1e6
+    return {'reads': count, 'p50_us': pct(0.5), 'p99_us': pct(0.99), 'max_us': elapsed[-1] * 1e6, **table.get_lock_stats()}
+
+def measure_reader_wait(rows=40, seconds=2.0, readers=3):
+    """
+    바쁜 장중 재현 - 틱 쓰레드가 잔고목록 행마다 현재가/평가금액/평가손익을 set() 하고 가끔 행 추가/삭제,
+    읽기 쓰레드들 (화면 갱신/전략 평가/잔고합산 흉내) 이 get()/get(key)/sum()을 반복할 때 읽기 1회 시간 (마이크로초)
+    table_lock은 이전 방식 (모든 읽기/쓰기 테이블 락), row_lock은 현재 방식
+    """
+    return {'table_lock': _reader_wait(rows, seconds, readers, row_locking=False),
+            'row_lock': _reader_wait(rows, seconds, readers, row_locking=True)}
+
+# 항목명: (설명, 측정 함수)
+BENCHES = {
+    'wire': ('QData 1건 직렬화 비용/크기', measure_wire_format),
+    'bulk': ('대량 결과 전달 - 큐 직접 전송 vs BulkRef 임시 파일', measure_bulk_transfer),
+    'tick_ring': ('실시간 체결 전송 - 공유메모리 링 vs mp.Queue', measure_tick_ring),
+    'eval_pool': ('스크립트 동시 평가 - 로컬 실행 vs 평가 풀', measure_eval_pool),
+    'batch_eval': ('스크립트 평가 - 종목별 호출 vs 일괄 평가', measure_batch_eval),
+    'cse': ('스크립트 컴파일 - 공통 호출 제거 전/후 ChartManager 호출 수', measure_cse),
+    'reload': ('스크립트 교체 중 평가 지연', measure_reload_latency),
+    'read_cost': ('테이블 조회 비용 - deepcopy vs get vs view', measure_read_cost),
+    'reader_wait': ('테이블 쓰기 중 읽기 지연 - 테이블 락 vs 행 단위 쓰기', measure_reader_wait),
+}
+
+def _rounded(value):
+    """출력용 - 실수는 소수 셋째 자리까지"""
+    if type(value) is float: return round(value, 3)
+    if type(value) is dict: return {key: _rounded(item) for key, item in value.items()}
+    return value
+
+def main(names):
+    for name in names or BENCHES:
+        if name not in BENCHES:
+            print(f'알 수 없는 항목: {name} (가능: {", ".join(BENCHES)})')
+            continue
+        desc, bench = BENCHES[name]
+        print(f'[{name}] {desc}')
+        result = bench()
+        for key, value in result.items():
+            print(f'  {key}: {_rounded(value)}')
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
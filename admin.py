@@ -1,7 +1,7 @@
 from public import gm, dc, Work, hoga, load_json, save_json
-from classes import ThreadSafeDict, CounterTicker, ThreadSafeQueue, ThreadSafeSet
+from classes import ThreadSafeDict, CounterTicker, ThreadSafeQueue, ThreadSafeSet, MasterCache
 from threads import OrderCommander, EvalStrategy, ChartSetter, ChartUpdater, PriceUpdater
-from chart import ScriptManager
+from chart import ScriptManager, ScriptEvalPool
 from tables import tbl
 from dbm_server import db_columns
 from tabulate import tabulate
@@ -66,9 +66,13 @@ class Admin:
         gm.order_q = ThreadSafeQueue('order_q')
         gm.setter_q = ThreadSafeQueue('setter_q')
         gm.chart_q = ThreadSafeQueue('chart_q')
+        gm.master = MasterCache(gm.prx)
+        gm.master.load()
         gm.counter = CounterTicker()
         gm.dict종목정보 = ThreadSafeDict()
         gm.scm = ScriptManager()
+        if gm.eval_pool_on:
+            gm.scp = ScriptEvalPool(gm.scm, workers=dc.EVAL_POOL_WORKERS)
         gm.prx.order('dbm', 'set_rate', gm.수수료율, gm.세금율)
 
     def get_conditions(self):
@@ -292,13 +296,14 @@ class Admin:
             updated = gm.dict종목정보.update_if_exists(code, '현재가', 현재가)
 
             if updated:
-                주문 = gm.주문진행목록.get(filter={'종목코드': code, '상태': '대기'})
+                # 틱마다 불림 - 종목코드 인덱스 묶음(종목당 매수/매도 1~2행)만 보고 복사 없이 확인
+                주문 = gm.주문진행목록.find('종목코드', code, filter={'상태': '대기'})
                 if 주문:
-                    gm.주문진행목록.set(key=(code, 주문[0]["구분"]), data={'상태': '요청'})
-                    logging.debug(f'종목 가격 업데이트와 주문 처리: {code} {주문[0]["종목명"]} {현재가}')
-                    if 주문[0]['구분'] == '매수':
+                    gm.주문진행목록.set(key=(code, 주문["구분"]), data={'상태': '요청'})
+                    logging.debug(f'종목 가격 업데이트와 주문 처리: {code} {주문["종목명"]} {현재가}')
+                    if 주문['구분'] == '매수':
                         gm.eval_q.put((code, 'buy', {'rqname': '신규매수', 'price': 현재가}))
-                    elif 주문[0]['구분'] == '매도':
+                    elif 주문['구분'] == '매도':
                         row = gm.잔고목록.get(key=code)
                         row['현재가'] = 현재가
                         gm.eval_q.put((code, 'sell', {'row': row, 'sell_condition': True}))
@@ -340,7 +345,7 @@ class Admin:
 
     def pri_fx얻기_잔고목록(self):
         try:
-            전일가 = gm.prx.answer('api', 'GetMasterLastPrice', '005930')
+            전일가 = gm.master.get_last_price('005930')
             종목정보 = {'종목명': '삼성전자', '전일가': 전일가, "현재가": 0}
             gm.dict종목정보.set('005930', 종목정보)
             logging.info(f'삼성전자(005930) 차트 데이터 요청 큐 추가')
@@ -384,7 +389,7 @@ class Admin:
             def save_counter(dict_list):
                 data = {}
                 for item in dict_list:
-                    전일가 = gm.prx.answer('api', 'GetMasterLastPrice', item['종목번호'])
+                    전일가 = gm.master.get_last_price(item['종목번호'])
                     종목정보 = {'종목명': item['종목명'], '전일가': 전일가, "현재가": 0}
                     # 락 획득시간 최소화
                     gm.dict종목정보.set(item['종목번호'], 종목정보)
@@ -463,8 +468,8 @@ class Admin:
             gm.set종목감시 = set(gm.잔고목록.get(column='종목번호') or [])
             gm.set종목감시.add('005930')
             for code in gm.set종목감시:
-                종목명 = gm.prx.answer('api', 'GetMasterCodeName', code)
-                전일가 = gm.prx.answer('api', 'GetMasterLastPrice', code)
+                종목명 = gm.master.get_name(code)
+                전일가 = gm.master.get_last_price(code)
                 value = {'종목명': 종목명, '전일가': 전일가, '현재가': 0}
                 # 락 획득시간 최소화
                 gm.dict종목정보.set(code, value)
@@ -717,10 +722,10 @@ class Admin:
 
     def stg_fx편입_실시간조건감시(self, kind, code, type, cond_name, cond_index):
         try:
-            종목명 = gm.prx.answer('api', 'GetMasterCodeName', code)
+            종목명 = gm.master.get_name(code)
+            전일가 = gm.master.get_last_price(code)
 
             if not gm.dict종목정보.contains(code):
-                전일가 = gm.prx.answer('api', 'GetMasterLastPrice', code)
                 value={'종목명': 종목명, '전일가': 전일가, '현재가': 0}
                 gm.dict종목정보.set(code, value)
 
@@ -758,7 +763,6 @@ class Admin:
                 logging.info(f'{kind} 지정가 주문: {self.전략명칭} {code} {종목명}')
 
             if gm.sim_no == 0 and kind == '매수':
-                전일가 = gm.prx.answer('api', 'GetMasterLastPrice', code)
                 sim_record = {'일자': dc.ToDay, '종목코드': code, '종목명': 종목명, '전일가': 전일가, 'sim_no': 2}
                 gm.prx.order('dbm', 'table_upsert', 'db', db_columns.SIM_TABLE_NAME, sim_record, key=db_columns.SIM_KEYS)
 
@@ -771,7 +775,7 @@ class Admin:
 
     def stg_fx이탈_실시간조건감시(self, kind, code, type, cond_name, cond_index):
         try:
-            name = gm.prx.answer('api', 'GetMasterCodeName', code)
+            name = gm.master.get_name(code)
             if kind == '매도':
                 if gm.매도검색목록.in_key(code):
                     logging.info(f'{kind}이탈 : {self.전략명칭} {code} {name}')
@@ -992,9 +996,9 @@ class Admin:
                     logging.info(f'{구분}주문 취소 접수: origin_no={origin_no} {code} {name} 주문수량={qty} 미체결수량={remain_qty} 주문가격={price}')
 
                 else: # 외부주문
-                    종목명 = gm.prx.answer('api', 'GetMasterCodeName', code)
+                    종목명 = gm.master.get_name(code)
                     if not gm.dict종목정보.contains(code):
-                        전일가 = gm.prx.answer('api', 'GetMasterLastPrice', code)
+                        전일가 = gm.master.get_last_price(code)
                         value={'종목명': 종목명, '전일가': 전일가, '현재가': 0}
                         gm.dict종목정보.set(code, value)
 
@@ -1061,7 +1065,7 @@ class Admin:
                                 '감시': 0, '보존': 0, '매수일자': dc.ToDay, '매수시간': 매매시간, '매수번호': order_no, '매수수량': qty, '매수가': price, '매수금액': amount}
                     if not gm.잔고목록.in_key(code):
                         if gm.sim_no == 0:
-                            전일가 = gm.prx.answer('api', 'GetMasterLastPrice', code)
+                            전일가 = gm.master.get_last_price(code)
                             sim_record = {'일자': dc.ToDay, '종목코드': code, '종목명': name, '전일가': 전일가, '상태': '매수', 'sim_no': 2}
                             gm.prx.order('dbm', 'table_upsert', 'db', db_columns.SIM_TABLE_NAME, sim_record, key=db_columns.SIM_KEYS)
                         gm.holdings[code] = data
@@ -1995,6 +1995,18 @@ class APIServer:
         data = int(data) if data else 0
         return data
 
+    def GetMasterData(self, markets=('0', '10', '8', '60', '6', '50')):
+        """종목 마스터 일괄 조회 (메인 프로세스 MasterCache 적재용) - {종목코드: (종목명, 전일가)}
+        - 조건검색에 나올 수 있는 시장 모두: 코스피, 코스닥, ETF, ETN, 리츠, 코넥스 (시장 간 중복 코드는 한 번만)"""
+        if self.sim_no == 1:  # 키움서버 없이 가상 데이터 사용 (sim_no=1)
+            return {code: (info.get('종목명', ''), int(info.get('전일가', 0) or 0)) for code, info in sim.ticker.items()}
+        master = {}
+        for market in markets:
+            for code in self.GetCodeListByMarket(market):
+                if code in master: continue
+                master[code] = (self.GetMasterCodeName(code), self.GetMasterLastPrice(code))
+        return master
+
     def GetCommRealData(self, code, fid):
         if self.sim_no == 0:  # 실제 API 서버
             data = self.ocx.dynamicCall("GetCommRealData(QString, int)", code, fid)
@@ -2006,7 +2018,7 @@ class APIServer:
         시장별 상장된 종목코드를 반환하는 메서드
         :param market: str 
                     0: 코스피, 3: ELW, 4: 뮤추얼펀드 5: 신주인수권 6: 리츠
-                    8: ETF, 9: 하이일드펀드, 10: 코스닥, 30: K-OTC, 50: 코넥스(KONEX)
+                    8: ETF, 9: 하이일드펀드, 10: 코스닥, 30: K-OTC, 50: 코넥스(KONEX), 60: ETN
         :return: 종목코드 리스트 예: ["000020", "000040", ...]
         """
         data = self.ocx.dynamicCall("GetCodeListByMarket(QString)", market)
@@ -11,6 +11,10 @@ import logging
 import threading
 import traceback
 import math
+import zlib
+import sys
+import hashlib
+import marshal
 from contextlib import contextmanager
 
 class ChartData:
@@ -50,6 +54,10 @@ class ChartData:
                 # 코드별 락만 사용 (단순화)
                 self._code_locks = {}        # {code: RLock}
                 self._code_locks_lock = threading.RLock()
+
+                # 전략 스크립트가 사용하는 주기 (None이면 전체 주기 사용)
+                self._required_cycles = None # {cycle_key, ...}
+                self._cycle_lookback = {}    # {cycle_key: 필요 봉 수}
                 
                 self._initialized = True
                 logging.debug(f"[{datetime.now()}] ChartData initialized (memory-based) in PID: {os.getpid()}")
@@ -216,11 +224,17 @@ class ChartData:
         """종목 등록 여부 확인 (메모리 기반으로 단순화)"""
         if code not in self._chart_data:
             return False
-        # mi1과 dy에 데이터가 있는지 확인 (구조만 있는 경우 False)
-        mi1_data = self._chart_data[code].get('mi1')
-        dy_data = self._chart_data[code].get('dy')
-        if not (mi1_data and len(mi1_data) > 0 and dy_data and len(dy_data) > 0):
-            return False
+        # 일봉 계열을 쓰지 않는 전략이면 일봉 없이도 등록 완료로 본다
+        if not self.needs_daily():
+            mi1_data = self._chart_data[code].get('mi1')
+            if not (mi1_data and len(mi1_data) > 0):
+                return False
+        else:
+            # mi1과 dy에 데이터가 있는지 확인 (구조만 있는 경우 False)
+            mi1_data = self._chart_data[code].get('mi1')
+            dy_data = self._chart_data[code].get('dy')
+            if not (mi1_data and len(mi1_data) > 0 and dy_data and len(dy_data) > 0):
+                return False
         # MAX_CANDLES에 있는 모든 분봉 주기에 데이터가 있는지 확인 (구조만 있는 경우 False)
         for cycle_key in self.MAX_CANDLES.keys():
             if cycle_key.startswith('mi') and cycle_key != 'mi1':
@@ -228,7 +242,121 @@ class ChartData:
                 if cycle_data is None or len(cycle_data) == 0:
                     return False
         return True
+
+    def needs_daily(self) -> bool:
+        """일봉(dy/wk/mo) 데이터가 필요한지 여부 (사용 주기 미등록 시 항상 필요)"""
+        required = self._required_cycles
+        if required is None:
+            return True
+        return any(key in required for key in ('dy', 'wk', 'mo'))
+
+    def register_cycles(self, requirements: dict):
+        """
+        전략 스크립트가 사용하는 주기 사전 등록 및 워밍
+        
+        Args:
+            requirements: {cycle_key: 필요 봉 수} 예) {'mi3': 121, 'dy': 21}
+        
+        - 분봉 주기는 MAX_CANDLES에 미리 추가하여 set_chart_data 시 한 번에 생성
+        - 이미 등록된 종목은 새 주기를 즉시 생성하여 첫 평가 시 생성 비용 제거
+        """
+        if requirements is None:
+            self._required_cycles = None
+            self._cycle_lookback = {}
+            return
+
+        new_minute_cycles = []
+        for cycle_key, lookback in requirements.items():
+            if cycle_key not in self.MAX_CANDLES:
+                self.MAX_CANDLES[cycle_key] = max(1000, lookback or 0)
+                if cycle_key.startswith('mi') and cycle_key != 'mi1':
+                    new_minute_cycles.append(cycle_key)
+            elif lookback and lookback > self.MAX_CANDLES[cycle_key]:
+                logging.warning(f'[ChartData] {cycle_key} 필요 봉 수({lookback})가 보관 한도({self.MAX_CANDLES[cycle_key]})를 초과')
+
+        self._required_cycles = set(requirements.keys()) | {'mi1'}
+        self._cycle_lookback = dict(requirements)
+
+        if not new_minute_cycles:
+            return
+
+        # 이미 차트가 있는 종목은 새 분봉 주기를 바로 생성
+        for code in list(self._chart_data.keys()):
+            code_lock = self._get_code_lock(code)
+            with code_lock:
+                for cycle_key in new_minute_cycles:
+                    if cycle_key not in self._chart_data[code]:
+                        self._chart_data[code][cycle_key] = deque(maxlen=self.MAX_CANDLES[cycle_key])
+                if self._chart_data[code].get('mi1'):
+                    self._set_all_minute_chart(code)
+                    self._increment_version(code)
+        logging.info(f'[ChartData] 사용 주기 등록: {sorted(self._required_cycles)} (신규 분봉={new_minute_cycles})')
+
+    def get_required_cycles(self) -> dict:
+        """등록된 사용 주기와 필요 봉 수 반환 (미등록 시 None)"""
+        if self._required_cycles is None:
+            return None
+        return {key: self._cycle_lookback.get(key, 0) for key in self._required_cycles}
     
+    def export_snapshot(self, code: str, cycle_keys=None, since: dict = None) -> dict:
+        """
+        다른 프로세스의 읽기 전용 복제본용 차트 스냅샷 반환
+        
+        Args:
+            cycle_keys: 보낼 주기 키 목록 (None이면 전체)
+            since: {cycle_key: 체결시간} 이 시간 이후(포함) 봉만 보냄 (증분), 없으면 전체
+        
+        Returns:
+            {'cycles': {cycle_key: [봉,...]}, 'full': {cycle_key: bool}, 'maxlen': {cycle_key: int}, 'head': {cycle_key: 체결시간}}
+        """
+        snapshot = {'cycles': {}, 'full': {}, 'maxlen': {}, 'head': {}}
+        code_lock = self._get_code_lock(code)
+        with code_lock:
+            chart = self._chart_data.get(code)
+            if not chart:
+                return snapshot
+            for cycle_key in (cycle_keys or list(chart.keys())):
+                candles = chart.get(cycle_key)
+                if candles is None:
+                    continue
+                last_time = (since or {}).get(cycle_key)
+                if last_time is None:
+                    rows = [dict(candle) for candle in candles]
+                    snapshot['full'][cycle_key] = True
+                else:
+                    rows = []
+                    for candle in candles:  # 최신 봉부터
+                        if candle['체결시간'] < last_time:
+                            break
+                        rows.append(dict(candle))
+                    snapshot['full'][cycle_key] = False
+                snapshot['cycles'][cycle_key] = rows
+                snapshot['maxlen'][cycle_key] = candles.maxlen
+                snapshot['head'][cycle_key] = candles[0]['체결시간'] if candles else None
+        return snapshot
+
+    def apply_snapshot(self, code: str, snapshot: dict):
+        """export_snapshot() 결과를 복제본에 반영 (증분은 겹치는 최신 봉을 교체)"""
+        code_lock = self._get_code_lock(code)
+        with code_lock:
+            self._ensure_data_structure(code)
+            chart = self._chart_data[code]
+            for cycle_key, rows in snapshot['cycles'].items():
+                maxlen = snapshot['maxlen'].get(cycle_key) or 1000
+                if cycle_key not in self.MAX_CANDLES:
+                    self.MAX_CANDLES[cycle_key] = maxlen
+                candles = chart.get(cycle_key)
+                if candles is None or snapshot['full'].get(cycle_key):
+                    chart[cycle_key] = deque(rows, maxlen=maxlen)
+                    continue
+                if not rows:
+                    continue
+                oldest_time = rows[-1]['체결시간']
+                while candles and candles[0]['체결시간'] >= oldest_time:
+                    candles.popleft()
+                candles.extendleft(reversed(rows))
+            self._increment_version(code)
+
     #@profile_operation
     def set_chart_data(self, code: str, data: list, cycle: str, tick: int = None):
         """차트 데이터 설정 (초고속 버전)"""
@@ -3037,6 +3165,12 @@ class ChartManager:
             'blue_count': blue_count # SB~HC 구간 음봉 개수 (SB 제외, HC 포함)
         }
 
+_CSE_UNSET = object()  # 공통 호출 제거 슬롯 미계산 표시
+
+class ScriptBudgetExceeded(BaseException):
+    """스크립트 실행 한도(시간/반복 횟수) 초과 - 사용자 스크립트의 except Exception에 잡히지 않도록 BaseException 상속"""
+    pass
+
 class ScriptManager:
     """
     스크립트 호출/인수 전파 원칙 요약 (A→B→C 예시)
@@ -3102,9 +3236,63 @@ class ScriptManager:
         r'while\s+.*:',
     ]
 
-    def __init__(self, script_file=dc.fp.scripts_file):
+    # 검증/컴파일 규칙 버전 - 래퍼, 검증 규칙, 컴파일 변환이 바뀌면 올려서 디스크 캐시 무효화
+    VALIDATOR_VERSION = 2
+
+    # 공통 호출 제거(CSE): 같은 인수의 ChartManager 순수 메서드 호출은 실행 1회당 한 번만 계산
+    CSE_ENABLED = True
+    # 차트 데이터만 읽고 불변값(숫자/bool/str/tuple)을 반환하는 메서드 (list/dict 반환 메서드는 제외)
+    PURE_CHART_METHODS = frozenset({
+        'c', 'o', 'h', 'l', 'v', 'a',
+        'red', 'blue', 'doji', 'marubozu', 'body', 'body_top', 'body_bottom', 'body_center',
+        'up_tail', 'down_tail', 'length', 'body_pct', 'up_tail_pct', 'down_tail_pct', 'length_pct',
+        'long_body', 'short_body', 'price_position', 'in_up_tail', 'in_down_tail', 'in_body',
+        'gap_up', 'gap_down', 'is_doji', 'is_shooting_star', 'is_hanging_man', 'is_hammer',
+        'is_engulfing', 'is_harami', 'bar_time', 'bar_date', 'ma', 'trend_up', 'trend_down',
+        'reverse_up', 'reverse_down', 'rsi', 'macd', 'bollinger_bands', 'envelope', 'stochastic',
+        'atr', 'base_line', 'up_start', 'down_start', 'bar', 'longest_bar',
+        'get_highest_candle', 'get_highest_volume',
+    })
+
+    # 스크립트 실행 한도 (최상위 실행 1회 기준, 하위 스크립트 호출 포함)
+    SCRIPT_TIME_BUDGET = 0.1        # 실행 제한 시간 (초)
+    SCRIPT_OP_BUDGET = 1000000      # 반복문 반복 횟수 제한
+    BUDGET_CHECK_INTERVAL = 1024    # 제한 시간 확인 주기 (반복 횟수)
+    QUARANTINE_LIMIT = 3            # 격리 기준 한도 초과 횟수
+    QUARANTINE_WINDOW = 60          # 격리 기준 시간 (초)
+
+    # 차트 생성 함수명 (스크립트 정적 분석용)
+    CHART_FACTORIES = ('CM', 'ChartManager')
+
+    # 지표 메서드별 필요 봉 수 계산 정보: (기간 인수 위치, 기본 기간, 오프셋(n) 인수 위치)
+    INDICATOR_PERIODS = {
+        'ma': (0, 20, 1),
+        'get_ma': (0, 20, 2),
+        'rsi': (0, 14, 1),
+        'macd': (1, 26, 3),
+        'bollinger_bands': (0, 20, 2),
+        'envelope': (0, 20, 2),
+        'stochastic': (0, 14, 2),
+        'atr': (0, 14, 1),
+        'base_line': (0, 26, 1),
+        'avg': (1, None, 2),
+        'highest': (1, None, 2),
+        'lowest': (1, None, 2),
+        'sum': (1, None, 2),
+        'eavg': (1, None, 2),
+        'wavg': (1, None, 2),
+        'stdev': (1, None, 2),
+        'trend_up': (0, 20, 1),
+        'trend_down': (0, 20, 1),
+        'reverse_up': (0, 5, 1),
+        'reverse_down': (0, 5, 1),
+    }
+
+    def __init__(self, script_file=dc.fp.scripts_file, cache_path=dc.fp.cache_path):
         """초기화"""
+        self._init_started = time.perf_counter()
         self.script_file = script_file
+        self.cache_path = cache_path  # 컴파일된 스크립트 디스크 캐시 경로 (None이면 사용 안 함)
         self.scripts = {}  # {script_name: {script: str, desc: str}}
         self._running_scripts = set()  # 실행 중인 스크립트 추적
         self.chart_data = ChartData()  # 차트 데이터 관리자
@@ -3120,8 +3308,30 @@ class ScriptManager:
         # 스크립트 결과 재사용을 위한 캐시
         self._script_result_cache = {}
 
+        # 스크립트 정적 의존성 분석 캐시 {script_key: deps}
+        self._dependency_cache = {}
+        # 적용 중인 전략 스크립트명 (prepare_strategy_scripts) - 스크립트가 바뀌면 의존 주기 다시 등록
+        self._strategy_script_names = None
+
+        # 실행 한도 초과 기록 및 격리 스크립트
+        self._budget_violations = {}  # {script_name: deque([초과시각, ...])}
+        self._quarantined = {}        # {script_name: 격리 사유}
+        self._budget_lock = threading.Lock()
+
+        # 스크립트 세대 (publish_scripts로 원자적 교체)
+        self._generation = 0
+        self._publish_lock = threading.Lock()
+
+        # 공통 호출 제거 통계 {script_name: {'expressions', 'removed_calls'}}
+        self._cse_stats = {}
+
+        # 디스크 캐시 통계
+        self._code_cache_salt = None
+        self._disk_cache_stats = {'hits': 0, 'misses': 0, 'writes': 0, 'preload_time': 0.0, 'first_eval_time': None}
+
         # 파일에서 스크립트 로드
         self._load_scripts()
+        self._preload_code_cache()
 
     def _get_current_context(self) -> Dict[str, Any]:
         """현재 스레드의 실행 컨텍스트 가져오기"""
@@ -3212,14 +3422,74 @@ class ScriptManager:
         return self.scripts
     
     def get_script(self, script_name: str):
-        """이름으로 스크립트 가져오기"""
-        return self.scripts.get(script_name, {})
+        """이름으로 스크립트 가져오기 (실행 중이면 실행 시작 시점의 세대에서)"""
+        return self._get_scripts().get(script_name, {})
     
+    def _get_scripts(self):
+        """현재 스레드의 실행 세대 스크립트 - 실행 중인 평가는 시작 시점 세대를 끝까지 사용"""
+        budget = getattr(self._thread_local, 'budget', None)
+        return budget['scripts'] if budget is not None else self.scripts
+
+    def publish_scripts(self, updates: dict = None, removed=()):
+        """
+        스크립트 변경을 새 세대로 준비(검증/컴파일/래퍼 생성)한 뒤 원자적으로 교체
+
+        - self.scripts는 세대별 불변 dict로 취급하고 참조만 교체 (평가 스레드는 락 없이 읽음)
+        - 새 세대 코드는 교체 전에 컴파일 캐시에 채워 두므로 교체 직후 평가도 컴파일 없이 실행
+        - 실행 중인 평가는 시작 시점 세대(_begin_budget에서 고정)로 완료
+        Returns: {script_name: 오류 메시지} (컴파일 실패 스크립트, 세대에는 포함됨)
+        """
+        updates = updates or {}
+        errors = {}
+        with self._publish_lock:
+            new_scripts = dict(self.scripts)
+            for name in removed:
+                new_scripts.pop(name, None)
+            new_scripts.update(updates)
+
+            # 1. 새 세대 준비 (평가 경로 밖에서 검증/컴파일)
+            for name, data in updates.items():
+                source = data.get('script', '')
+                script_key = f"{name}:{hash(source)}"
+                if source and script_key not in self._compiled_script_cache:
+                    code_obj, error_msg = self._get_validated_code(name, source)
+                    if error_msg:
+                        errors[name] = error_msg
+                        logging.warning(f"스크립트 세대 준비 오류 ({name}): {error_msg}")
+                    else:
+                        self._compiled_script_cache[script_key] = code_obj
+                if name not in self._script_wrapper_cache:
+                    compiled_wrapper = self._compile_wrapper(name)
+                    if compiled_wrapper is not None:
+                        self._script_wrapper_cache[name] = compiled_wrapper
+
+            # 2. 원자적 교체
+            old_scripts = self.scripts
+            self.scripts = new_scripts
+            self._generation += 1
+
+            # 3. 이전 세대 정리 (실행 중 평가는 이미 코드 객체를 잡고 있음)
+            for name in set(updates) | set(removed):
+                old_source = old_scripts.get(name, {}).get('script')
+                if old_source is not None and old_source == new_scripts.get(name, {}).get('script'):
+                    continue
+                self._invalidate_script_cache(name, keep=new_scripts.get(name, {}).get('script'))
+
+        logging.debug(f"스크립트 세대 {self._generation} 교체 (변경 {len(updates)}개, 삭제 {len(removed)}개)")
+
+        # 적용 중인 전략 스크립트(또는 그 하위 스크립트)가 바뀌었을 수 있으므로 사용 주기 다시 등록
+        if self._strategy_script_names is not None and (updates or removed):
+            try:
+                self.prepare_strategy_scripts(self._strategy_script_names)
+            except Exception as e:
+                logging.error(f"스크립트 사용 주기 재등록 오류: {type(e).__name__} - {e}", exc_info=True)
+        return errors
+
     def delete_script(self, script_name: str):
         """스크립트 삭제"""
         if script_name in self.scripts:
             try:
-                del self.scripts[script_name]
+                self.publish_scripts(removed=[script_name])
                 logging.info(f"스크립트 삭제 완료: {script_name}")
                 return self._save_scripts()
             except Exception as e:
@@ -3286,6 +3556,544 @@ class ScriptManager:
         
         return False
 
+    def _analyze_dependencies(self, tree) -> dict:
+        """
+        스크립트 AST에서 차트/지표/하위 스크립트 의존성 추출
+        
+        Returns:
+            {
+                'charts': {cycle_key: 필요 봉 수},       # 예) {'mi3': 121, 'dy': 21}
+                'indicators': {cycle_key: {(메서드, 상수인수), ...}},
+                'scripts': {하위 스크립트명, ...},
+                'dynamic': 상수가 아닌 주기로 차트를 만드는지 여부,
+            }
+        dynamic=True이면 사용 주기를 정적으로 확정할 수 없다.
+        """
+        script_names = set(self.scripts.keys())
+        factories = self.CHART_FACTORIES
+        periods = self.INDICATOR_PERIODS
+
+        def const_value(node):
+            return node.value if isinstance(node, ast.Constant) else None
+
+        def chart_key(call):
+            """CM(code, cycle, tick) 호출에서 cycle_key 추출 (상수가 아니면 None)"""
+            cycle, tick = 'mi', 3
+            if len(call.args) > 1:
+                cycle = const_value(call.args[1])
+            if len(call.args) > 2:
+                tick = const_value(call.args[2])
+            for kw in call.keywords:
+                if kw.arg == 'cycle':
+                    cycle = const_value(kw.value)
+                elif kw.arg == 'tick':
+                    tick = const_value(kw.value)
+            if not isinstance(cycle, str):
+                return None
+            if cycle == 'mi':
+                return f'mi{tick}' if isinstance(tick, int) else None
+            return cycle
+
+        def is_chart_call(node):
+            return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in factories
+
+        def lookback(method, call):
+            """지표 호출에 필요한 봉 수 (알 수 없으면 오프셋만 반영)"""
+            n_index = 0
+            period = 0
+            info = periods.get(method)
+            if info:
+                p_index, period, n_index = info
+                if len(call.args) > p_index:
+                    period = const_value(call.args[p_index])
+            n = const_value(call.args[n_index]) if len(call.args) > n_index else 0
+            for kw in call.keywords:
+                if kw.arg in ('n',):
+                    n = const_value(kw.value)
+            period = period if isinstance(period, int) else 0
+            n = n if isinstance(n, int) and n > 0 else 0
+            return period + n + 1
+
+        deps = {'charts': {}, 'indicators': {}, 'scripts': set(), 'dynamic': False}
+
+        def use_chart(key, need=1):
+            if key is None:
+                deps['dynamic'] = True
+                return
+            deps['charts'][key] = max(deps['charts'].get(key, 0), need)
+            deps['indicators'].setdefault(key, set())
+
+        class DependencyVisitor(ast.NodeVisitor):
+            def __init__(self):
+                self.chart_vars = {}  # {변수명: cycle_key}
+
+            def visit_Assign(self, node):
+                if is_chart_call(node.value):
+                    key = chart_key(node.value)
+                    for target in node.targets:
+                        if isinstance(target, ast.Name):
+                            self.chart_vars[target.id] = key
+                self.generic_visit(node)
+
+            def visit_withitem(self, node):
+                if is_chart_call(node.context_expr) and isinstance(node.optional_vars, ast.Name):
+                    self.chart_vars[node.optional_vars.id] = chart_key(node.context_expr)
+                self.generic_visit(node)
+
+            def visit_Call(self, node):
+                func = node.func
+                if is_chart_call(node):
+                    use_chart(chart_key(node))
+                elif isinstance(func, ast.Attribute):
+                    owner = func.value
+                    key = None
+                    if isinstance(owner, ast.Name) and owner.id in self.chart_vars:
+                        key = self.chart_vars[owner.id]
+                    elif is_chart_call(owner):
+                        key = chart_key(owner)
+                    if key is not None:
+                        args = tuple(const_value(arg) for arg in node.args)
+                        use_chart(key, lookback(func.attr, node))
+                        deps['indicators'][key].add((func.attr, args))
+                elif isinstance(func, ast.Name):
+                    if func.id == 'run_script' and node.args:
+                        name = const_value(node.args[0])
+                        if isinstance(name, str):
+                            deps['scripts'].add(name)
+                    elif func.id in script_names:
+                        deps['scripts'].add(func.id)
+                self.generic_visit(node)
+
+        DependencyVisitor().visit(tree)
+        return deps
+
+    def get_script_dependencies(self, script_name: str, recursive: bool = True) -> dict:
+        """
+        저장된 스크립트의 정적 의존성 반환 (하위 스크립트 포함 병합)
+        
+        Returns:
+            _analyze_dependencies()와 같은 형식, 스크립트가 없으면 None
+        """
+        merged = {'charts': {}, 'indicators': {}, 'scripts': set(), 'dynamic': False}
+        visited = set()
+        pending = [script_name]
+        found = False
+
+        while pending:
+            name = pending.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+
+            script = self.scripts.get(name, {}).get('script', '')
+            if not script:
+                continue
+            found = True
+
+            script_key = f"{name}:{hash(script)}"
+            deps = self._dependency_cache.get(script_key)
+            if deps is None:
+                try:
+                    deps = self._analyze_dependencies(ast.parse(script))
+                except SyntaxError:
+                    continue
+                self._dependency_cache[script_key] = deps
+
+            for key, need in deps['charts'].items():
+                merged['charts'][key] = max(merged['charts'].get(key, 0), need)
+            for key, calls in deps['indicators'].items():
+                merged['indicators'].setdefault(key, set()).update(calls)
+            merged['scripts'].update(deps['scripts'])
+            merged['dynamic'] = merged['dynamic'] or deps['dynamic']
+
+            if recursive:
+                pending.extend(deps['scripts'])
+
+        return merged if found else None
+
+    def prepare_strategy_scripts(self, script_names) -> dict:
+        """
+        전략에 사용되는 스크립트들의 의존 주기를 ChartData에 사전 등록
+        
+        Args:
+            script_names: 적용 중인 매수/매도 스크립트명 리스트
+        
+        Returns:
+            {cycle_key: 필요 봉 수} (분석 가능한 스크립트가 없으면 None)
+        """
+        self._strategy_script_names = list(script_names)
+        requirements = {}
+        analyzed = False
+        for name in script_names:
+            if not name:
+                continue
+            deps = self.get_script_dependencies(name)
+            if deps is None:
+                continue
+            if deps['dynamic']:
+                # 주기를 확정할 수 없으면 전체 주기 유지
+                self.chart_data.register_cycles(None)
+                return None
+            analyzed = True
+            for key, need in deps['charts'].items():
+                requirements[key] = max(requirements.get(key, 0), need)
+
+        if not analyzed:
+            self.chart_data.register_cycles(None)
+            return None
+
+        self.chart_data.register_cycles(requirements)
+        logging.debug(f"전략 스크립트 의존 주기: {requirements}")
+        return requirements
+
+    def _get_code_cache_salt(self) -> bytes:
+        """디스크 캐시 키에 섞을 검증 규칙/인터프리터 지문"""
+        if self._code_cache_salt is None:
+            fingerprint = json.dumps([
+                self.VALIDATOR_VERSION,
+                self.FORBIDDEN_PATTERNS,
+                self.ALLOWED_MODULES,
+                self.ALLOWED_BUILTINS,
+                sys.version,  # marshal 형식은 파이썬 버전마다 다름
+            ], ensure_ascii=False)
+            self._code_cache_salt = fingerprint.encode('utf-8')
+        return self._code_cache_salt
+
+    def _get_code_cache_file(self, script_name: str, script: str):
+        """스크립트 이름+내용+검증 규칙 해시로 캐시 파일 경로 생성"""
+        if not self.cache_path:
+            return None
+        digest = hashlib.sha256(self._get_code_cache_salt())
+        digest.update(script_name.encode('utf-8') + b'\0' + script.encode('utf-8'))
+        return os.path.join(self.cache_path, f"{script_name}-{digest.hexdigest()[:32]}.bin")
+
+    def _load_code_cache(self, script_name: str, script: str):
+        """디스크 캐시에서 검증/컴파일된 코드 객체 로드 (없으면 None)"""
+        cache_file = self._get_code_cache_file(script_name, script)
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                code_obj = marshal.load(f)
+            self._disk_cache_stats['hits'] += 1
+            return code_obj
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"스크립트 디스크 캐시 로드 오류 ({script_name}): {type(e).__name__} - {e}")
+        self._disk_cache_stats['misses'] += 1
+        return None
+
+    def _store_code_cache(self, script_name: str, script: str, code_obj):
+        """검증/컴파일된 코드 객체를 디스크 캐시에 저장"""
+        cache_file = self._get_code_cache_file(script_name, script)
+        if cache_file is None:
+            return
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_file, 'wb') as f:
+                marshal.dump(code_obj, f)
+            os.replace(temp_file, cache_file)  # 다른 프로세스가 읽는 중에도 완전한 파일만 보이도록
+            self._disk_cache_stats['writes'] += 1
+        except Exception as e:
+            logging.warning(f"스크립트 디스크 캐시 저장 오류 ({script_name}): {type(e).__name__} - {e}")
+
+    def _preload_code_cache(self):
+        """시작 시 변경되지 않은 스크립트는 디스크 캐시에서 바로 로드 (검증/컴파일 생략), 현재 스크립트와 맞지 않는 캐시 파일 정리"""
+        if not self.cache_path or not os.path.isdir(self.cache_path):
+            return
+        start_time = time.perf_counter()
+        loaded = 0
+        valid_files = set()
+        for script_name, script_data in self.scripts.items():
+            script = script_data.get('script', '')
+            if not script:
+                continue
+            valid_files.add(os.path.basename(self._get_code_cache_file(script_name, script)))
+            code_obj = self._load_code_cache(script_name, script)
+            if code_obj is not None:
+                self._compiled_script_cache[f"{script_name}:{hash(script)}"] = code_obj
+                loaded += 1
+        self._disk_cache_stats['preload_time'] = time.perf_counter() - start_time
+
+        try:
+            for file_name in os.listdir(self.cache_path):
+                if file_name.endswith('.bin') and file_name not in valid_files:
+                    os.remove(os.path.join(self.cache_path, file_name))
+        except Exception as e:
+            logging.warning(f"스크립트 디스크 캐시 정리 오류: {type(e).__name__} - {e}")
+        logging.info(f"스크립트 디스크 캐시 {loaded}/{len(self.scripts)}개 로드 ({self._disk_cache_stats['preload_time']:.4f}초)")
+
+    def _validate_source(self, script: str):
+        """구문/보안 검증 - 오류 메시지 반환 (통과하면 None)"""
+        try:
+            ast.parse(script)
+        except SyntaxError as e:
+            script_lines = script.splitlines()
+            if e.lineno <= len(script_lines):
+                error_line = script_lines[e.lineno-1].strip()
+                return f"구문 오류 (행 {e.lineno}): {e.msg} → 수정: {error_line}"
+            return f"구문 오류 (행 {e.lineno}): {e.msg}"
+        except Exception as e:
+            return f"스크립트 준비 오류: {type(e).__name__} - {e}"
+
+        if self._has_forbidden_syntax(script):
+            return "보안 위반 코드 포함"
+        return None
+
+    def _get_validated_code(self, script_name: str, script: str):
+        """디스크 캐시 확인 후 없으면 검증/컴파일 - (code_obj, error_msg) 반환"""
+        code_obj = self._load_code_cache(script_name, script)
+        if code_obj is not None:
+            return code_obj, None
+        error_msg = self._validate_source(script)
+        if error_msg:
+            return None, error_msg
+        try:
+            return self._compile_script(script_name, script), None
+        except Exception as e:
+            return None, f"스크립트 컴파일 오류: {type(e).__name__} - {e}"
+
+    def _eliminate_common_calls(self, tree, script_name: str = None) -> int:
+        """
+        user_script 본문에서 같은 인수로 2회 이상 나오는 ChartManager 순수 호출을 실행당 1회 계산으로 변경
+
+        m3.c() → (_cse_1 if _cse_1 is not _cse_unset else (_cse_1 := m3.c()))
+        - 인수는 상수이거나 스크립트에서 값이 바뀌지 않는 이름만 허용
+        - 대상 차트 변수는 최상위 문장에서 CM(...)으로 한 번만 할당된 이름 (할당 이후 문장에서만 적용)
+        - 중첩 함수/lambda/컴프리헨션 내부는 변수 범위가 달라 적용하지 않음
+        Returns: 제거된 호출 수 (정적 기준: 등장 횟수 - 공통식 수)
+        """
+        func = next((node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef) and node.name == 'user_script'), None)
+        if func is None:
+            return 0
+        user_start = 2  # _make_wrapped_script의 kwargs 설정 2문장 다음부터 사용자 스크립트
+
+        # 스크립트 안에서 값이 바뀔 수 있는 이름 수집
+        assigned = {}
+        def mark(name, count=1):
+            assigned[name] = assigned.get(name, 0) + count
+        for node in (node for stmt in func.body[user_start:] for node in ast.walk(stmt)):
+            if isinstance(node, ast.Name):
+                if isinstance(node.ctx, (ast.Store, ast.Del)):
+                    mark(node.id)
+                elif node.id in ('globals', 'vars', 'locals', 'setattr'):
+                    return 0  # 이름 공간/객체를 직접 조작하면 적용하지 않음
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                for name in node.names:
+                    mark(name, 2)
+            elif isinstance(node, ast.arg):
+                mark(node.arg)
+            elif isinstance(node, ast.ExceptHandler) and node.name:
+                mark(node.name)
+            elif type(node).__name__ in ('MatchAs', 'MatchStar') and node.name:  # match 문 (3.10+)
+                mark(node.name)
+            elif type(node).__name__ == 'MatchMapping' and node.rest:
+                mark(node.rest)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    mark((alias.asname or alias.name).split('.')[0])
+
+        factories = {name for name in self.CHART_FACTORIES if name not in assigned}
+
+        def is_stable_arg(node):
+            if isinstance(node, ast.Constant):
+                return True
+            if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+                return isinstance(node.operand, ast.Constant)
+            return isinstance(node, ast.Name) and node.id not in assigned
+
+        def is_chart_call(node):
+            return (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in factories
+                    and all(is_stable_arg(arg) for arg in node.args)
+                    and all(kw.arg is not None and is_stable_arg(kw.value) for kw in node.keywords))
+
+        # 최상위 문장에서 한 번만 할당된 차트 변수 {이름: 사용 가능 시작 문장 인덱스}
+        chart_vars = {}
+        for index, stmt in enumerate(func.body[user_start:], user_start):
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+                name = stmt.targets[0].id
+                if assigned.get(name) == 1 and is_chart_call(stmt.value):
+                    chart_vars[name] = index + 1
+            elif isinstance(stmt, ast.With):
+                for item in stmt.items:
+                    if isinstance(item.optional_vars, ast.Name) and assigned.get(item.optional_vars.id) == 1 and is_chart_call(item.context_expr):
+                        chart_vars[item.optional_vars.id] = index
+
+        def candidate_key(node, index):
+            """공통식 대상이면 ast.dump 키 반환"""
+            if is_chart_call(node):
+                return ast.dump(node)
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in self.PURE_CHART_METHODS):
+                return None
+            if not (all(is_stable_arg(arg) for arg in node.args) and all(kw.arg is not None and is_stable_arg(kw.value) for kw in node.keywords)):
+                return None
+            receiver = node.func.value
+            if isinstance(receiver, ast.Name):
+                if receiver.id not in chart_vars or index < chart_vars[receiver.id]:
+                    return None
+            elif not is_chart_call(receiver):
+                return None
+            return ast.dump(node)
+
+        scope_nodes = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef,
+                       ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+        # 1차: 등장 횟수 집계
+        counts = {}
+        def count(node, index):
+            if isinstance(node, scope_nodes):
+                return
+            key = candidate_key(node, index)
+            if key is not None:
+                counts[key] = counts.get(key, 0) + 1
+            for child in ast.iter_child_nodes(node):
+                count(child, index)
+        for index, stmt in enumerate(func.body[user_start:], user_start):
+            count(stmt, index)
+
+        slots = {}
+        for key, n in counts.items():
+            if n >= 2:
+                slots[key] = f"_cse_{len(slots) + 1}"
+        if not slots:
+            return 0
+
+        # 2차: 공통식을 지연 계산 슬롯으로 치환
+        def replace(node, index):
+            if isinstance(node, scope_nodes):
+                return node
+            key = candidate_key(node, index)
+            for field, value in ast.iter_fields(node):
+                if isinstance(value, list):
+                    setattr(node, field, [replace(item, index) if isinstance(item, ast.AST) else item for item in value])
+                elif isinstance(value, ast.AST):
+                    setattr(node, field, replace(value, index))
+            if key not in slots:
+                return node
+            slot = slots[key]
+            lazy = ast.IfExp(
+                test=ast.Compare(left=ast.Name(id=slot, ctx=ast.Load()), ops=[ast.IsNot()],
+                                 comparators=[ast.Name(id='_cse_unset', ctx=ast.Load())]),
+                body=ast.Name(id=slot, ctx=ast.Load()),
+                orelse=ast.NamedExpr(target=ast.Name(id=slot, ctx=ast.Store()), value=node))
+            return ast.copy_location(lazy, node)
+        func.body[user_start:] = [replace(stmt, index) for index, stmt in enumerate(func.body[user_start:], user_start)]
+
+        # 슬롯 초기화를 함수 시작에 추가
+        inits = [ast.Assign(targets=[ast.Name(id=slot, ctx=ast.Store())], value=ast.Name(id='_cse_unset', ctx=ast.Load()), lineno=func.lineno)
+                 for slot in slots.values()]
+        func.body[:0] = inits
+
+        removed = sum(counts[key] for key in slots) - len(slots)
+        if script_name is not None:
+            self._cse_stats[script_name] = {'expressions': len(slots), 'removed_calls': removed}
+        return removed
+
+    def _build_code(self, script_name: str, script: str, cse: bool = None):
+        """스크립트 래퍼 생성 후 공통 호출 제거, 반복문 실행 한도 검사를 넣어 컴파일"""
+        if cse is None:
+            cse = self.CSE_ENABLED
+        wrapped_script = self._make_wrapped_script(script)
+        tree = ast.parse(wrapped_script, f"<{script_name}>")
+        if cse:
+            self._eliminate_common_calls(tree, script_name)
+
+        class LoopGuardTransformer(ast.NodeTransformer):
+            """for 문/컴프리헨션의 반복 대상을 _loop_guard(...)로 감싸기 (라인 번호 유지)"""
+            def _guard(self, node):
+                call = ast.Call(func=ast.Name(id='_loop_guard', ctx=ast.Load()), args=[node], keywords=[])
+                return ast.copy_location(call, node)
+
+            def visit_For(self, node):
+                self.generic_visit(node)
+                node.iter = self._guard(node.iter)
+                return node
+
+            def visit_comprehension(self, node):
+                self.generic_visit(node)
+                node.iter = self._guard(node.iter)
+                return node
+
+        tree = ast.fix_missing_locations(LoopGuardTransformer().visit(tree))
+        return compile(tree, f"<{script_name}>", 'exec')
+
+    def _compile_script(self, script_name: str, script: str):
+        """검증된 스크립트를 컴파일하고 디스크 캐시에 저장"""
+        code_obj = self._build_code(script_name, script)
+        self._store_code_cache(script_name, script, code_obj)
+        return code_obj
+
+    def _begin_budget(self, script_name: str, scripts: dict = None) -> bool:
+        """최상위 실행이면 실행 한도 설정 및 스크립트 세대 고정 후 True 반환 (하위 스크립트는 상위 한도/세대 공유)"""
+        if getattr(self._thread_local, 'budget', None) is not None:
+            return False
+        self._thread_local.budget = {
+            'name': script_name,
+            'scripts': scripts if scripts is not None else self.scripts,
+            'deadline': time.perf_counter() + self.SCRIPT_TIME_BUDGET,
+            'ops': 0,
+            'next_check': self.BUDGET_CHECK_INTERVAL,
+            'exceeded': None,  # 초과 사유 - 스크립트가 예외를 잡아 삼켜도 실행 후 중단 처리
+        }
+        return True
+
+    def _end_budget(self):
+        self._thread_local.budget = None
+
+    def _raise_if_budget_exceeded(self):
+        """실행 중 한도를 넘었으면 중단 예외 (bare except / except BaseException으로 잡고 계속 실행한 경우)"""
+        budget = getattr(self._thread_local, 'budget', None)
+        if budget is not None and budget['exceeded']:
+            raise ScriptBudgetExceeded(budget['exceeded'])
+
+    def _loop_guard(self, iterable):
+        """반복문 실행 한도 검사 (반복 횟수 매번, 시간은 BUDGET_CHECK_INTERVAL 마다)"""
+        budget = getattr(self._thread_local, 'budget', None)
+        if budget is None:
+            yield from iterable
+            return
+        op_limit = self.SCRIPT_OP_BUDGET
+        for item in iterable:
+            budget['ops'] += 1
+            if budget['ops'] >= budget['next_check']:
+                if budget['ops'] > op_limit:
+                    budget['exceeded'] = f"반복 횟수 {op_limit:,}회 초과"
+                elif time.perf_counter() > budget['deadline']:
+                    budget['exceeded'] = f"실행 시간 {self.SCRIPT_TIME_BUDGET}초 초과"
+                if budget['exceeded']:
+                    raise ScriptBudgetExceeded(budget['exceeded'])
+                budget['next_check'] += self.BUDGET_CHECK_INTERVAL
+            yield item
+
+    def _record_budget_violation(self, script_name: str, reason: str):
+        """실행 한도 초과 기록, 기준 시간 내 QUARANTINE_LIMIT회 이상이면 격리"""
+        now = time.time()
+        with self._budget_lock:
+            history = self._budget_violations.setdefault(script_name, deque())
+            history.append(now)
+            while history and now - history[0] > self.QUARANTINE_WINDOW:
+                history.popleft()
+            if len(history) >= self.QUARANTINE_LIMIT and script_name not in self._quarantined:
+                self._quarantined[script_name] = f"{self.QUARANTINE_WINDOW}초 내 실행 한도 초과 {len(history)}회 ({reason})"
+                logging.error(f"스크립트 격리: {script_name} - {self._quarantined[script_name]}")
+
+    def release_quarantine(self, script_name: str = None):
+        """격리 해제 (None이면 전체)"""
+        with self._budget_lock:
+            if script_name is None:
+                self._quarantined.clear()
+                self._budget_violations.clear()
+            else:
+                self._quarantined.pop(script_name, None)
+                self._budget_violations.pop(script_name, None)
+
+    def get_quarantine_status(self) -> dict:
+        """격리된 스크립트와 사유 반환"""
+        with self._budget_lock:
+            return dict(self._quarantined)
+
     def _validate_and_execute_script(self, script_name: str, script: str, kwargs: dict, check_only: bool = False) -> dict:
         """스크립트 검증 및 실행을 통합한 메서드"""
         start_time = time.time()
@@ -3303,26 +4111,14 @@ class ScriptManager:
             result_dict['error'] = f"유효하지 않은 스크립트 이름: {script_name}"
             return result_dict
         
-        # 2. 구문 검증
-        try:
-            ast.parse(script)
-        except SyntaxError as e:
-            script_lines = script.splitlines()
-            if e.lineno <= len(script_lines):
-                error_line = script_lines[e.lineno-1].strip()
-                error_msg = f"구문 오류 (행 {e.lineno}): {e.msg} → 수정: {error_line}"
-            else:
-                error_msg = f"구문 오류 (행 {e.lineno}): {e.msg}"
-            result_dict['error'] = error_msg
-            return result_dict
-        except Exception as e:
-            result_dict['error'] = f"스크립트 준비 오류: {type(e).__name__} - {e}"
-            return result_dict
-        
-        # 3. 보안 검증
-        if self._has_forbidden_syntax(script):
-            result_dict['error'] = "보안 위반 코드 포함"
-            return result_dict
+        # 2~3. 구문/보안 검증 (디스크 캐시에 같은 내용/규칙으로 검증된 코드가 있으면 생략)
+        script_key = f"{script_name}:{hash(script)}"
+        if script_key not in self._compiled_script_cache:
+            code_obj, error_msg = self._get_validated_code(script_name, script)
+            if error_msg:
+                result_dict['error'] = error_msg
+                return result_dict
+            self._compiled_script_cache[script_key] = code_obj
         
         # 4. 실행을 통한 런타임 검증
         code = kwargs.get('code')
@@ -3346,22 +4142,14 @@ class ScriptManager:
         
         # 현재 컨텍스트 설정
         self._set_current_context(kwargs)
+        budget_owner = self._begin_budget(script_name)
+        script_logs = []
         
         try:
             # 실행 환경 준비
             globals_dict, script_logs = self._prepare_execution_globals(script_name)
             locals_dict = {}
             
-            # 스크립트 컴파일 캐싱 - 스크립트 내용만으로 키 생성
-            script_key = f"{script_name}:{hash(script)}"
-            
-            if script_key not in self._compiled_script_cache:
-                logging.debug(f"🔄 {script_name} 컴파일 중... (첫 실행)")
-                # 스크립트 내용만으로 래퍼 생성 (kwargs 제외)
-                wrapped_script = self._make_wrapped_script(script)
-                code_obj = compile(wrapped_script, f"<{script_name}>", 'exec')
-                self._compiled_script_cache[script_key] = code_obj
-            
             # 캐시된 코드 사용, kwargs는 실행 시점에 전달
             code_obj = self._compiled_script_cache[script_key]
             
@@ -3380,6 +4168,8 @@ class ScriptManager:
                     script_result = globals_dict.get('_script_result')
                 else:
                     raise e
+            if budget_owner:
+                self._raise_if_budget_exceeded()
             
             exec_time = time.time() - start_time
             
@@ -3394,6 +4184,15 @@ class ScriptManager:
             
             return result_dict
             
+        except ScriptBudgetExceeded as e:
+            if not budget_owner:
+                raise
+            error_msg = f"실행 한도 초과로 중단 ({script_name}): {e}"
+            script_logs.append(f"ERROR: {error_msg}")
+            result_dict['error'] = error_msg
+            result_dict['logs'] = script_logs
+            return result_dict
+            
         except Exception as e:
             tb = traceback.format_exc()
             
@@ -3413,6 +4212,8 @@ class ScriptManager:
             return result_dict
             
         finally:
+            if budget_owner:
+                self._end_budget()
             # 실행 완료 후 추적 목록에서 제거 (check_only=True일 때는 건너뛰기)
             if not check_only:
                 # 호출 스택에서 제거
@@ -3423,13 +4224,18 @@ class ScriptManager:
         if kwargs is None:
             kwargs = {}
         
-        # 스크립트 내용 가져오기
-        script_data = self.get_script(script_name)
+        # 스크립트 내용 가져오기 (실행 세대 고정)
+        scripts = self._get_scripts()
+        script_data = scripts.get(script_name, {})
         script_contents = script_data.get('script', '')
         
         if not script_contents:
             return {'result': None, 'error': f"스크립트 없음: {script_name}", 'logs': []}
         
+        # 격리된 스크립트는 실행하지 않음
+        if script_name in self._quarantined:
+            return {'result': None, 'error': f"격리된 스크립트: {script_name} - {self._quarantined[script_name]}", 'logs': [], 'aborted': True}
+        
         start_time = time.time()
         script_key = f"{script_name}:{hash(script_contents)}"
         
@@ -3445,13 +4251,14 @@ class ScriptManager:
                 current_stack = self._get_call_stack_info()
                 return {'result': None, 'error': f"순환 참조 감지: {script_name} → {current_stack}", 'logs': []}
             
+            # 디스크 캐시 확인 후 없으면 검증, 컴파일, 캐싱
+            code_obj, error_msg = self._get_validated_code(script_name, script_contents)
+            if error_msg:
+                return {'result': None, 'error': error_msg, 'logs': []}
+            self._compiled_script_cache[script_key] = code_obj
+            
             self._add_to_call_stack(script_name, code)
             need_cleanup = True
-            
-            # 컴파일 후 캐싱
-            wrapped_script = self._make_wrapped_script(script_contents)
-            code_obj = compile(wrapped_script, f"<{script_name}>", 'exec')
-            self._compiled_script_cache[script_key] = code_obj
         else:
             # 캐시 있음 - 바로 실행
             code_obj = self._compiled_script_cache[script_key]
@@ -3459,6 +4266,8 @@ class ScriptManager:
             #logging.debug(f"⚡ {script_name} 캐시 사용 - 즉시 실행")
         
         # 공통 실행 로직
+        budget_owner = self._begin_budget(script_name, scripts)
+        script_logs = []
         try:
             self._set_current_context(kwargs)
             globals_dict, script_logs = self._prepare_execution_globals(script_name)
@@ -3475,6 +4284,8 @@ class ScriptManager:
                     script_result = globals_dict.get('_script_result')
                 else:
                     raise e
+            if budget_owner:
+                self._raise_if_budget_exceeded()
             
             # 실행 시간 체크
             exec_time = time.time() - start_time
@@ -3482,9 +4293,27 @@ class ScriptManager:
                 code = kwargs.get('code', 'UNKNOWN')
                 warning_msg = f"스크립트 실행 기준(0.01초) ({script_name}:{code}): {exec_time:.4f}초"
                 script_logs.append(f'WARNING: {warning_msg}')
+            # 반복문 밖에서 한도를 넘긴 경우 결과는 사용하되 초과 횟수에 포함
+            if budget_owner and exec_time > self.SCRIPT_TIME_BUDGET:
+                self._record_budget_violation(script_name, f"실행 시간 {exec_time:.4f}초")
+            
+            # 시작 후 첫 평가 완료까지 걸린 시간 (디스크 캐시 효과 측정)
+            if self._disk_cache_stats['first_eval_time'] is None:
+                self._disk_cache_stats['first_eval_time'] = time.perf_counter() - self._init_started
+                logging.info(f"첫 스크립트 평가 완료 ({script_name}): 시작 후 {self._disk_cache_stats['first_eval_time']:.4f}초")
             
             return {'result': script_result, 'error': None, 'logs': script_logs}
             
+        except ScriptBudgetExceeded as e:
+            if not budget_owner:
+                raise  # 하위 스크립트는 최상위 실행까지 전파해서 전체 중단
+            code = kwargs.get('code', 'UNKNOWN')
+            error_msg = f"실행 한도 초과로 중단 ({script_name}:{code}): {e}"
+            script_logs.append(f"ERROR: {error_msg}")
+            logging.warning(error_msg)
+            self._record_budget_violation(script_name, str(e))
+            return {'result': None, 'error': error_msg, 'logs': script_logs, 'aborted': True}
+            
         except Exception as e:
             tb = traceback.format_exc()
             detailed_error = self._get_script_error_location(tb, script_contents)
@@ -3493,18 +4322,130 @@ class ScriptManager:
             return {'result': None, 'error': detailed_error, 'logs': script_logs}
             
         finally:
+            if budget_owner:
+                self._end_budget()
             if need_cleanup:
                 self._remove_from_call_stack(script_name, kwargs.get('code', ''))
 
+    def run_script_many(self, script_name, kwargs_list):
+        """
+        같은 스크립트를 여러 종목에 일괄 실행 (실행 환경 준비는 1회)
+
+        Args:
+            script_name: 실행할 스크립트 이름
+            kwargs_list: 종목별 kwargs 리스트 [{'code': ..., ...}, ...]
+
+        Returns:
+            list: kwargs_list 순서대로 run_script()와 같은 형식의 결과 dict
+        """
+        scripts = self._get_scripts()
+        script_data = scripts.get(script_name, {})
+        script_contents = script_data.get('script', '')
+
+        if not script_contents:
+            return [{'result': None, 'error': f"스크립트 없음: {script_name}", 'logs': []} for _ in kwargs_list]
+
+        if script_name in self._quarantined:
+            error_msg = f"격리된 스크립트: {script_name} - {self._quarantined[script_name]}"
+            return [{'result': None, 'error': error_msg, 'logs': [], 'aborted': True} for _ in kwargs_list]
+
+        script_key = f"{script_name}:{hash(script_contents)}"
+        code_obj = self._compiled_script_cache.get(script_key)
+        if code_obj is None:
+            code_obj, error_msg = self._get_validated_code(script_name, script_contents)
+            if error_msg:
+                return [{'result': None, 'error': error_msg, 'logs': []} for _ in kwargs_list]
+            self._compiled_script_cache[script_key] = code_obj
+
+        # 실행 환경 1회 준비 - 같은 (종목, 주기, 틱) 차트는 배치 내에서 ChartManager 인스턴스 공유
+        globals_dict, script_logs = self._prepare_execution_globals(script_name)
+        chart_managers = {}
+        def shared_chart_manager(code, cycle='mi', tick=3):
+            key = (code, cycle, tick)
+            cm = chart_managers.get(key)
+            if cm is None:
+                cm = chart_managers[key] = ChartManager(code, cycle, tick)
+            return cm
+        globals_dict['ChartManager'] = shared_chart_manager
+        globals_dict['CM'] = shared_chart_manager
+        base_globals = dict(globals_dict)
+
+        results = []
+        for kwargs in kwargs_list:
+            code = kwargs.get('code')
+            if code is None:
+                results.append({'result': None, 'error': "종목코드가 지정되지 않았습니다.", 'logs': []})
+                continue
+
+            # 이전 종목 실행으로 추가/변경된 글로벌 복구 (kwargs 값, _script_result 등)
+            if len(globals_dict) != len(base_globals):
+                for key in [key for key in globals_dict if key not in base_globals]:
+                    del globals_dict[key]
+            globals_dict.update(base_globals)
+            globals_dict['kwargs'] = kwargs
+            globals_dict['_current_kwargs'] = kwargs
+            script_logs.clear()
+
+            start_time = time.time()
+            self._set_current_context(kwargs)
+            self._add_to_call_stack(script_name, code)
+            budget_owner = self._begin_budget(script_name, scripts)
+            try:
+                script_result = None
+                try:
+                    exec(code_obj, globals_dict, {})
+                    script_result = globals_dict.get('_script_result')
+                except SystemExit as e:
+                    if str(e) == 'script_return':
+                        script_result = globals_dict.get('_script_result')
+                    else:
+                        raise e
+                if budget_owner:
+                    self._raise_if_budget_exceeded()
+
+                exec_time = time.time() - start_time
+                if exec_time > 0.01:
+                    warning_msg = f"스크립트 실행 기준(0.01초) ({script_name}:{code}): {exec_time:.4f}초"
+                    script_logs.append(f'WARNING: {warning_msg}')
+                if budget_owner and exec_time > self.SCRIPT_TIME_BUDGET:
+                    self._record_budget_violation(script_name, f"실행 시간 {exec_time:.4f}초")
+
+                results.append({'result': script_result, 'error': None, 'logs': list(script_logs)})
+
+            except ScriptBudgetExceeded as e:
+                if not budget_owner:
+                    raise
+                error_msg = f"실행 한도 초과로 중단 ({script_name}:{code}): {e}"
+                script_logs.append(f"ERROR: {error_msg}")
+                logging.warning(error_msg)
+                self._record_budget_violation(script_name, str(e))
+                results.append({'result': None, 'error': error_msg, 'logs': list(script_logs), 'aborted': True})
+
+            except Exception as e:
+                tb = traceback.format_exc()
+                detailed_error = self._get_script_error_location(tb, script_contents)
+                script_logs.append(f"ERROR: {detailed_error}")
+                logging.error(f"{script_name} 스크립트 오류: {type(e).__name__} - {e}")
+                results.append({'result': None, 'error': detailed_error, 'logs': list(script_logs)})
+
+            finally:
+                if budget_owner:
+                    self._end_budget()
+                self._remove_from_call_stack(script_name, code)
+
+            # 실행 중 격리되면 나머지 종목은 실행하지 않음
+            if script_name in self._quarantined:
+                error_msg = f"격리된 스크립트: {script_name} - {self._quarantined[script_name]}"
+                results.extend({'result': None, 'error': error_msg, 'logs': [], 'aborted': True} for _ in kwargs_list[len(results):])
+                break
+
+        return results
+
     def set_script(self, script_name: str, script: str, desc: str = '', kwargs: dict = None, save: bool = True):
         """스크립트 검사 및 저장"""
         if kwargs is None:
             kwargs = {}
         
-        # 🚀 스크립트 변경 시 캐시 무효화 (강화)
-        self._invalidate_script_cache(script_name)
-        logging.debug(f"🔄 {script_name} 스크립트 업데이트 - 캐시 무효화 완료")
-        
         # 결과 초기화
         result_dict = {
             'result': None,
@@ -3512,7 +4453,7 @@ class ScriptManager:
             'logs': [],
         }
         
-        # 검사 실행 (check_only=True로 런타임 에러까지 검증)
+        # 검사 실행 (check_only=True로 런타임 에러까지 검증, 실행 중인 세대에는 영향 없음)
         check_result = self._validate_and_execute_script(script_name, script, kwargs, check_only=True)
         
         # 결과 복사
@@ -3532,24 +4473,8 @@ class ScriptManager:
             'desc': desc
         }
         
-        self.scripts[script_name] = script_data
-        
-        # 🚀 저장 시 즉시 컴파일하여 캐시에 저장 (실행 최적화)
-        script_key = f"{script_name}:{hash(script)}"
-        wrapped_script = self._make_wrapped_script(script)
-        code_obj = compile(wrapped_script, f"<{script_name}>", 'exec')
-        self._compiled_script_cache[script_key] = code_obj
-        
-        # 🚀 스크립트 래퍼도 즉시 생성하여 캐시에 저장
-        wrapper_code = f"""
-def {script_name}(*args, **kwargs):
-    return run_script('{script_name}', args, kwargs)
-"""
-        try:
-            compiled_wrapper = compile(wrapper_code, f"<wrapper_{script_name}>", 'exec')
-            self._script_wrapper_cache[script_name] = compiled_wrapper
-        except Exception as e:
-            logging.error(f"스크립트 래퍼 생성 오류 ({script_name}): {e}")
+        # 🚀 새 세대로 컴파일/래퍼 준비 후 원자적 교체 (검사 단계에서 컴파일된 코드 재사용, 평가 중 컴파일 없음)
+        self.publish_scripts({script_name: script_data})
         
         # 파일 저장
         save_result = self._save_scripts()
@@ -3642,7 +4567,7 @@ def {script_name}(*args, **kwargs):
     def _safe_loop(self, iterable, func):
         """안전한 루프 실행 함수"""
         results = []
-        for item in iterable:
+        for item in self._loop_guard(iterable):
             results.append(func(item))
         return results
 
@@ -3696,24 +4621,34 @@ def {script_name}(*args, **kwargs):
         
         return " → ".join(stack_info)
 
-    def _invalidate_script_cache(self, script_name: str):
-        """스크립트 변경 시 캐시 무효화"""
-        # 컴파일된 스크립트 캐시에서 해당 스크립트 제거
-        keys_to_remove = [key for key in self._compiled_script_cache.keys() if key.startswith(f"{script_name}:")]
+    def _invalidate_script_cache(self, script_name: str, keep: str = None):
+        """스크립트 변경 시 캐시 무효화 (keep: 유지할 새 세대 스크립트 내용)"""
+        keep_key = f"{script_name}:{hash(keep)}" if keep is not None else None
+
+        # 컴파일된 스크립트 캐시에서 해당 스크립트 제거 (다른 스레드가 추가 중일 수 있어 키 목록 복사 후 처리)
+        keys_to_remove = [key for key in list(self._compiled_script_cache) if key.startswith(f"{script_name}:") and key != keep_key]
         for key in keys_to_remove:
-            del self._compiled_script_cache[key]
+            self._compiled_script_cache.pop(key, None)
             #logging.debug(f"🗑️ 캐시 제거: {key}")
         
-        # 스크립트 래퍼 캐시에서도 제거
-        if script_name in self._script_wrapper_cache:
-            del self._script_wrapper_cache[script_name]
+        # 스크립트 래퍼 캐시에서도 제거 (스크립트가 남아 있으면 래퍼는 그대로 사용)
+        if keep is None:
+            self._script_wrapper_cache.pop(script_name, None)
             #logging.debug(f"🗑️ 래퍼 캐시 제거: {script_name}")
         
+        # 의존성 분석 캐시에서도 제거
+        keys_to_remove = [key for key in list(self._dependency_cache) if key.startswith(f"{script_name}:") and key != keep_key]
+        for key in keys_to_remove:
+            self._dependency_cache.pop(key, None)
+        
         # 스크립트 결과 캐시에서도 제거
         if script_name in self._script_result_cache:
             del self._script_result_cache[script_name]
             #logging.debug(f"🗑️ 결과 캐시 제거: {script_name}")
         
+        # 스크립트가 수정되면 격리 해제
+        self.release_quarantine(script_name)
+        
         #logging.debug(f"🗑️ {script_name} 캐시 무효화 완료")
     
     def get_cache_status(self):
@@ -3722,7 +4657,10 @@ def {script_name}(*args, **kwargs):
             'module_cache': len(self._module_cache),
             'script_wrapper_cache': len(self._script_wrapper_cache),
             'compiled_script_cache': len(self._compiled_script_cache),
-            'total_scripts': len(self.scripts)
+            'total_scripts': len(self.scripts),
+            'generation': self._generation,
+            'disk_cache': dict(self._disk_cache_stats),
+            'cse': dict(self._cse_stats),
         }
     
     def clear_all_caches(self):
@@ -3732,6 +4670,18 @@ def {script_name}(*args, **kwargs):
         self._compiled_script_cache.clear()
         logging.debug("🧹 모든 캐시 초기화 완료")
 
+    def _compile_wrapper(self, script_name):
+        """다른 스크립트에서 이름으로 호출하기 위한 래퍼 함수 컴파일"""
+        wrapper_code = f"""
+def {script_name}(*args, **kwargs):
+    return run_script('{script_name}', args, kwargs)
+"""
+        try:
+            return compile(wrapper_code, f"<wrapper_{script_name}>", 'exec')
+        except Exception as e:
+            logging.error(f"스크립트 래퍼 생성 오류 ({script_name}): {e}")
+            return None
+
     def _prepare_execution_globals(self, current_script_name):
         """실행 환경의 글로벌 변수 준비"""
         try:
@@ -3862,6 +4812,8 @@ def {script_name}(*args, **kwargs):
                 'ChartManager': ChartManager,
                 'CM': ChartManager,
                 'loop': self._safe_loop,
+                '_loop_guard': self._loop_guard,
+                '_cse_unset': _CSE_UNSET,
                 'div': safe_div,
                 'percent': percent,
                 'bar_idx': bar_idx,
@@ -3884,21 +4836,18 @@ def {script_name}(*args, **kwargs):
             script_return.caller_globals = globals_dict
             
             # 누락된 스크립트 래퍼 자동 생성
-            for script_name, script_data in self.scripts.items():
+            scripts = self._get_scripts()
+            for script_name in scripts:
                 if script_name not in self._script_wrapper_cache:
-                    wrapper_code = f"""
-def {script_name}(*args, **kwargs):
-    return run_script('{script_name}', args, kwargs)
-"""
-                    try:
-                        compiled_wrapper = compile(wrapper_code, f"<wrapper_{script_name}>", 'exec')
+                    compiled_wrapper = self._compile_wrapper(script_name)
+                    if compiled_wrapper is not None:
                         self._script_wrapper_cache[script_name] = compiled_wrapper
-                    except Exception as e:
-                        logging.error(f"스크립트 래퍼 생성 오류 ({script_name}): {e}")
             
-            # ✅ 캐시된 래퍼 실행
-            for script_name, compiled_wrapper in self._script_wrapper_cache.items():
-                exec(compiled_wrapper, globals_dict, globals_dict)
+            # ✅ 캐시된 래퍼 실행 (실행 세대의 스크립트만)
+            for script_name in scripts:
+                compiled_wrapper = self._script_wrapper_cache.get(script_name)
+                if compiled_wrapper is not None:
+                    exec(compiled_wrapper, globals_dict, globals_dict)
             
             return globals_dict, script_logs
             
@@ -4006,6 +4955,149 @@ def execute_script():
 result = execute_script()
 """
 
+# 평가 풀 워커 프로세스 전역 (워커 프로세스마다 1개)
+_pool_scm = None
+
+def _eval_pool_init(script_file):
+    """평가 풀 워커 초기화 - 워커 전용 ScriptManager 생성"""
+    global _pool_scm
+    _pool_scm = ScriptManager(script_file)
+
+def _eval_pool_run(script_name, kwargs, scripts, snapshot, trade_state):
+    """평가 풀 워커에서 스크립트 실행 (차트 복제본 갱신 후 실행)"""
+    code = kwargs.get('code')
+    if scripts:
+        _pool_scm.publish_scripts({name: {'script': source, 'desc': ''} for name, source in scripts.items()})
+
+    if snapshot and snapshot['cycles']:
+        _pool_scm.chart_data.apply_snapshot(code, snapshot)
+
+    _pool_scm.clear_trade_state(code)
+    for state_type, data in trade_state.items():
+        _pool_scm.set_trade_state(code, state_type, data)
+
+    start_time = time.perf_counter()
+    result = _pool_scm.run_script(script_name, kwargs)
+    result['eval_time'] = time.perf_counter() - start_time
+
+    # 스크립트가 바꾼 매매 상태는 메인 프로세스로 돌려보냄
+    prefix = f'{code}_trade_'
+    result['trade_state'] = {k[len(prefix):]: v for k, v in _pool_scm._script_result_cache.items() if k.startswith(prefix)}
+    return result
+
+class ScriptEvalPool:
+    """
+    스크립트 평가 프로세스 풀 (선택 사항, GIL 회피)
+    
+    - 워커 프로세스마다 ScriptManager와 필요한 차트의 읽기 전용 복제본을 유지
+    - 종목코드별로 워커를 고정(affinity)하여 복제본은 마지막 전송 이후 바뀐 봉만 증분 전송
+    - 스크립트 원본도 워커별로 바뀐 것만 전송
+    - run_script()는 ScriptManager.run_script()와 같은 결과 dict를 반환하며,
+      워커 오류/타임아웃 시 메인 프로세스에서 그대로 실행(fallback)
+    """
+    def __init__(self, scm, workers=2, timeout=5):
+        from concurrent.futures import ProcessPoolExecutor
+        self.scm = scm
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, initializer=_eval_pool_init, initargs=(scm.script_file,))
+            for _ in range(self.workers)
+        ]
+        self._locks = [threading.Lock() for _ in range(self.workers)]
+        self._sent_heads = [{} for _ in range(self.workers)]    # {code: {cycle_key: 체결시간}}
+        self._sent_scripts = [{} for _ in range(self.workers)]  # {script_name: source}
+
+        self._stats_lock = threading.Lock()
+        self._stats = {'count': 0, 'fallbacks': 0, 'total_time': 0.0, 'eval_time': 0.0, 'max_time': 0.0, 'rows_sent': 0}
+        logging.info(f'ScriptEvalPool 시작: workers={self.workers}')
+
+    def _worker_index(self, code):
+        return zlib.crc32(str(code).encode()) % self.workers
+
+    def run_script(self, script_name, kwargs=None):
+        """워커 프로세스에서 스크립트 실행 (ScriptManager.run_script와 동일한 반환 형식)"""
+        if kwargs is None:
+            kwargs = {}
+        code = kwargs.get('code')
+        if code is None or not self.scm.get_script(script_name):
+            return self.scm.run_script(script_name, kwargs)
+
+        start_time = time.perf_counter()
+        idx = self._worker_index(code)
+
+        deps = self.scm.get_script_dependencies(script_name)
+        cycle_keys = None if deps is None or deps['dynamic'] else list(deps['charts'].keys())
+        names = {script_name} | (deps['scripts'] if deps else set())
+
+        prefix = f'{code}_trade_'
+        trade_state = {k[len(prefix):]: v for k, v in list(self.scm._script_result_cache.items()) if k.startswith(prefix)}
+
+        # 워커별 전송 상태 갱신과 제출 순서를 묶어서 보장 (증분 순서 유지)
+        with self._locks[idx]:
+            sent_scripts = self._sent_scripts[idx]
+            scripts = {}
+            for name in names:
+                source = self.scm.get_script(name).get('script', '')
+                if source and sent_scripts.get(name) != source:
+                    scripts[name] = source
+                    sent_scripts[name] = source
+
+            heads = self._sent_heads[idx].get(code)
+            snapshot = self.scm.chart_data.export_snapshot(code, cycle_keys, since=heads)
+            new_heads = dict(heads or {})
+            new_heads.update({key: head for key, head in snapshot['head'].items() if head})
+            self._sent_heads[idx][code] = new_heads
+
+            future = self._executors[idx].submit(_eval_pool_run, script_name, kwargs, scripts, snapshot, trade_state)
+
+        try:
+            result = future.result(timeout=self.timeout)
+        except Exception as e:
+            logging.error(f'ScriptEvalPool 실행 오류 ({script_name}:{code}) - 로컬 실행으로 대체: {type(e).__name__} - {e}')
+            with self._locks[idx]:
+                self._sent_heads[idx].pop(code, None)
+                self._sent_scripts[idx].clear()
+            with self._stats_lock:
+                self._stats['fallbacks'] += 1
+            return self.scm.run_script(script_name, kwargs)
+
+        # 워커에서 바뀐 매매 상태만 반영
+        new_state = result.pop('trade_state', {})
+        for state_type, data in new_state.items():
+            if trade_state.get(state_type) != data:
+                self.scm.set_trade_state(code, state_type, data)
+        for state_type in trade_state.keys() - new_state.keys():
+            self.scm.clear_trade_state(code, state_type)
+
+        elapsed = time.perf_counter() - start_time
+        with self._stats_lock:
+            self._stats['count'] += 1
+            self._stats['total_time'] += elapsed
+            self._stats['eval_time'] += result.pop('eval_time', 0.0)
+            self._stats['max_time'] = max(self._stats['max_time'], elapsed)
+            self._stats['rows_sent'] += sum(len(rows) for rows in snapshot['cycles'].values())
+        return result
+
+    def get_stats(self):
+        """평가 풀 통계 (호출 수, 평균 왕복/평가 시간, 전송 봉 수)"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        count = stats['count'] or 1
+        stats['avg_time'] = stats['total_time'] / count
+        stats['avg_eval_time'] = stats['eval_time'] / count
+        stats['workers'] = self.workers
+        return stats
+
+    def shutdown(self):
+        """워커 프로세스 종료"""
+        for executor in self._executors:
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except Exception as e:
+                logging.debug(f'ScriptEvalPool 종료 오류: {e}')
+        logging.info('ScriptEvalPool 종료')
+
 if __name__ == '__main__':
     ct = ChartManager('005930', 'mi', 3)
 
@@ -1,4 +1,4 @@
-from public import dc, gm, get_path, save_json, load_json, QData
+from public import dc, gm, get_path, save_json, load_json, QData, BulkRef, pack_bulk, unpack_bulk, discard_bulk
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel
 from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal    
 from multiprocessing import Process
@@ -9,6 +9,8 @@ import queue
 import threading
 import copy
 import time
+from concurrent.futures import Future, wait as wait_futures
+from collections import deque
 import logging
 import os
 
@@ -213,6 +215,92 @@ class ThreadSafeQueue:
     def empty(self):
         return self.q.empty()
 
+class MasterCache:
+    """
+    종목 마스터 캐시 (메인 프로세스) - 종목명/전일가는 장중 변하지 않으므로 api 프로세스 왕복 없이 조회
+    - load(): GetMasterData로 일괄 적재 (응답을 기다리지 않음, 적재 전 조회는 api에 물어 보고 저장)
+      실패/타임아웃이면 RETRY_DELAY 초 뒤 첫 조회 누락 때 다시 적재
+    - refresh(codes): 지정 종목만 다시 조회, codes 없으면 전체 재적재
+    """
+    RETRY_DELAY = 30  # 적재 실패 후 다시 적재까지 최소 간격 (초)
+
+    def __init__(self, prx):
+        self.prx = prx
+        self.lock = threading.Lock()
+        self.names = {}        # {종목코드: 종목명}
+        self.last_prices = {}  # {종목코드: 전일가}
+        self.loaded = False
+        self.loading = False
+        self.retry_at = 0.0    # 적재 실패 후 다시 적재할 수 있는 시각 (time.time)
+        self.stats = {'hits': 0, 'misses': 0, 'loads': 0, 'load_ms': 0.0, 'failures': 0}
+
+    def load(self, wait=60):
+        start_time = time.perf_counter()
+        self.loading = True
+        def on_master(master):
+            if not master:
+                with self.lock:
+                    self.loading = False
+                    self.retry_at = time.time() + self.RETRY_DELAY
+                    self.stats['failures'] += 1
+                logging.warning(f'종목 마스터 적재 실패 - {self.RETRY_DELAY}초 뒤 조회 때 다시 적재')
+                return
+            with self.lock:
+                self.loading = False
+                for code, (name, last_price) in master.items():
+                    self.names[code] = name
+                    self.last_prices[code] = last_price
+                self.loaded = True
+                self.stats['loads'] += 1
+                self.stats['load_ms'] = (time.perf_counter() - start_time) * 1000
+            logging.info(f"종목 마스터 적재 완료: {len(master)}개 {self.stats['load_ms']:.0f}ms")
+        return self.prx.answer_async('api', 'GetMasterData', wait=wait, callback=on_master)
+
+    def refresh(self, codes=None):
+        if codes is None:
+            return self.load()
+        # 먼저 받아 온 뒤 락 안에서 바꿔 끼움 (받는 동안에도 기존 값으로 조회)
+        requests = [('api', method, (code,), None) for code in codes for method in ('GetMasterCodeName', 'GetMasterLastPrice')]
+        results = self.prx.answer_many(requests)
+        with self.lock:
+            for idx, code in enumerate(codes):
+                name, last_price = results[idx * 2], results[idx * 2 + 1]
+                if name: self.names[code] = name
+                else: self.names.pop(code, None)
+                if last_price: self.last_prices[code] = last_price
+                else: self.last_prices.pop(code, None)
+
+    def _lookup(self, store, method, code):
+        with self.lock:
+            value = store.get(code)
+            if value is not None:
+                self.stats['hits'] += 1
+                return value
+            self.stats['misses'] += 1
+            reload = not self.loaded and not self.loading and time.time() >= self.retry_at
+            if reload: self.loading = True
+        if reload: self.load()
+        value = self.prx.answer('api', method, code)
+        if value:  # 빈 값(없는 종목)은 저장하지 않음
+            with self.lock:
+                store[code] = value
+        return value
+
+    def get_name(self, code):
+        return self._lookup(self.names, 'GetMasterCodeName', code)
+
+    def get_last_price(self, code):
+        """전일가 (GetMasterLastPrice)"""
+        return self._lookup(self.last_prices, 'GetMasterLastPrice', code)
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / total if total else 0.0
+        stats['codes'] = len(self.names)
+        stats['loaded'] = self.loaded
+        return stats
+
 class Toast(QWidget):
     def __init__(self):
         super().__init__()
@@ -322,7 +410,7 @@ class CounterTicker:
         if code not in self.data:
             if name is None or name == "":
                 try:
-                    name = gm.prx.answer('api', 'GetMasterCodeName', code)
+                    name = gm.master.get_name(code)
                 except Exception:
                     name = code
             self.data[code] = { "name": name, "rate": 0.0, "times": 0, "count": 0 }
@@ -591,6 +679,87 @@ def get_windows_drive_free_percent():
     percent_free = (free / total) * 100
     return percent_free
 
+class IpcMetrics:
+    """
+    모델별 IPC 지표 - (방향, 상대 모델, 메서드)별 집계
+    - 'out': 보낸 건수, 피클 크기(IPC_BYTES_SAMPLE건마다 표본), 응답 왕복 시간
+    - 'in' : 받은 건수, 큐 대기 시간(넣은 시각 → 꺼내 처리 시작), 처리 시간
+    - snapshot()으로 조회, dump()로 로그 출력 (모델 루프에서 IPC_DUMP_INTERVAL마다)
+    """
+    SAMPLES = 500
+
+    def __init__(self, name):
+        self.name = name
+        self.entries = {}  # {(direction, peer, method): {...}}
+        self.started = time.time()
+        self.last_dump = time.time()
+
+    def _entry(self, direction, peer, method):
+        key = (direction, peer, method)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries.setdefault(key, {'count': 0, 'sized': 0, 'bytes': 0, 'dwell': deque(maxlen=self.SAMPLES),
+                                                  'handler': deque(maxlen=self.SAMPLES), 'rtt': deque(maxlen=self.SAMPLES)})
+        return entry
+
+    def record_sent(self, target, method, q_data):
+        entry = self._entry('out', target, method)
+        entry['count'] += 1
+        if entry['count'] % dc.IPC_BYTES_SAMPLE == 1:
+            from multiprocessing.reduction import ForkingPickler
+            try:
+                entry['bytes'] += len(ForkingPickler.dumps(q_data))
+                entry['sized'] += 1
+            except Exception:
+                pass
+
+    def record_handled(self, sender, method, dwell, handler):
+        entry = self._entry('in', sender, method)
+        entry['count'] += 1
+        if dwell is not None: entry['dwell'].append(dwell)
+        entry['handler'].append(handler)
+
+    def record_rtt(self, target, method, rtt):
+        self._entry('out', target, method)['rtt'].append(rtt)
+
+    @staticmethod
+    def _percentiles(samples):
+        if not samples: return None
+        values = sorted(samples)
+        pick = lambda p: values[min(len(values) - 1, int(len(values) * p))] * 1000
+        return {'p50': pick(0.5), 'p90': pick(0.9), 'p99': pick(0.99), 'max': values[-1] * 1000}
+
+    def snapshot(self, shared_qes=None):
+        """{'methods': {'out api.SendOrder': {...}}, 'depth': {큐이름: 길이}} - 시간은 밀리초"""
+        elapsed = max(time.time() - self.started, 1e-9)
+        methods = {}
+        for (direction, peer, method), entry in list(self.entries.items()):
+            item = {'count': entry['count'], 'rate': entry['count'] / elapsed}
+            if entry['sized']: item['avg_bytes'] = entry['bytes'] / entry['sized']
+            for name in ('dwell', 'handler', 'rtt'):
+                pct = self._percentiles(list(entry[name]))
+                if pct: item[name] = pct
+            methods[f'{direction} {peer}.{method}'] = item
+        depth = {}
+        for name, shared_q in (shared_qes or {}).items():
+            try:
+                depth[name] = shared_q.request.qsize()
+            except (NotImplementedError, OSError):
+                depth[name] = None
+        return {'methods': methods, 'depth': depth}
+
+    def dump(self, shared_qes=None):
+        snap = self.snapshot(shared_qes)
+        lines = [f'[{self.name}] IPC 지표 depth={snap["depth"]}']
+        for key, item in sorted(snap['methods'].items(), key=lambda kv: -kv[1]['count']):
+            text = f"  {key}: count={item['count']} rate={item['rate']:.1f}/s"
+            if 'avg_bytes' in item: text += f" bytes={item['avg_bytes']:.0f}"
+            for name in ('dwell', 'handler', 'rtt'):
+                if name in item: text += f" {name}(p50/p99)={item[name]['p50']:.2f}/{item[name]['p99']:.2f}ms"
+            lines.append(text)
+        logging.debug('\n'.join(lines))
+        self.last_dump = time.time()
+
 class BaseModel:
     def __init__(self, name, cls, shared_qes, *args, **kwargs):
         self.name = name
@@ -603,7 +772,14 @@ class BaseModel:
         self.running = False
         self.answer_timeout = 15
         self.queue_timeout = dc.INTERVAL_FAST
-        self.pending_requests = {}  # 대기 중인 요청들 관리
+        self.pending_requests = {}  # 대기 중인 요청들 관리 {request_id: {'event': Event, 'result': 결과}} 또는 {'future': Future, ...}
+        self.answer_latency = deque(maxlen=1000)  # answer() 왕복 시간 (초)
+        self.answer_timeouts = 0
+        self.queue_batch_max = dc.QUEUE_BATCH_MAX  # 루프 1회 최대 처리 메시지 수
+        self.queue_dwell = deque(maxlen=1000)  # 메시지 큐 대기 시간 (초)
+        self.queue_stats = {'messages': 0, 'batches': 0, 'max_batch': 0, 'full_batches': 0, 'bulk_sent': 0, 'bulk_rows': 0}
+        self.async_deadline = None  # answer_async() 요청 중 가장 이른 만료 시각 (perf_counter)
+        self.ipc = IpcMetrics(name)
         
         # 프로세스/스레드 환경 자동 감지
         if isinstance(self, Process):
@@ -619,6 +795,8 @@ class BaseModel:
         if q_data.method == 'stop':
             self.stop()
         if hasattr(self.instance, q_data.method):
+            if any(type(arg) is BulkRef for arg in q_data.args):
+                q_data.args = tuple(unpack_bulk(arg) for arg in q_data.args)  # callback으로 받은 대량 결과
             if q_data.answer:
                 result = getattr(self.instance, q_data.method)(*q_data.args, **q_data.kwargs)
                 # 디버깅: 결과 크기 확인
@@ -629,10 +807,11 @@ class BaseModel:
                     sender=self.name,
                     method='_handle_response',
                     answer=False,
-                    args=(q_data.request_id, result),
+                    args=(q_data.request_id, self._pack_result(result)),
                     request_id=q_data.request_id
                 )
                 self.shared_qes[q_data.sender].put_request(response_data)
+                self.ipc.record_sent(q_data.sender, '_handle_response', response_data)
                 # logging.debug(f'[{self.name}] 응답 전송 완료: {q_data.method} -> {q_data.sender}')
             else:
                 result = getattr(self.instance, q_data.method)(*q_data.args, **q_data.kwargs)
@@ -641,31 +820,69 @@ class BaseModel:
                         sender=self.name, 
                         method=q_data.callback, 
                         answer=False, 
-                        args=(result,)
+                        args=(self._pack_result(result),)
                     )
                     self.shared_qes[q_data.sender].put_request(callback_data)
+                    self.ipc.record_sent(q_data.sender, q_data.callback, callback_data)
+
+    def _pack_result(self, result):
+        """대량 결과는 큐 대신 임시 파일로 전달 (뒤에 선 작은 메시지가 막히지 않도록)"""
+        packed = pack_bulk(result)
+        if packed is not result:
+            self.queue_stats['bulk_sent'] += 1
+            self.queue_stats['bulk_rows'] += packed.rows
+        return packed
 
     def _handle_response(self, request_id, result):
         """응답 처리 전용 메서드"""
         # result_size = len(result) if isinstance(result, (list, dict)) else 'N/A'
         # logging.debug(f'[{self.name}] 응답 수신: request_id={request_id}, result 크기={result_size}')
         with self.pending_lock:
-            if request_id in self.pending_requests:
-                self.pending_requests[request_id] = result
+            waiter = self.pending_requests.get(request_id)
+            if waiter is not None:
+                if 'future' in waiter:
+                    self.pending_requests.pop(request_id, None)
+                else:
+                    waiter['result'] = result
+                    waiter['event'].set()  # 대기 중인 answer() 즉시 깨움
+        if waiter is None:
+            discard_bulk(result)  # 타임아웃/만료 뒤 도착한 응답 - 대량 결과 임시 파일 정리
+            return
+        if 'future' in waiter:
+            # answer_async(): 락 밖에서 결과 설정 (done callback이 이 모델 루프 쓰레드에서 실행됨)
+            rtt = time.perf_counter() - waiter['start']
+            self.answer_latency.append(rtt)
+            self.ipc.record_rtt(waiter['target'], waiter['method'], rtt)
+            waiter['future'].set_result(unpack_bulk(result))
             #     logging.debug(f'[{self.name}] 응답 저장 완료: request_id={request_id}')
             # else:
             #     logging.warning(f'[{self.name}] 응답 버림 (request_id 없음): request_id={request_id}')
 
     def _wait_for_response(self, request_id, wait):
-        """응답 대기 (폴링 최소화)"""
-        start_time = time.time()
-        while time.time() - start_time < wait:
-            with self.pending_lock:
-                result = self.pending_requests.get(request_id)
-                if result is not None:
-                    return result
-            time.sleep(0.001)  # 1ms 대기
-        return None
+        """응답 대기 (요청별 이벤트로 블로킹 대기, 폴링 없음) - (응답 여부, 결과) 반환"""
+        with self.pending_lock:
+            waiter = self.pending_requests.get(request_id)
+        if waiter is None:
+            return False, None
+        if not waiter['event'].wait(wait):
+            return False, None
+        return True, waiter['result']
+
+    def get_answer_latency(self):
+        """answer() 왕복 시간 백분위 (밀리초)"""
+        latencies = sorted(self.answer_latency)
+        if not latencies:
+            return {'count': 0, 'timeouts': self.answer_timeouts}
+        def pct(p):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+        return {
+            'count': len(latencies),
+            'timeouts': self.answer_timeouts,
+            'p50': pct(0.5),
+            'p90': pct(0.9),
+            'p99': pct(0.99),
+            'max': latencies[-1] * 1000,
+        }
 
     def _initialize_instance(self):
         """인스턴스 초기화 공통 로직"""
@@ -678,21 +895,81 @@ class BaseModel:
             self.instance.initialize()
 
     def _process_queues(self):
-        """큐 처리 공통 로직 - _handle_response 처리 추가"""
-        if not self.my_qes.request.empty():
-            q_data = self.my_qes.request.get()
+        """큐 처리 공통 로직 - 비어 있으면 타임아웃 블로킹 대기, 메시지가 있으면 쌓인 것까지 한 번에 꺼내 처리 (최대 queue_batch_max)"""
+        request_q = self.my_qes.request
+        try:
+            batch = [request_q.get(timeout=self.queue_timeout)]
+        except queue.Empty:
+            batch = None
 
-            # 응답 처리 전용 메서드인 경우 직접 처리
-            if q_data.method == '_handle_response':
-                self._handle_response(*q_data.args)
-            else:
-                self.process_q_data(q_data)
-        else:
-            time.sleep(self.queue_timeout)
+        if batch is not None:
+            while len(batch) < self.queue_batch_max:
+                try:
+                    batch.append(request_q.get_nowait())
+                except queue.Empty:
+                    break
+            self._update_queue_stats(len(batch))
+
+            for q_data in batch:
+                dwell = None
+                if getattr(q_data, 'sent_at', None):
+                    dwell = time.time() - q_data.sent_at
+                    self.queue_dwell.append(dwell)
+                start_time = time.perf_counter()
+                # 한 메시지 오류로 이미 꺼낸 나머지(다른 쪽 응답 포함)를 잃지 않도록 메시지마다 처리
+                try:
+                    # 응답 처리 전용 메서드인 경우 직접 처리
+                    if q_data.method == '_handle_response':
+                        self._handle_response(*q_data.args)
+                    else:
+                        self.process_q_data(q_data)
+                except Exception as e:
+                    logging.error(f"{self.name} 메시지 처리 오류: {getattr(q_data, 'sender', None)}.{getattr(q_data, 'method', None)} - {type(e).__name__} - {e}", exc_info=True)
+                self.ipc.record_handled(getattr(q_data, 'sender', None), getattr(q_data, 'method', None), dwell, time.perf_counter() - start_time)
+
+        if self.async_deadline is not None and time.perf_counter() >= self.async_deadline:
+            self._expire_async_requests()
 
         if hasattr(self.instance, 'run_main_work'):
             self.instance.run_main_work()
 
+        if dc.IPC_DUMP_INTERVAL and time.time() - self.ipc.last_dump >= dc.IPC_DUMP_INTERVAL:
+            self.ipc.dump(self.shared_qes)
+
+        # 보내는 쪽에 모아 둔 병합 대기분 전송 (ConflatingQueue)
+        for shared_q in self.shared_qes.values():
+            flush = getattr(shared_q, 'flush', None)
+            if flush is not None:
+                flush()
+
+    def _update_queue_stats(self, batch_size):
+        stats = self.queue_stats
+        stats['messages'] += batch_size
+        stats['batches'] += 1
+        if batch_size > stats['max_batch']:
+            stats['max_batch'] = batch_size
+        if batch_size >= self.queue_batch_max:
+            stats['full_batches'] += 1  # 한도까지 꺼냄 = 처리보다 유입이 많음
+
+    def get_queue_stats(self):
+        """요청 큐 깊이/대기 시간 현황 (대기 시간은 밀리초)"""
+        stats = dict(self.queue_stats)
+        try:
+            stats['depth'] = self.my_qes.request.qsize()
+        except (NotImplementedError, OSError):
+            stats['depth'] = None  # macOS 등 qsize 미지원
+        stats['avg_batch'] = stats['messages'] / stats['batches'] if stats['batches'] else 0
+        dwell = sorted(self.queue_dwell)
+        if dwell:
+            stats['dwell_p50'] = dwell[len(dwell) // 2] * 1000
+            stats['dwell_p99'] = dwell[min(len(dwell) - 1, int(len(dwell) * 0.99))] * 1000
+            stats['dwell_max'] = dwell[-1] * 1000
+        return stats
+
+    def get_ipc_metrics(self):
+        """(방향, 상대 모델, 메서드)별 건수/바이트/대기/처리/왕복 시간과 큐 깊이 (시간은 밀리초)"""
+        return self.ipc.snapshot(self.shared_qes)
+
     def _run_loop_iteration(self):
         """각 모델별 특수 처리를 위한 메서드 (오버라이드 가능)"""
         pass
@@ -726,6 +1003,7 @@ class BaseModel:
         callback = kwargs.pop('callback', None)
         q_data = QData(sender=self.name, method=method, answer=False, args=args, kwargs=kwargs, callback=callback)
         self.shared_qes[target].put_request(q_data)
+        self.ipc.record_sent(target, method, q_data)
 
     def answer(self, target, method, *args, **kwargs):
         """응답이 필요한 요청 (answer=True) - 프로세스/스레드 통합 안전 보장"""
@@ -737,25 +1015,89 @@ class BaseModel:
 
         # 요청 ID로 응답 매칭
         with self.pending_lock:
-            self.pending_requests[q_data.request_id] = None
+            self.pending_requests[q_data.request_id] = {'event': threading.Event(), 'result': None}
 
+        received = False
         try:
             # 요청 전송
+            start_time = time.perf_counter()
             self.shared_qes[target].put_request(q_data)
+            self.ipc.record_sent(target, method, q_data)
 
             # 응답 대기
-            result = self._wait_for_response(q_data.request_id, wait)
-            if result is None:
+            received, result = self._wait_for_response(q_data.request_id, wait)
+            if not received:
+                self.answer_timeouts += 1
                 logging.warning(f'[{self.name}] 응답 타임아웃: {self.name} -> {target}.{method}, wait={wait}초')
-            return result
+            else:
+                self.answer_latency.append(time.perf_counter() - start_time)
+                self.ipc.record_rtt(target, method, self.answer_latency[-1])
+            return unpack_bulk(result)  # 대량 결과는 모델 루프가 아닌 요청한 쓰레드에서 복원
             
         except Exception as e:
             logging.error(f"answer() 오류:{self.name}의 요청 : {target}.{method} - {e}", exc_info=True)
             return None
         finally:
-            # 응답 정리
+            # 응답 정리 (타임아웃 직후 도착해 받아 가지 않은 대량 결과는 파일 삭제)
+            with self.pending_lock:
+                waiter = self.pending_requests.pop(q_data.request_id, None)
+            if waiter is not None and not received:
+                discard_bulk(waiter['result'])
+
+    def answer_async(self, target, method, *args, **kwargs):
+        """
+        응답을 기다리지 않는 요청 - Future 반환 (future.result()로 받거나 callback(result)로 받음)
+        - 여러 요청을 먼저 보내 놓고 함께 기다리면 왕복 시간이 겹쳐짐 (answer_many)
+        - 응답은 이 모델의 루프 쓰레드에서 설정되므로 callback에서 GUI를 직접 건드리거나 answer()로 대기하지 말 것 (gm.qwork['gui'] 사용)
+        - wait 초 안에 응답이 없으면 answer()와 같이 None으로 완료
+        """
+        wait = kwargs.pop('wait', self.answer_timeout)
+        callback = kwargs.pop('callback', None)
+        q_data = QData(sender=self.name, method=method, answer=True, args=args, kwargs=kwargs)
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(lambda f: callback(f.result()))
+
+        start_time = time.perf_counter()
+        with self.pending_lock:
+            self.pending_requests[q_data.request_id] = {'future': future, 'start': start_time, 'deadline': start_time + wait,
+                                                        'target': target, 'method': method, 'wait': wait}
+            if self.async_deadline is None or start_time + wait < self.async_deadline:
+                self.async_deadline = start_time + wait
+        try:
+            self.shared_qes[target].put_request(q_data)
+            self.ipc.record_sent(target, method, q_data)
+        except Exception as e:
+            logging.error(f"answer_async() 오류:{self.name}의 요청 : {target}.{method} - {e}", exc_info=True)
             with self.pending_lock:
                 self.pending_requests.pop(q_data.request_id, None)
+            future.set_result(None)
+        return future
+
+    def answer_many(self, requests, wait=None):
+        """여러 요청을 동시에 보내고 함께 대기 - requests: [(target, method, args, kwargs), ...] → 결과 리스트 (순서 유지)"""
+        wait = self.answer_timeout if wait is None else wait
+        futures = [self.answer_async(target, method, *args, wait=wait, **(kwargs or {})) for target, method, args, kwargs in requests]
+        wait_futures(futures, timeout=wait)
+        return [future.result() if future.done() else None for future in futures]
+
+    def _expire_async_requests(self):
+        """answer_async() 응답 타임아웃 처리 (모델 루프에서 호출)"""
+        now = time.perf_counter()
+        expired = []
+        with self.pending_lock:
+            next_deadline = None
+            for request_id, waiter in list(self.pending_requests.items()):
+                if 'future' not in waiter: continue
+                if waiter['deadline'] <= now:
+                    expired.append(self.pending_requests.pop(request_id))
+                elif next_deadline is None or waiter['deadline'] < next_deadline:
+                    next_deadline = waiter['deadline']
+            self.async_deadline = next_deadline
+        for waiter in expired:
+            self.answer_timeouts += 1
+            logging.warning(f"[{self.name}] 응답 타임아웃: {self.name} -> {waiter['target']}.{waiter['method']}, wait={waiter['wait']}초")
+            waiter['future'].set_result(None)
 
 class MainModel(BaseModel):
     """메인 쓰레드나 키움API 등을 위한 모델 (별도 쓰레드에서 run 실행)"""
@@ -790,9 +1132,12 @@ class QMainModel(BaseModel, QThread):
         self.instance.emit_q = self.emit_q
 
     def _run_loop_iteration(self):
-        """QMainModel 전용 emit_q 처리"""
-        if not self.emit_q.empty():
-            data = self.emit_q.get()
+        """QMainModel 전용 emit_q 처리 (요청 큐에서 한 번에 꺼낸 만큼 쌓일 수 있어 함께 비움)"""
+        for _ in range(self.queue_batch_max):
+            try:
+                data = self.emit_q.get_nowait()
+            except queue.Empty:
+                break
             self.receive_signal.emit(data)
         
     def stop(self):
@@ -177,8 +177,8 @@ class GUI(QMainWindow, form_class):
             self.btnTrOrder.clicked.connect(self.gui_tr_order)                          # 매매 주문 
             self.btnTrCancel.clicked.connect(self.gui_tr_cancel)                        # 매매 취소 
             self.leTrCode.editingFinished.connect(lambda: self.gui_tr_code_changed(kind='tr'))             # 종목코드 변경
-            self.tblBalanceHeld.cellClicked.connect(self.gui_balance_held_select)       # 잔고목록 선택
-            self.tblReceiptList.cellClicked.connect(self.gui_receipt_list_select)       # 주문진행목록 선택
+            self.tblBalanceHeld.clicked.connect(self.gui_balance_held_select)           # 잔고목록 선택
+            self.tblReceiptList.clicked.connect(self.gui_receipt_list_select)           # 주문진행목록 선택
 
             #그룹박스 체크
             self.gbxBuyCheck.toggled.connect(lambda: self.gui_gbx_check(self.gbxBuyCheck.isChecked(), 'buy'))
@@ -447,7 +447,7 @@ class GUI(QMainWindow, form_class):
                     if min_check:
                         dict_list = [{ **item, '일자': item['체결시간'][:8], '시간': item['체결시간'][8:], } for item in dict_list]
                     else:
-                        dict_list = [{ **item, '일자': item['일자'], '시간': '', '종목명': gm.prx.answer('api', 'GetMasterCodeName', item['종목코드']), } for item in dict_list]
+                        dict_list = [{ **item, '일자': item['일자'], '시간': '', '종목명': gm.master.get_name(item['종목코드']), } for item in dict_list]
 
                 gm.차트자료.set(data=dict_list)
                 logging.info(f"차트자료 얻기 완료: data count={gm.차트자료.len()}")
@@ -631,9 +631,9 @@ class GUI(QMainWindow, form_class):
             else:
                 self.tblConditionSell.setEnabled(True)
 
-    def gui_balance_held_select(self, row_index, col_index):
-        code = self.tblBalanceHeld.item(row_index, 0).text()
-        logging.debug(f'cell = [{row_index:02d}:{col_index:02d}] code = {code}')
+    def gui_balance_held_select(self, index):
+        code = index.sibling(index.row(), 0).data()
+        logging.debug(f'cell = [{index.row():02d}:{index.column():02d}] code = {code}')
         row = gm.잔고목록.get(key=code)
         if row:
             self.leTrCode.setText(row['종목번호'])
@@ -644,11 +644,11 @@ class GUI(QMainWindow, form_class):
             # self.leTrStrategy.setText(row['전략'])
         #self.tblBalanceHeld.clearSelection()  
 
-    def gui_receipt_list_select(self, row_index, col_index):
-        code = self.tblReceiptList.item(row_index, 2).text()
-        kind = self.tblReceiptList.item(row_index, 0).text()
+    def gui_receipt_list_select(self, index):
+        code = index.sibling(index.row(), 2).data()
+        kind = index.sibling(index.row(), 0).data()
         key = (code, kind)
-        logging.debug(f'cell = [{row_index:02d}:{col_index:02d}] code = {code} kind = {kind} key = {key}')
+        logging.debug(f'cell = [{index.row():02d}:{index.column():02d}] code = {code} kind = {kind} key = {key}')
         row = gm.주문진행목록.get(key=key)
         if row:
             self.leTrCode.setText(row['종목코드'])
@@ -663,7 +663,7 @@ class GUI(QMainWindow, form_class):
     def gui_tr_code_changed(self, kind='tr'):
         code = self.leTrCode.text() if kind == 'tr' else self.leSimCodeDay.text() if kind == 'day' else None
         if code:
-            name = gm.prx.answer('api', 'GetMasterCodeName', code)
+            name = gm.master.get_name(code)
             if kind == 'tr': self.leTrName.setText(name)
             elif kind == 'day': self.leSimNameDay.setText(name)
             
@@ -1160,11 +1160,7 @@ class GUI(QMainWindow, form_class):
                 self.lblAssets.setText("0")
                 self.lblProfit.setText("0")
                 self.lblFrofitRate.setText("0.0")
-            if gm.잔고목록:
-                gm.잔고목록.update_table_widget(self.tblBalanceHeld, stretch=False)
-            else:
-                self.tblBalanceHeld.setColumnCount(len(dc.const.hd잔고목록['헤더']))
-                self.tblBalanceHeld.setHeaderLabels(dc.const.hd잔고목록['헤더'])
+            gm.잔고목록.update_table_widget(self.tblBalanceHeld, stretch=False)  # QTableView - 빈 목록도 헤더 표시
 
             if gm.매수검색목록:
                 gm.매수검색목록.update_table_widget(self.tblConditionBuy)
@@ -1178,11 +1174,7 @@ class GUI(QMainWindow, form_class):
                 self.tblConditionSell.setColumnCount(len(dc.const.hd조건목록['헤더']))
                 self.tblConditionSell.setHeaderLabels(dc.const.hd조건목록['헤더'])
 
-            if gm.주문진행목록:
-                gm.주문진행목록.update_table_widget(self.tblReceiptList)    
-            else:
-                self.tblReceiptList.setColumnCount(len(dc.const.hd주문진행목록['헤더']))
-                self.tblReceiptList.setHeaderLabels(dc.const.hd주문진행목록['헤더'])
+            gm.주문진행목록.update_table_widget(self.tblReceiptList)
 
         except Exception as e:
             logging.error(f'목록테이블 갱신 오류: {type(e).__name__} - {e}', exc_info=True)
@@ -1307,31 +1299,37 @@ class GUI(QMainWindow, form_class):
         return speed, dt
 
     def gui_get_tickers(self, date_text, read_chart=False):
-        try:
-            sql = db_columns.SIM_SELECT_GUBUN if read_chart else db_columns.SIM_SELECT_DATE
-            dict_list = gm.prx.answer('dbm', 'execute_query', sql=sql, db='db', params=(date_text, 0,))
+        """당일종목 조회 요청 (응답을 기다리지 않음) - 결과는 gui 큐로 gui_sim_read_day_done 에서 처리"""
+        def on_tickers(dict_list):
             if dict_list is not None and len(dict_list) > 0:
                 logging.info(f"당일종목 얻기 완료: date={self.sim_date_text} count={len(dict_list)}")
-                return dict_list
             else:
                 logging.warning(f'당일종목 얻기 실패: date:{self.sim_date_text}, dict_list:{dict_list}')
-                return None
+                dict_list = None
+            gm.qwork['gui'].put(Work('gui_sim_read_day_done', {'date_text': date_text, 'read_chart': read_chart, 'sim_tickers': dict_list}))
+
+        try:
+            sql = db_columns.SIM_SELECT_GUBUN if read_chart else db_columns.SIM_SELECT_DATE
+            gm.prx.answer_async('dbm', 'execute_query', sql=sql, db='db', params=(date_text, 0,), callback=on_tickers)
+            return True
 
         except Exception as e:
             logging.error(f'당일종목 얻기 오류: {type(e).__name__} - {e}', exc_info=True)
-            return None
+            return False
         
     def gui_sim_read_day(self, read_chart=False):
+        date_text = self.dtSimDate.date().toString("yyyyMMdd")
+        self.btnSimReadDay.setEnabled(False)
+        self.btnSimReadTick.setEnabled(False)
+        if not self.gui_get_tickers(date_text, read_chart=read_chart):
+            self.gui_sim_read_day_done(date_text, read_chart, None)
+
+    def gui_sim_read_day_done(self, date_text, read_chart, sim_tickers):
         try:
-            date_text = self.dtSimDate.date().toString("yyyyMMdd")
-            
-            self.btnSimReadDay.setEnabled(False)
-            self.btnSimReadTick.setEnabled(False)
             enable = True
 
             gm.당일종목.delete()
             self.tblSimDaily.clearContents()
-            sim_tickers = self.gui_get_tickers(date_text, read_chart=read_chart)
 
             if sim_tickers:
                 gm.당일종목.set(data=sim_tickers)
@@ -1390,7 +1388,7 @@ class GUI(QMainWindow, form_class):
         code = self.leSimCodeDay.text()
         name = self.leSimNameDay.text()
         if code:
-            name = gm.prx.answer('api', 'GetMasterCodeName', code)
+            name = gm.master.get_name(code)
             if name:
                 self.leSimNameDay.setText(name)
         else:
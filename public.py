@@ -11,7 +11,9 @@ import os
 import sys
 import json
 import time
-import uuid
+import itertools
+import struct
+import pickle
 
 def hoga(current_price, position=0):
     # logging.debug(f'hoga : current_price={current_price}, position={position}')
@@ -144,6 +146,43 @@ class Work:
     order: str              # 수신자가 실행할 함수명 또는 메세지(루프에서 인식할 조건)
     job: dict = field(default_factory={})              # 수신자가 실행할 함수에 전달할 데이터
 
+# QData/QWork 전송 형식 ---------------------------------------------------------------------------------
+# 자주 쓰는 모델/메서드 이름은 번호로 전송 (모든 프로세스가 같은 소스를 로드하므로 표가 동일, 뒤에만 추가할 것)
+WIRE_NAMES = (
+    'api', 'dbm', 'prx', 'rcv',
+    '_handle_response', 'proxy_method', 'stop',
+    'on_receive_real_data', 'on_receive_real_condition', 'on_receive_chejan_data', 'on_receive_tr_data',
+    'on_receive_market_status', 'on_tickers_ready', 'toast',
+    'table_upsert', 'upsert_real_data', 'upsert_chart', 'execute_query',
+    'SetRealReg', 'SetRealRemove', 'SendOrder', 'GetMasterCodeName', 'GetMasterLastPrice',
+)
+_WIRE_NAME_IDS = {name: idx for idx, name in enumerate(WIRE_NAMES)}
+
+def _pack_name(name):
+    return _WIRE_NAME_IDS.get(name, name)
+
+def _unpack_name(value):
+    if type(value) is int:
+        return WIRE_NAMES[value]
+    return sys.intern(value) if type(value) is str else value
+
+# 요청 ID - 응답은 보낸 모델의 큐로만 돌아오므로 프로세스 내 증가 정수로 충분
+_request_ids = itertools.count(1)
+
+def _unpack_qwork(method, args=(), kwargs=None, callback=None):
+    return QWork(_unpack_name(method), args, kwargs if kwargs is not None else {}, _unpack_name(callback))
+
+def _unpack_qdata(sender, method, request_id, sent_at, args=(), kwargs=None, answer=False, callback=None):
+    return QData(_unpack_name(sender), _unpack_name(method), answer, args,
+                 kwargs if kwargs is not None else {}, _unpack_name(callback), request_id, sent_at)
+
+def _trim_defaults(values, defaults):
+    """뒤쪽 기본값 필드는 전송하지 않음"""
+    end = len(values)
+    while end > defaults and not values[end - 1]:
+        end -= 1
+    return values[:end]
+
 @dataclass
 class QWork:
     method: str
@@ -151,6 +190,10 @@ class QWork:
     kwargs: dict = field(default_factory=dict)
     callback: str = None
 
+    def __reduce__(self):
+        """피클 시 클래스/필드명 없이 짧은 튜플로 전송"""
+        return _unpack_qwork, _trim_defaults((_pack_name(self.method), self.args, self.kwargs or None, _pack_name(self.callback)), 1)
+
 @dataclass
 class QData:
     sender : str = None
@@ -159,7 +202,124 @@ class QData:
     args : tuple = field(default_factory=tuple)
     kwargs : dict = field(default_factory=dict)
     callback : str = None
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))  # 고유 요청 ID
+    request_id: int = field(default_factory=lambda: next(_request_ids))  # 고유 요청 ID (프로세스 내 증가 정수)
+    sent_at: float = None  # 큐에 넣은 시각 (time.time(), 대기 시간 측정용)
+
+    def __reduce__(self):
+        """피클 시 클래스/필드명 없이 (sender, method, request_id, sent_at, args, kwargs, answer, callback) 튜플로 전송"""
+        return _unpack_qdata, _trim_defaults((_pack_name(self.sender), _pack_name(self.method), self.request_id, self.sent_at,
+                                              self.args, self.kwargs or None, self.answer, _pack_name(self.callback)), 4)
+
+# 대량 결과 전달 ------------------------------------------------------------------------------------------
+@dataclass
+class BulkRef:
+    """대량 결과 참조 - 자료는 임시 파일에 청크 단위(열 형식)로 기록하고 큐에는 이 참조만 전송"""
+    path: str
+    rows: int
+    chunks: int
+    kind: str = 'list'  # 'list' 행 리스트, 'dict' 사전(키/값 청크), 'object' 대량 자료를 품은 튜플/사전 통째
+
+def _bulk_rows(result, depth=2):
+    """결과 안의 가장 큰 list/dict 길이 (튜플/사전 안쪽은 depth 단계까지만 확인)"""
+    kind = type(result)
+    if kind is list:
+        return len(result)
+    if kind is dict:
+        if depth <= 0:
+            return len(result)
+        return max(len(result), max((_bulk_rows(value, depth - 1) for value in result.values() if type(value) in (list, dict, tuple)), default=0))
+    if kind is tuple and depth > 0:
+        return max((_bulk_rows(value, depth - 1) for value in result), default=0)
+    return 0
+
+def _dump_rows(f, rows):
+    """행 청크 1개 기록 - 같은 키의 dict 행이면 열 형식으로"""
+    first = rows[0] if rows else None
+    if type(first) is dict and all(type(row) is dict and row.keys() == first.keys() for row in rows):
+        keys = tuple(first)
+        pickle.dump((keys, [[row[key] for row in rows] for key in keys]), f, pickle.HIGHEST_PROTOCOL)
+    else:
+        pickle.dump((None, rows), f, pickle.HIGHEST_PROTOCOL)
+
+def _load_rows(f):
+    keys, data = pickle.load(f)
+    if keys is None:
+        return data
+    return [dict(zip(keys, values)) for values in zip(*data)]
+
+def pack_bulk(result, min_rows=None):
+    """
+    결과에 min_rows 이상인 list/dict가 있으면 임시 파일에 기록 후 BulkRef 반환, 아니면 그대로 반환
+    최상위 list/dict는 청크 단위로, (자료, 남은수) 같은 튜플/사전 안에 든 대량 자료는 결과 통째로 기록
+    """
+    rows = _bulk_rows(result)
+    if rows < (min_rows or dc.BULK_ROWS_MIN):
+        return result
+    import tempfile
+    fd, path = tempfile.mkstemp(prefix='bulk_', suffix='.bin', dir=dc.fp.bulk_path)
+    chunks = 0
+    kind = 'list' if type(result) is list else 'dict' if type(result) is dict and len(result) == rows else 'object'
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if kind == 'object':
+                pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+                chunks = 1
+            else:
+                items = result if kind == 'list' else list(result.items())
+                for start in range(0, len(items), dc.BULK_CHUNK_ROWS):
+                    chunk = items[start:start + dc.BULK_CHUNK_ROWS]
+                    if kind == 'list':
+                        _dump_rows(f, chunk)
+                    else:
+                        pickle.dump([key for key, _ in chunk], f, pickle.HIGHEST_PROTOCOL)
+                        _dump_rows(f, [value for _, value in chunk])
+                    chunks += 1
+    except Exception as e:
+        logging.warning(f'대량 결과 파일 기록 실패, 큐로 전송: {type(e).__name__} - {e}')
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return result
+    return BulkRef(path, rows, chunks, kind)
+
+def unpack_bulk(value):
+    """BulkRef면 임시 파일에서 청크 단위로 읽어 원래 결과 복원 후 파일 삭제, 아니면 그대로 반환"""
+    if type(value) is not BulkRef:
+        return value
+    try:
+        with open(value.path, 'rb') as f:
+            if value.kind == 'object':
+                return pickle.load(f)
+            if value.kind == 'dict':
+                result = {}
+                for _ in range(value.chunks):
+                    keys = pickle.load(f)
+                    result.update(zip(keys, _load_rows(f)))
+                return result
+            rows = []
+            for _ in range(value.chunks):
+                rows.extend(_load_rows(f))
+            return rows
+    finally:
+        discard_bulk(value)
+
+def discard_bulk(value):
+    """받을 쪽이 없는 대량 결과(응답 타임아웃/만료 뒤 도착)의 임시 파일 삭제"""
+    if type(value) is BulkRef:
+        try:
+            os.remove(value.path)
+        except OSError:
+            pass
+
+def clear_bulk_files():
+    """읽히지 않고 남은 대량 결과 임시 파일 삭제 (종료 시)"""
+    for file_name in os.listdir(dc.fp.bulk_path):
+        if file_name.startswith('bulk_'):
+            try:
+                os.remove(os.path.join(dc.fp.bulk_path, file_name))
+            except OSError:
+                pass
 
 class SharedQueue:
     def __init__(self, maxlen=None):
@@ -173,6 +333,8 @@ class SharedQueue:
     def put_request(self, item):
         """request 큐에 넣기 (논블로킹, maxlen 제한)"""
         import queue
+        if type(item) is QData:
+            item.sent_at = time.time()
         if self.maxlen:
             try:
                 self.request.put_nowait(item)
@@ -190,6 +352,340 @@ class SharedQueue:
         else:
             self.request.put(item)  # maxlen 없으면 일반 put
 
+class TickRing:
+    """
+    실시간 체결 공유메모리 링 버퍼 (api 프로세스 → 메인 프로세스, 보내는 쪽 1 / 받는 쪽 1)
+
+    - 고정 레이아웃 슬롯(SLOT)에 체결 필드를 정수/실수로 기록해 피클/파이프 없이 전달
+      받는 쪽은 큐 경로와 같은 문자열('+70100', '-1.50')로 되살림 - '+' 부호와 등락율 소수 자릿수는 비트로 보관,
+      숫자 앞뒤 공백만 정리됨 (int()/float() 값은 같음), 그대로 되살릴 수 없는 값(앞자리 0 등)은 None으로 큐 경로
+      _open/_high/_low/_conflated/_buy_volume/_sell_volume(병합 정보)은 큐 경로와 같이 정수
+    - 헤더: 쓰기 순번(0), 읽기 순번(64), 받는 쪽 대기 표시(128) - 서로 다른 캐시 라인
+    - 보내는 쪽은 슬롯을 채운 뒤 쓰기 순번을 올리고, 받는 쪽이 대기 중일 때만 doorbell(Event)을 울림
+      (대기 표시를 놓쳐도 받는 쪽 wait()가 timeout 후 다시 확인하므로 지연은 timeout 이내)
+    - put() 결과: True 기록, False 링 가득 참(보내는 쪽에서 병합 대기), None 레이아웃에 없는 필드(기존 큐로 전송)
+    - 보내는 쪽 스레드가 여럿(시뮬레이션 스레드 등)이어도 되도록 put()은 프로세스 내 락으로 직렬화
+    - 순서: 링 안의 체결끼리는 보낸 순서대로 전달되지만, 큐로 가는 메시지(조건검색 편입/이탈, 다른 실시간 타입,
+      레이아웃에 없는 체결 등)와의 앞뒤 순서는 보장하지 않음 (두 경로가 따로 rcv 시그널로 전달됨)
+      예) 조건검색 편입 메시지보다 그 종목의 첫 체결이 먼저 도착할 수 있음 - 받는 쪽은 순서에 기대지 말 것
+    """
+    RTYPE = '주식체결'
+    INT_FIELDS = ('현재가', '전일대비', '매도호가', '매수호가', '거래량', '누적거래량', '누적거래대금',
+                  '시가', '고가', '저가', '거래대금', '_open', '_high', '_low', '_conflated', '_buy_volume', '_sell_volume')
+    HEADER_SIZE = 192
+    SEQ = struct.Struct('<Q')
+    # 종목코드, 체결시간(HHMMSS), 필드 존재 비트, 부호/자릿수 비트, 보낸 시각, 등락율, 정수 필드들
+    SLOT = struct.Struct('<8sIIIdd' + 'q' * len(INT_FIELDS))
+    RATE_PLUS = 1 << 20   # 부호/자릿수 비트: 0~16 정수 필드 '+' 표시, 20 등락율 '+' 표시, 24~ 등락율 소수 자릿수
+    RATE_DIGITS_SHIFT = 24
+
+    def __init__(self, capacity=None):
+        import multiprocessing as mp
+        from multiprocessing import shared_memory
+        self.capacity = capacity or dc.TICK_RING_SIZE
+        self.shm = shared_memory.SharedMemory(create=True, size=self.HEADER_SIZE + self.capacity * self.SLOT.size)
+        self.shm.buf[:self.HEADER_SIZE] = bytes(self.HEADER_SIZE)
+        self.doorbell = mp.Event()
+        self.owner = True
+        self._init_local()
+
+    def _init_local(self):
+        """프로세스별 상태 (피클로 넘어가지 않음)"""
+        import threading
+        from collections import deque
+        self.buf = self.shm.buf
+        self._lock = threading.Lock()
+        self._write_seq = self.SEQ.unpack_from(self.buf, 0)[0]
+        self._read_seq = self.SEQ.unpack_from(self.buf, 64)[0]
+        self._field_index = {name: idx for idx, name in enumerate(self.INT_FIELDS)}
+        self.latency = deque(maxlen=1000)
+        self.stats = {'put': 0, 'full': 0, 'unsupported': 0, 'read': 0, 'batches': 0, 'max_batch': 0}
+
+    def __getstate__(self):
+        return {'name': self.shm.name, 'capacity': self.capacity, 'doorbell': self.doorbell}
+
+    def __setstate__(self, state):
+        from multiprocessing import shared_memory
+        self.capacity = state['capacity']
+        self.doorbell = state['doorbell']
+        self.shm = shared_memory.SharedMemory(name=state['name'])
+        self.owner = False
+        self._init_local()
+
+    def _encode(self, fid):
+        """dictFID → (체결시간, 비트, 부호/자릿수 비트, 등락율, 정수 필드) / 레이아웃에 없거나 그대로 되살릴 수 없으면 None"""
+        values = [0] * len(self.INT_FIELDS)
+        mask, signs, hhmmss, rate = 0, 0, 0, 0.0
+        try:
+            for name, value in fid.items():
+                idx = self._field_index.get(name)
+                if idx is not None:
+                    if name[0] == '_':  # 병합 정보는 정수
+                        if type(value) is not int: return None
+                        values[idx] = value
+                    else:
+                        if type(value) is not str: return None
+                        text = value.strip()
+                        number = int(text)
+                        if text[0] == '+':
+                            signs |= 1 << idx
+                            if text != f'+{number}': return None
+                        elif text != str(number):
+                            return None
+                        values[idx] = number
+                    mask |= 4 << idx
+                elif name == '체결시간':
+                    if type(value) is not str or len(value) != 6: return None
+                    hhmmss = int(value)
+                    mask |= 1
+                elif name == '등락율':
+                    if type(value) is not str: return None
+                    text = value.strip()
+                    rate = float(text)
+                    digits = len(text) - text.index('.') - 1 if '.' in text else 0
+                    plus = text[0] == '+'
+                    if digits > 15 or text != f"{'+' if plus else ''}{rate:.{digits}f}": return None
+                    signs |= (self.RATE_PLUS if plus else 0) | (digits << self.RATE_DIGITS_SHIFT)
+                    mask |= 2
+                else:
+                    return None
+        except (TypeError, ValueError, IndexError):
+            return None
+        return hhmmss, mask, signs, rate, values
+
+    def put(self, code, fid, sent_at=None):
+        encoded = self._encode(fid)
+        code_bytes = code.encode() if type(code) is str else b''
+        if encoded is None or not code_bytes or len(code_bytes) > 8:
+            self.stats['unsupported'] += 1
+            return None
+        hhmmss, mask, signs, rate, values = encoded
+        with self._lock:
+            seq = self._write_seq
+            if seq - self.SEQ.unpack_from(self.buf, 64)[0] >= self.capacity:
+                self.stats['full'] += 1
+                return False
+            self.SLOT.pack_into(self.buf, self.HEADER_SIZE + (seq % self.capacity) * self.SLOT.size,
+                                code_bytes, hhmmss, mask, signs, sent_at or time.time(), rate, *values)
+            self._write_seq = seq + 1
+            self.SEQ.pack_into(self.buf, 0, seq + 1)  # 슬롯 기록 후 순번 공개
+            self.stats['put'] += 1
+        if self.SEQ.unpack_from(self.buf, 128)[0]:
+            self.doorbell.set()
+        return True
+
+    def has_data(self):
+        return self.SEQ.unpack_from(self.buf, 0)[0] != self._read_seq
+
+    def wait(self, timeout):
+        """받는 쪽: 자료가 생길 때까지 대기 (있으면 True)"""
+        if self.has_data(): return True
+        self.SEQ.pack_into(self.buf, 128, 1)
+        try:
+            if not self.has_data():
+                self.doorbell.wait(timeout)
+                self.doorbell.clear()
+        finally:
+            self.SEQ.pack_into(self.buf, 128, 0)
+        return self.has_data()
+
+    def read_batch(self, max_count=None):
+        """받는 쪽: 쌓인 체결을 한 번에 꺼내 [(code, dictFID), ...] 반환 (값은 큐 경로와 같은 문자열)"""
+        seq = self._read_seq
+        count = min(self.SEQ.unpack_from(self.buf, 0)[0] - seq, max_count or self.capacity)
+        if count <= 0: return []
+        now = time.time()
+        ticks = []
+        for pos in range(seq, seq + count):
+            code, hhmmss, mask, signs, sent_at, rate, *values = self.SLOT.unpack_from(self.buf, self.HEADER_SIZE + (pos % self.capacity) * self.SLOT.size)
+            fid = {}
+            if mask & 1: fid['체결시간'] = f'{hhmmss:06d}'
+            if mask & 2:
+                fid['등락율'] = f"{'+' if signs & self.RATE_PLUS else ''}{rate:.{signs >> self.RATE_DIGITS_SHIFT}f}"
+            for idx, name in enumerate(self.INT_FIELDS):
+                if mask & (4 << idx):
+                    if name[0] == '_': fid[name] = values[idx]
+                    elif signs & (1 << idx): fid[name] = f'+{values[idx]}'
+                    else: fid[name] = str(values[idx])
+            ticks.append((code.rstrip(b'\0').decode(), fid))
+            self.latency.append(now - sent_at)
+        self._read_seq = seq + count
+        self.SEQ.pack_into(self.buf, 64, seq + count)  # 슬롯을 다 읽은 후 반환
+        self.stats['read'] += count
+        self.stats['batches'] += 1
+        if count > self.stats['max_batch']:
+            self.stats['max_batch'] = count
+        return ticks
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['backlog'] = self.SEQ.unpack_from(self.buf, 0)[0] - self.SEQ.unpack_from(self.buf, 64)[0]
+        if self.latency:
+            samples = sorted(self.latency)
+            stats['latency_p50_ms'] = samples[len(samples) // 2] * 1000
+            stats['latency_p99_ms'] = samples[int(len(samples) * 0.99)] * 1000
+        return stats
+
+    def close(self):
+        """공유메모리 해제 (만든 프로세스에서 unlink)"""
+        self.buf = None
+        try:
+            self.shm.close()
+            if self.owner: self.shm.unlink()
+        except Exception as e:
+            logging.debug(f'TickRing 해제 실패: {e}')
+
+class ConflatingQueue(SharedQueue):
+    """
+    실시간 체결 전용 큐 - 버리지 않고 종목별로 병합
+
+    - 큐(maxsize)가 차면 실시간 체결은 (종목, 실시간타입, 체결 분) 단위로 보내는 쪽 프로세스에 모아 병합
+      병합 대기분 뒤에 다른 메시지가 들어왔으면 그 뒤로 새 병합 대기분을 엶 (앞선 메시지를 앞지르지 않음)
+      현재가/누적값은 최신값, 거래대금은 합산, 구간 시가/고가/저가는 _open/_high/_low로 전달
+      거래량은 매수/매도 체결량을 _buy_volume/_sell_volume으로 따로 합산하고, 거래량에는 전체 합계에 많은 쪽 부호
+    - 병합분은 다음 put_request 또는 flush()(모델 루프에서 호출) 때 들어온 순서대로 전송
+    - 실시간 체결 외 메시지(조건검색 편입/이탈 등)는 큐가 차면 기다리지 않고 대기열 뒤에 보관 (보내는 쪽 이벤트 쓰레드를 막지 않음)
+    - 대기열이 RCV_PENDING_MAX를 넘을 때만 버리고 집계
+    - attach_ring()으로 TickRing을 붙이면 실시간 체결은 링으로 전송 (링이 차면 위와 같이 병합 대기)
+      링으로 간 체결과 큐로 간 메시지 사이의 도착 순서는 보장하지 않음 (TickRing 참고)
+    """
+    CONFLATE_METHOD = 'on_receive_real_data'
+    SUM_FIELDS = ('거래대금',)
+
+    def __init__(self, maxsize=None):
+        import multiprocessing as mp
+        self.request = mp.Queue(maxsize or dc.RCV_QUEUE_MAX)
+        self.result = mp.Queue()
+        self.maxlen = None
+        self.ring = None
+        self._init_local()
+
+    def attach_ring(self, ring):
+        """실시간 체결 전송용 TickRing 연결 (보내는 프로세스 시작 전에 호출)"""
+        self.ring = ring
+
+    def _init_local(self):
+        """프로세스별 상태 (피클로 넘어가지 않음)"""
+        import threading
+        self._lock = threading.Lock()
+        self._pending = {}  # {(code, rtype, HHMM, seq) 또는 ('_seq', n): QData} 전송 대기 (입력 순서 유지)
+        self._seq = 0  # 대기열에 넣은 체결 외 메시지 수 - 체결 병합 키에 붙여 그 뒤로는 새 병합 대기분을 엶
+        self.stats = {'sent': 0, 'conflated': 0, 'deferred': 0, 'dropped': 0, 'max_pending': 0}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('_lock', '_pending', 'stats'):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_local()
+
+    def _conflation_key(self, item):
+        if type(item) is not QData or item.method != 'proxy_method' or not item.args:
+            return None
+        work = item.args[0]
+        if type(work) is not QWork or work.method != self.CONFLATE_METHOD or len(work.args) < 3:
+            return None
+        code, rtype, fid = work.args[:3]
+        return (code, rtype, str(fid.get('체결시간', '')).strip()[:-2])
+
+    @staticmethod
+    def _split_volume(fid):
+        """(매수 체결량, 매도 체결량) - 병합된 체결은 따로 모아 둔 합계, 아니면 거래량 부호로"""
+        if '_buy_volume' in fid:
+            return fid['_buy_volume'], fid['_sell_volume']
+        volume = int(fid.get('거래량') or 0)
+        return (volume, 0) if volume >= 0 else (0, -volume)
+
+    def _merge(self, pending, item):
+        """병합 대기 메시지에 새 체결 합치기 (최신값 우선, 거래량/거래대금 합산, 구간 시가/고가/저가 유지)"""
+        old_work, new_work = pending.args[0], item.args[0]
+        old_fid, new_fid = old_work.args[2], new_work.args[2]
+        merged = dict(new_fid)
+        for field_name in self.SUM_FIELDS:
+            if field_name in old_fid or field_name in new_fid:
+                merged[field_name] = str(int(old_fid.get(field_name) or 0) + int(new_fid.get(field_name) or 0))
+        if '거래량' in old_fid or '거래량' in new_fid:
+            # 거래량 부호(+매수/-매도 체결)는 매수/매도 합계로 따로 유지 - 거래량은 전체 합계에 많은 쪽 부호
+            buy, sell = self._split_volume(old_fid)
+            new_buy, new_sell = self._split_volume(new_fid)
+            buy, sell = buy + new_buy, sell + new_sell
+            merged['_buy_volume'], merged['_sell_volume'] = buy, sell
+            merged['거래량'] = f"{'+' if buy >= sell else '-'}{buy + sell}"
+        old_price = abs(int(old_fid.get('현재가') or 0))
+        new_price = abs(int(new_fid.get('현재가') or 0))
+        merged['_open'] = old_fid.get('_open', old_price)
+        merged['_high'] = max(old_fid.get('_high', old_price), new_price)
+        merged['_low'] = min(old_fid.get('_low', old_price), new_price)
+        merged['_conflated'] = old_fid.get('_conflated', 1) + 1
+        old_work.args = (*new_work.args[:2], merged, *new_work.args[3:])
+        pending.sent_at = item.sent_at
+
+    def _send_nowait(self, item, key):
+        """대기 없이 전송 (실시간 체결은 링 우선, 링 레이아웃에 없는 체결은 큐로)"""
+        import queue
+        if key is not None and self.ring is not None and key[1] == TickRing.RTYPE:
+            work = item.args[0]
+            sent = self.ring.put(work.args[0], work.args[2], item.sent_at)
+            if sent is not None:
+                return sent
+        try:
+            self.request.put_nowait(item)
+        except queue.Full:
+            return False
+        return True
+
+    def _flush_locked(self):
+        while self._pending:
+            key = next(iter(self._pending))
+            if not self._send_nowait(self._pending[key], None if key[0] == '_seq' else key):
+                return False
+            del self._pending[key]
+            self.stats['sent'] += 1
+        return True
+
+    def flush(self):
+        """병합 대기분 전송 (모델 루프에서 주기적으로 호출)"""
+        if self._pending:
+            with self._lock:
+                self._flush_locked()
+
+    def put_request(self, item):
+        if type(item) is QData:
+            item.sent_at = time.time()
+        key = self._conflation_key(item)
+
+        with self._lock:
+            flushed = self._flush_locked() if self._pending else True
+            if key is not None:
+                key = (*key, self._seq)  # 마지막 체결 외 메시지 뒤의 병합 대기분에만 합침
+                if key in self._pending:
+                    self._merge(self._pending[key], item)
+                    self.stats['conflated'] += 1
+                    return
+            if flushed and self._send_nowait(item, key):
+                self.stats['sent'] += 1
+                return
+
+            if len(self._pending) >= dc.RCV_PENDING_MAX:
+                self.stats['dropped'] += 1
+                logging.warning(f"ConflatingQueue 대기열 초과({dc.RCV_PENDING_MAX}), 요청 버림: {getattr(item, 'method', item)}")
+                return
+            if key is None:
+                self._seq += 1
+                key = ('_seq', self._seq)
+            self._pending[key] = item  # 순서 유지를 위해 앞선 대기분 뒤에 보관
+            self.stats['deferred'] += 1
+            if len(self._pending) > self.stats['max_pending']:
+                self.stats['max_pending'] = len(self._pending)
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats['pending'] = len(self._pending)
+        return stats
+
 class FIDs:             # 실시간 조회 필드 아이디
     거래구분 = {
         '지정가': '00',
@@ -356,6 +852,7 @@ class FilePath:         # 파일 경로
     DB_PATH = 'C:/Liberanimo/db'
     SCRIPT_PATH = 'script'
     CACHE_PATH = 'script/compiled_scripts'
+    BULK_PATH = 'bulk'
     CONFIG_PATH = 'config'
     RESOURCE_PATH = 'resources'
     API_PATH = "C:/OpenAPI/data"
@@ -382,6 +879,7 @@ class FilePath:         # 파일 경로
     functions_file = os.path.join(get_path(SCRIPT_PATH), FUNCTIONS_FILE)
     image_file = os.path.join(get_path(IMAGE_PATH), "Liberanimo_only.png")
     cache_path = os.path.join(get_path(CACHE_PATH))
+    bulk_path = os.path.join(get_path(BULK_PATH))
 
 class Constants:        # 상수 정의
     tax_rate = 0.0015   # 0.15%
@@ -592,6 +1090,15 @@ class DefineConstants:  # 글로벌 상수 정의
         self.INTERVAL_SLOW = 0.05
         self.INTERVAL_BATCH = 0.011
         self.INTERVAL_GUI = 199 #milliseconds
+        self.EVAL_POOL_WORKERS = 2 # 스크립트 평가 풀 워커 프로세스 수 ('pool' 인수로 실행 시)
+        self.QUEUE_BATCH_MAX = 200 # 모델 루프 1회에 꺼내 처리할 최대 메시지 수
+        self.RCV_QUEUE_MAX = 1000  # 실시간 수신 큐 최대 길이 (넘치면 종목별 병합)
+        self.RCV_PENDING_MAX = 5000 # 실시간 수신 보내는 쪽 대기열 최대 (넘으면 버림)
+        self.TICK_RING_SIZE = 16384 # 실시간 체결 공유메모리 링 슬롯 수 ('ring' 인수로 실행 시)
+        self.BULK_ROWS_MIN = 2000   # 이 행 수 이상인 결과는 큐 대신 임시 파일(BulkRef)로 전달
+        self.BULK_CHUNK_ROWS = 5000 # 임시 파일 청크당 행 수
+        self.IPC_BYTES_SAMPLE = 100   # 보낸 메시지 N건마다 1건 피클 크기 측정
+        self.IPC_DUMP_INTERVAL = 300  # 모델별 IPC 지표 로그 출력 주기 (초, 0이면 출력 안 함)
         self.TODAY = datetime.now().strftime('%Y-%m-%d')
         self.ToDay = datetime.now().strftime('%Y%m%d')
         self.BEFORE_TEN_YEARS = (datetime.now() - timedelta(days=3650)).strftime('%Y-%m-%d')
@@ -666,6 +1173,12 @@ class GlobalMemory:      # 글로벌 메모리 정의
         self.odc = None
         self.odr = None # 주문 결과 처리
         self.scm = None # 스크립트 매니저
+        self.scp = None # 스크립트 평가 풀 (ScriptEvalPool, 선택)
+        self.eval_pool_on = False
+        self.tkr = None # TickReader (공유메모리 링 받는 쪽)
+        self.tick_ring = None # TickRing
+        self.tick_ring_on = False
+        self.master = None # MasterCache (종목명/전일가)
 
         self.price_q = None    # ThreadSafeQueue()
         self.eval_q = None # ThreadSafeQueue()
@@ -691,7 +1204,7 @@ class GlobalMemory:      # 글로벌 메모리 정의
             'api': SharedQueue(),
             'dbm': SharedQueue(),
             'prx': SharedQueue(),
-            'rcv': SharedQueue(maxlen=3),
+            'rcv': ConflatingQueue(),
         }
 
         self.잔고합산 = None # TableManager
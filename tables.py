@@ -1,6 +1,513 @@
 from public import dc, gm
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from types import MappingProxyType
+from collections import deque
+from collections.abc import MutableMapping
+from itertools import count, islice
 import threading
+from operator import gt, lt, ge, le, eq, ne
+from contextlib import contextmanager
 import copy
+import time
+
+_IMMUTABLE_TYPES = (int, float, str, bool, bytes, type(None))
+
+def _copy_row(row):
+    """행 복사 - 값이 모두 불변(숫자/문자열)이면 얕은 복사로 충분 (deepcopy와 결과 같음)"""
+    if type(row) is not dict:
+        row = dict(row)  # 컬럼형 행은 값을 한 번만 꺼냄
+    for value in row.values():
+        if type(value) not in _IMMUTABLE_TYPES:
+            return copy.deepcopy(row)
+    return dict(row)
+
+_COMPARE_OPS = {'>': gt, '<': lt, '>=': ge, '<=': le, '==': eq, '!=': ne}
+
+_READ_RETRIES = 3  # 락 없는 읽기 재시도 횟수 (넘으면 테이블 락으로 읽음)
+_CHANGE_LOG_SIZE = 20000  # 변경 기록 길이 (밀려나면 모델은 전체를 다시 읽음)
+
+class _SharedLock:
+    """
+    공유/배타 락 - with 문은 배타 (같은 쓰레드 재진입 가능), acquire_shared/release_shared는 공유
+    배타 대기 중이면 새 공유는 기다림 (틱마다 들어오는 행 쓰기 때문에 구조 변경이 굶지 않도록)
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._owner = None
+        self._depth = 0
+        self._shared = 0
+        self._waiting = 0
+
+    def __enter__(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return self
+            self._waiting += 1
+            while self._owner is not None or self._shared:
+                self._cond.wait()
+            self._waiting -= 1
+            self._owner, self._depth = me, 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._depth -= 1
+            if not self._depth:
+                self._owner = None
+                self._cond.notify_all()
+
+    def acquire_shared(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner != me:
+                while self._owner is not None or self._waiting:
+                    self._cond.wait()
+            self._shared += 1
+
+    def release_shared(self):
+        with self._cond:
+            self._shared -= 1
+            if not self._shared:
+                self._cond.notify_all()
+
+class _RowWrites:
+    """
+    행 단위 쓰기 줄무늬 락과 쓰기 진행 표시
+    쓰기는 begin/end로 감싸고, 락 없는 읽기는 읽기 전후로 active/seq를 비교해 겹친 쓰기가 있었는지 확인
+    """
+    STRIPES = 32
+
+    def __init__(self):
+        self.stripes = [threading.Lock() for _ in range(self.STRIPES)]
+        self.lock = threading.Lock()  # active/seq, 행 쓰기끼리 공유하는 인덱스/집계 갱신
+        self.active = 0  # 진행 중인 쓰기 수
+        self.seq = 0     # 끝난 쓰기 수 (= 테이블 변경 버전)
+        self.retries = 0
+        self.fallbacks = 0
+
+    def stripe(self, key):
+        return self.stripes[hash(key) % self.STRIPES]
+
+    def begin(self):
+        with self.lock:
+            self.active += 1
+
+    def end(self):
+        # seq를 먼저 올려야 active가 0으로 보일 때 이미 바뀐 버전이 보임
+        with self.lock:
+            self.seq += 1
+            self.active -= 1
+
+    @contextmanager
+    def writing(self):
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end()
+
+def _match_value(item_value, value):
+    """값 하나가 조건에 맞는지 (_compile_filter와 같은 규칙, '@컬럼' 참조 제외)"""
+    if isinstance(item_value, str) and isinstance(value, str):
+        return value in item_value
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        op, compare_value = value
+        if op not in _COMPARE_OPS:
+            return False
+        try:
+            return bool(_COMPARE_OPS[op](item_value, compare_value))
+        except (TypeError, ValueError):
+            return False
+    return item_value == value
+
+_FILTER_CACHE_SIZE = 256  # 캐시할 필터 모양 수 (넘으면 비우고 다시 만듦)
+_filter_cache = {}
+_filter_stats = {'hits': 0, 'misses': 0}
+
+def _filter_shape(conditions):
+    """
+    필터 모양과 조건값 분리 - 모양이 같으면 값만 달라도 같은 검사 함수를 씀
+    모양: ((컬럼, 종류, 연산자, 참조 컬럼), ...)  종류: 'str' 포함/일치, 'eq' 일치, 'cmp' 비교, 'ref' 컬럼 간 비교
+    """
+    shape, params = [], []
+    for column, value in conditions.items():
+        if isinstance(value, str):
+            shape.append((column, 'str', None, None))
+            params.append(value)
+        elif isinstance(value, (list, tuple)) and len(value) == 2:
+            op, compare_value = value
+            if isinstance(compare_value, str) and compare_value.startswith('@'):
+                shape.append((column, 'ref', op, compare_value[1:]))
+            else:
+                shape.append((column, 'cmp', op, None))
+                params.append(compare_value)
+        else:
+            shape.append((column, 'eq', None, None))
+            params.append(value)
+    return tuple(shape), params
+
+def _build_filter(shape):
+    """필터 모양 하나를 검사 함수 생성기로 컴파일 - 조건값만 넣으면 행 검사 함수가 나옴"""
+    names = {}
+    def name_of(column):
+        return names.setdefault(column, f'c{len(names)}')
+    lines, param = [], 0
+    for column, kind, op, other in shape:
+        if kind in ('cmp', 'ref') and op not in _COMPARE_OPS:
+            lines = ['        return False']  # 모르는 연산자는 어떤 행도 맞지 않음
+            break
+        lines += ['        try:', f'            x = row[{name_of(column)}]']
+        if kind == 'ref':
+            lines.append(f'            y = row[{name_of(other)}]')
+        lines += ['        except KeyError:', '            return False']
+        if kind == 'str':
+            lines += ['        if isinstance(x, str):',
+                      f'            if v{param} not in x:',
+                      '                return False',
+                      f'        elif x != v{param}:',
+                      '            return False']
+        elif kind == 'eq':
+            lines += [f'        if x != v{param}:', '            return False']
+        else:
+            target = 'y' if kind == 'ref' else f'v{param}'
+            lines += ['        try:',
+                      f'            if not (x {op} {target}):',
+                      '                return False',
+                      '        except (TypeError, ValueError):',
+                      '            return False']
+        if kind != 'ref':
+            param += 1
+    else:
+        lines.append('        return True')
+    args = ', '.join(f'v{i}' for i in range(sum(kind != 'ref' for _, kind, _, _ in shape)))
+    source = '\n'.join([f'def make({args}):', '    def match(row):', *lines, '    return match'])
+    namespace = {name: column for column, name in names.items()}
+    exec(source, namespace)
+    return namespace['make']
+
+def _compile_filter(conditions):
+    """
+    필터 사전 -> 행 검사 함수 match(row) -> bool
+    모양별로 한 번만 컴파일해서 캐시하고, 호출마다 조건값만 묶음
+    """
+    shape, params = _filter_shape(conditions)
+    try:
+        make = _filter_cache[shape]
+        _filter_stats['hits'] += 1
+    except KeyError:
+        _filter_stats['misses'] += 1
+        make = _build_filter(shape)
+        if len(_filter_cache) >= _FILTER_CACHE_SIZE:
+            _filter_cache.clear()
+        _filter_cache[shape] = make
+    return make(*params)
+
+def get_filter_cache_stats():
+    """필터 컴파일 캐시 통계 - 캐시된 모양 수, 재사용/컴파일 횟수"""
+    return {'shapes': len(_filter_cache), **_filter_stats}
+
+class ColumnRow(MutableMapping):
+    """컬럼형 저장소의 한 행 - 행 번호만 갖고 값은 저장소 배열에서 읽고 씀 (dict처럼 사용)"""
+    __slots__ = ('_store', '_rid')
+
+    def __init__(self, store, rid):
+        self._store = store
+        self._rid = rid
+
+    def __getitem__(self, column):
+        if column not in self._store.kinds:
+            raise KeyError(column)
+        return self._store.get(self._rid, column)
+
+    def get(self, column, default=None):
+        if column not in self._store.kinds:
+            return default
+        return self._store.get(self._rid, column)
+
+    def __setitem__(self, column, value):
+        if column not in self._store.kinds:
+            raise KeyError(column)
+        self._store.put(self._rid, column, value)
+
+    def __delitem__(self, column):
+        raise TypeError('컬럼형 행의 컬럼은 삭제할 수 없습니다.')
+
+    def __contains__(self, column):
+        return column in self._store.kinds
+
+    def __iter__(self):
+        return iter(self._store.columns)
+
+    def __len__(self):
+        return len(self._store.columns)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    # 복사/피클은 저장소가 아니라 값 사전으로
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+class ColumnStore:
+    """
+    컬럼형 저장소 - 정수/실수 컬럼은 numpy 배열, 그 외 컬럼은 사전 부호화 (값 번호 배열 + 값 목록)
+    행 번호는 추가 순서대로 늘고 재사용하지 않으므로 행 번호 순서 = 테이블 행 순서
+    삭제는 alive 표시만 하고, 삭제된 행이 많아지면 compact (ColumnRow 객체는 그대로, 행 번호만 바뀜)
+    정수 컬럼에 정수가 아닌 값이 들어오면 그 컬럼은 사전 부호화로 바꿈
+    """
+    COMPACT_MIN = 1024  # 삭제된 행이 이보다 많고 살아있는 행보다 많으면 compact
+
+    def __init__(self, columns, int_columns, float_columns):
+        import numpy as np
+        self.np = np
+        self.columns = list(columns)
+        self._int_columns = set(int_columns)
+        self._float_columns = set(float_columns)
+        self._lock = threading.Lock()  # 값 목록 추가/배열 확장/컬럼 변환 (행 단위 쓰기끼리)
+        self.clear()
+
+    def clear(self, capacity=64):
+        np = self.np
+        self.kinds = {column: 'int' if column in self._int_columns else 'float' if column in self._float_columns else 'obj'
+                      for column in self.columns}
+        self.size = 0  # 쓴 행 번호 수 (삭제 포함)
+        self.live = 0
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.arrays = {column: np.zeros(capacity, dtype=self._dtype(kind)) for column, kind in self.kinds.items()}
+        self.values = {column: [] for column, kind in self.kinds.items() if kind == 'obj'}
+        self.codes = {column: {} for column, kind in self.kinds.items() if kind == 'obj'}
+        self.rows = []  # 행 번호 -> ColumnRow
+
+    def _dtype(self, kind):
+        np = self.np
+        return np.int64 if kind == 'int' else np.float64 if kind == 'float' else np.int32
+
+    def _grow(self):
+        np = self.np
+        capacity = len(self.alive) * 2
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.size] = self.alive[:self.size]
+        arrays = {}
+        for column, array in self.arrays.items():
+            arrays[column] = np.zeros(capacity, dtype=array.dtype)
+            arrays[column][:self.size] = array[:self.size]
+        # 배열은 통째로 바꿔 끼움 - 락 없이 읽던 쪽은 이전 배열을 보고, 쓰기 확인에서 다시 읽음
+        self.arrays, self.alive = arrays, alive
+
+    def _encode(self, column, value):
+        codes = self.codes[column]
+        try:
+            # 문자열은 값 그대로, 그 외는 1 / 1.0 / True 가 섞이지 않게 형식을 붙여 키로 씀
+            key = value if type(value) is str else (type(value), value)
+            code = codes.get(key)
+        except TypeError:  # 해시 불가 값은 매번 새 번호
+            key = code = None
+        if code is None:
+            with self._lock:
+                code = codes.get(key) if key is not None else None
+                if code is None:
+                    values = self.values[column]
+                    code = len(values)
+                    values.append(value)
+                    if key is not None:
+                        codes[key] = code
+        return code
+
+    def _promote(self, column):
+        """정수/실수 컬럼을 사전 부호화 컬럼으로 (배열에 넣을 수 없는 값이 들어왔을 때)"""
+        with self._lock:
+            if self.kinds[column] == 'obj':
+                return
+            old = self.arrays[column][:self.size].tolist()
+            self.values[column], self.codes[column] = [], {}
+            self.kinds[column] = 'obj'
+            array = self.np.zeros(len(self.alive), dtype=self.np.int32)
+        for rid, value in enumerate(old):
+            array[rid] = self._encode(column, value)
+        self.arrays[column] = array
+
+    def get(self, rid, column):
+        if self.kinds[column] == 'obj':
+            return self.values[column][self.arrays[column][rid]]
+        return self.arrays[column].item(rid)
+
+    def put(self, rid, column, value):
+        kind = self.kinds[column]
+        if kind != 'obj':
+            if type(value) is (int if kind == 'int' else float):
+                try:
+                    self.arrays[column][rid] = value
+                    return
+                except OverflowError:
+                    pass
+            self._promote(column)
+        self.arrays[column][rid] = self._encode(column, value)
+
+    def add(self, values):
+        """행 추가 (구조 변경 - 테이블 배타 락 안에서) -> ColumnRow"""
+        rid = self.size
+        if rid == len(self.alive):
+            self._grow()
+        for column in self.columns:
+            self.put(rid, column, values.get(column, ''))
+        self.alive[rid] = True
+        self.size += 1
+        self.live += 1
+        row = ColumnRow(self, rid)
+        self.rows.append(row)
+        return row
+
+    def free(self, row):
+        """행 삭제 (구조 변경 - 테이블 배타 락 안에서)"""
+        if self.alive[row._rid]:
+            self.alive[row._rid] = False
+            self.live -= 1
+        dead = self.size - self.live
+        if dead > self.COMPACT_MIN and dead > self.live:
+            self._compact()
+
+    def _compact(self):
+        np = self.np
+        keep = np.flatnonzero(self.alive[:self.size])
+        capacity = max(64, len(keep) * 2)
+        arrays = {}
+        for column, array in self.arrays.items():
+            arrays[column] = np.zeros(capacity, dtype=array.dtype)
+            arrays[column][:len(keep)] = array[keep]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(keep)] = True
+        rows = [self.rows[rid] for rid in keep.tolist()]
+        for rid, row in enumerate(rows):
+            row._rid = rid
+        self.arrays, self.alive, self.rows = arrays, alive, rows
+        self.size = self.live = len(keep)
+
+    def mask(self, conditions=None):
+        """조건에 맞는 살아있는 행 표시 배열 - 배열 연산으로 못 하는 조건이면 None"""
+        np = self.np
+        size = self.size
+        mask = self.alive[:size].copy()
+        for column, value in (conditions or {}).items():
+            kind = self.kinds.get(column)
+            if kind is None:
+                mask[:] = False
+                continue
+            array = self.arrays[column][:size]
+            is_pair = isinstance(value, (list, tuple)) and len(value) == 2
+            if kind == 'obj':
+                if is_pair and isinstance(value[1], str) and value[1].startswith('@'):
+                    return None
+                # 값 종류마다 한 번만 비교해서 번호 배열로 펼침
+                values = self.values[column]
+                matched = np.fromiter((_match_value(item_value, value) for item_value in values), dtype=bool, count=len(values))
+                mask &= matched[array]
+            elif is_pair:
+                op, compare_value = value
+                if op not in _COMPARE_OPS:
+                    mask[:] = False
+                elif isinstance(compare_value, str) and compare_value.startswith('@'):
+                    other_kind = self.kinds.get(compare_value[1:])
+                    if other_kind is None:
+                        mask[:] = False
+                    elif other_kind == 'obj':
+                        return None
+                    else:
+                        mask &= _COMPARE_OPS[op](array, self.arrays[compare_value[1:]][:size])
+                elif isinstance(compare_value, (int, float)):
+                    mask &= _COMPARE_OPS[op](array, compare_value)
+                else:
+                    return None
+            elif isinstance(value, (int, float)):
+                mask &= array == value
+            elif isinstance(value, str):
+                mask[:] = False  # 숫자 컬럼과 문자열은 같을 수 없음
+            else:
+                return None
+        return mask
+
+    def filter_rows(self, conditions):
+        mask = self.mask(conditions)
+        if mask is None:
+            return None
+        rows = self.rows
+        return [rows[rid] for rid in self.np.flatnonzero(mask).tolist()]
+
+    def count(self, conditions=None):
+        mask = self.mask(conditions)
+        return None if mask is None else int(mask.sum())
+
+    def sum(self, columns, conditions=None):
+        """컬럼 합계 튜플 (숫자 아닌 컬럼은 0) - 배열 연산으로 못 하면 None"""
+        mask = self.mask(conditions)
+        if mask is None:
+            return None
+        result = []
+        for column in columns:
+            kind = self.kinds.get(column)
+            if kind == 'obj' and (column in self._int_columns or column in self._float_columns):
+                return None  # 사전 부호화로 바뀐 숫자 컬럼
+            if kind in ('int', 'float'):
+                total = self.arrays[column][:self.size][mask].sum()
+                result.append(int(total) if kind == 'int' else float(total))
+            else:
+                result.append(0)
+        return tuple(result)
+
+    def to_dicts(self, conditions=None):
+        """조건에 맞는 행들을 사전 리스트로 (컬럼 단위로 꺼내 한 번에 조립) - 배열 연산으로 못 하면 None"""
+        mask = self.mask(conditions)
+        if mask is None:
+            return None
+        columns = []
+        for column in self.columns:
+            array = self.arrays[column][:self.size][mask].tolist()
+            if self.kinds[column] == 'obj':
+                values = self.values[column]
+                array = [values[code] for code in array]
+                if any(type(value) not in _IMMUTABLE_TYPES for value in values):
+                    array = [copy.deepcopy(value) for value in array]
+            columns.append(array)
+        names = self.columns
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def column_values(self, column, conditions=None):
+        mask = self.mask(conditions)
+        if mask is None or column not in self.kinds:
+            return None
+        array = self.arrays[column][:self.size][mask]
+        if self.kinds[column] == 'obj':
+            values = self.values[column]
+            return [values[code] for code in array.tolist()]
+        return array.tolist()
+
+    def to_frame(self):
+        """pandas DataFrame (컬럼 배열에서 바로)"""
+        import pandas as pd
+        mask = self.alive[:self.size]
+        data = {}
+        for column in self.columns:
+            array = self.arrays[column][:self.size][mask]
+            if self.kinds[column] == 'obj':
+                values = self.values[column]
+                data[column] = [values[code] for code in array.tolist()]
+            else:
+                data[column] = array.copy()
+        return pd.DataFrame(data, columns=self.columns)
+
+    def memory_bytes(self):
+        """배열 + 값 목록 대략 크기"""
+        import sys
+        total = sum(array.nbytes for array in self.arrays.values()) + self.alive.nbytes
+        total += sum(sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values) for values in self.values.values())
+        return total + sys.getsizeof(self.rows) + sum(sys.getsizeof(row) for row in self.rows)
 
 class TableColumns:     # 테이블 데이타 컬럼 정의
     hd잔고합산 = {
@@ -24,6 +531,7 @@ class TableColumns:     # 테이블 데이타 컬럼 정의
     hd잔고목록.update({
         '헤더': hd잔고목록['컬럼'] + ["매수일자", "매수시간", '등락율', '누적거래량', '주문가능수량'],
         '확장': hd잔고목록['컬럼'] + hd잔고목록['추가'],
+        '집계': ['매입금액', '평가금액', '평가손익', '보유수량'],
     })
 
     hd조건목록 = {
@@ -48,6 +556,7 @@ class TableColumns:     # 테이블 데이타 컬럼 정의
         '실수': [],
         '컬럼': ['종목코드', '구분', '상태', '종목명', '주문번호', '주문가격', '주문수량', '체결수량', '미체결수량', '주문가능수량', '요청명', '비고'],
         '헤더': ['구분', '상태', '종목코드', '종목명', '주문가격', '주문수량', '체결수량', '미체결수량', '주문가능수량', '비고'],
+        '인덱스': ['종목코드', '상태', '주문번호', '요청명'],
     }
 
     hd매매목록 = {
@@ -55,7 +564,8 @@ class TableColumns:     # 테이블 데이타 컬럼 정의
         '정수': ['현재가', '주문수량', '주문가격', '미체결수량', '체결량', '체결가', '체결누계금액'],
         '실수': [],
         '컬럼': [ '처리시간', '주문구분', '주문상태', '종목코드', '종목명', '주문수량', '주문가격', '미체결수량', '체결량', '체결가', '체결누계금액',\
-                '매매구분', '주문번호', '원주문번호', '전략명칭']
+                '매매구분', '주문번호', '원주문번호', '전략명칭'],
+        '컬럼형': True,
     }
 
     hd예수금 = {
@@ -95,6 +605,7 @@ class TableColumns:     # 테이블 데이타 컬럼 정의
         '실수': ['손익율'],
         '컬럼': ['매수일자', '매수시간', '매도시간', '종목번호', '종목명', '매수수량', '매수가', '매도가', '손익금액', '손익율', '매도수량', \
                         '매수금액', '매도금액', '제비용', '매도일자', '매수번호', '매도번호', '매수전략', '전략명칭'],
+        '컬럼형': True,
     }
 
     hd전략정의 = {
@@ -115,7 +626,8 @@ class TableColumns:     # 테이블 데이타 컬럼 정의
             ['종목코드', '시간', '시가', '고가', '저가', '현재가', '거래량', '거래대금', '비고'],
             ['종목코드', '종목명', '시가', '고가', '저가', '현재가', '거래량', '거래대금', '비고'],
             ['종목코드', '일자', '시간', '시가', '고가', '저가', '현재가', '거래량', '거래대금', '비고'],
-        ]
+        ],
+        '컬럼형': True,
     }
 
     hd스크립트 = {
@@ -136,6 +648,250 @@ class TableColumns:     # 테이블 데이타 컬럼 정의
 
 tbl = TableColumns()
 
+
+class TableModel(QAbstractTableModel):
+    """
+    테이블 관리자 화면 모델 (QTableView) - 행은 테이블의 행 객체를 그대로 참조 (복사 없음)
+    sync()가 테이블 변경 기록에서 이후 변경만 읽어 바뀐 셀은 dataChanged, 행 추가/삭제는 insert/removeRows로 반영
+    정렬은 QSortFilterProxyModel (UserRole = 원래 값) 에서
+    """
+    def __init__(self, table, columns, parent=None):
+        super().__init__(parent)
+        self.table = table
+        self.columns = list(columns)
+        self._column_index = {column: idx for idx, column in enumerate(self.columns)}
+        self._numeric = {column for column in self.columns if column in table.int_columns or column in table.float_columns}
+        self.rows = []
+        self._positions = None  # {id(행): 행 번호} - 행 추가/삭제 때 무효화
+        self.seq = 0
+        self.reset()
+
+    def reset(self):
+        """전체 다시 읽기 - 행 목록과 마지막 변경 순번을 같은 스냅샷에서"""
+        table = self.table
+        self.beginResetModel()
+        self.seq, self.rows = table._read(lambda: (table.changes[-1][0] if table.changes else 0, list(table.data)))
+        self._positions = None
+        self.endResetModel()
+
+    def sync(self):
+        """변경 기록 반영 - 행 추가/삭제/전체 갱신이 있었으면 True"""
+        log = self.table.changes
+        try:
+            first, last = log[0][0], log[-1][0]
+        except IndexError:
+            return False
+        if last <= self.seq:
+            return False
+        # 순번이 연속이므로 이후 기록만 잘라 옴 (그 사이 앞쪽이 밀려났으면 전체 다시 읽기)
+        changes = list(islice(log, max(0, self.seq + 1 - first), None))
+        if not changes or changes[0][0] != self.seq + 1:
+            self.reset()
+            return True
+        structural = False
+        dirty = {}  # {id(행): (행, {컬럼 번호})}
+        for seq, op, item, column in changes:
+            if op == 'set':
+                col = self._column_index.get(column)
+                if col is not None:
+                    dirty.setdefault(id(item), (item, set()))[1].add(col)
+            elif op == 'reset':
+                self.reset()
+                return True
+            else:
+                self._emit_changed(dirty)  # 행 위치가 바뀌기 전에
+                structural = True
+                self._positions = None
+                if op == 'add':
+                    row = len(self.rows)
+                    self.beginInsertRows(QModelIndex(), row, row)
+                    self.rows.append(item)
+                    self.endInsertRows()
+                else:
+                    row = next((idx for idx, r in enumerate(self.rows) if r is item), None)
+                    if row is not None:
+                        self.beginRemoveRows(QModelIndex(), row, row)
+                        del self.rows[row]
+                        self.endRemoveRows()
+            self.seq = seq
+        self._emit_changed(dirty)
+        return structural
+
+    def _emit_changed(self, dirty):
+        if not dirty:
+            return
+        if self._positions is None:
+            self._positions = {id(r): idx for idx, r in enumerate(self.rows)}
+        for key, (item, cols) in dirty.items():
+            row = self._positions.get(key)
+            if row is not None:  # 이미 삭제된 행은 제외
+                self.dataChanged.emit(self.index(row, min(cols)), self.index(row, max(cols)))
+        dirty.clear()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = self.columns[index.column()]
+        value = self.rows[index.row()].get(column, '')
+        if role == Qt.DisplayRole:
+            return self.table._display_text(column, value)
+        if role == Qt.UserRole:
+            return value
+        if role == Qt.TextAlignmentRole:
+            return self.table.align_right if column in self._numeric else self.table.align_left
+        if role == Qt.ForegroundRole and column in self.table.profit_columns and isinstance(value, (int, float)):
+            # 손익 관련 컬럼 색상 (음수 청색, 양수 적색)
+            return self.table.color_negative if value < 0 else self.table.color_positive if value > 0 else self.table.color_zero
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section] if section < len(self.columns) else None
+        return section + 1
+
+class TableSubscription:
+    """
+    테이블 변경 구독 - 변경 기록에서 구독 이후 변경만 읽어 행마다 하나로 합쳐 넘김
+    이벤트 (종류, 키, 행 복사본, 바뀐 컬럼):
+        ('insert', 키, 행, 전체 컬럼)
+        ('update', 키, 행, 바뀐 컬럼)
+        ('delete', 키, None, 빈 집합)
+        ('reset', None, None, 빈 집합)   # 전체 대체/기록 밀림 - 받은 쪽은 전체를 다시 읽을 것
+    같은 행의 insert 후 update는 insert, update 후 delete는 delete, insert 후 delete는 없음
+    """
+    def __init__(self, table, callback=None, columns=None, interval=0):
+        self.table = table
+        self.callback = callback
+        self.columns = set(columns) if columns else None
+        self.interval = interval
+        self.due = 0.0  # 다음 전달 가능 시각 (time.monotonic)
+        self.active = True
+        self._lock = threading.Lock()
+        self.seq = table._read(lambda: table.changes[-1][0] if table.changes else 0)
+
+    def poll(self):
+        """구독 이후 변경 이벤트 목록 - 없으면 []"""
+        table = self.table
+        def read():
+            log = table.changes
+            try:
+                first, last = log[0][0], log[-1][0]
+            except IndexError:
+                return self.seq, []
+            if last <= self.seq:
+                return self.seq, []
+            changes = list(islice(log, max(0, self.seq + 1 - first), None))
+            if not changes or changes[0][0] != self.seq + 1:
+                return last, [('reset', None, None, frozenset())]
+            return changes[-1][0], self._events(changes)
+        with self._lock:
+            self.seq, events = table._read(read)
+        return events
+
+    def _events(self, changes):
+        table = self.table
+        reset = False
+        pending = {}  # {id(행): [종류, 행, 바뀐 컬럼 또는 삭제 키]} - 처음 바뀐 순서 유지
+        for seq, op, item, column in changes:
+            if op == 'reset':
+                reset = True
+                pending.clear()
+                continue
+            entry = pending.get(id(item))
+            if op == 'set':
+                if entry is None:
+                    pending[id(item)] = ['update', item, {column}]
+                elif entry[0] == 'update':
+                    entry[2].add(column)
+            elif op == 'add':
+                pending[id(item)] = ['insert', item, None]
+            elif entry is not None and entry[0] == 'insert':
+                del pending[id(item)]
+            else:
+                pending[id(item)] = ['delete', item, column]
+        events = [('reset', None, None, frozenset())] if reset else []
+        for op, item, extra in pending.values():
+            if op == 'delete':
+                events.append((op, extra, None, frozenset()))
+            elif op == 'insert':
+                events.append((op, table._get_key_for_item(item), _copy_row(item), frozenset(item.keys())))
+            elif self.columns is None or not self.columns.isdisjoint(extra):
+                events.append((op, table._get_key_for_item(item), _copy_row(item), frozenset(extra)))
+        return events
+
+    def flush(self):
+        """쌓인 변경을 콜백으로 전달 - 전달했으면 True"""
+        events = self.poll()
+        if not events:
+            return False
+        try:
+            self.callback(events)
+        except Exception as e:
+            import logging
+            logging.error(f'테이블 변경 구독 콜백 오류: {type(e).__name__} - {e}', exc_info=True)
+        return True
+
+    def close(self):
+        """구독 해제"""
+        if self.active:
+            self.active = False
+            if self.callback is not None:
+                _change_dispatcher().remove(self)
+
+class _ChangeDispatcher(threading.Thread):
+    """구독 콜백 전달 스레드 (모든 테이블 공용) - 쓰는 쪽 락 밖에서, interval 마다 모아서 부름"""
+    def __init__(self):
+        super().__init__(name='table-changes', daemon=True)
+        self.wake = threading.Event()
+        self.subscriptions = ()  # 통째로 바꿔 끼움 (도는 중에 추가/해제 가능)
+        self._lock = threading.Lock()
+
+    def add(self, sub):
+        with self._lock:
+            self.subscriptions += (sub,)
+            sub.table._subscribers += 1
+        self.wake.set()
+
+    def remove(self, sub):
+        with self._lock:
+            if sub in self.subscriptions:
+                self.subscriptions = tuple(s for s in self.subscriptions if s is not sub)
+                sub.table._subscribers -= 1
+
+    def run(self):
+        timeout = None
+        while True:
+            self.wake.wait(timeout)
+            self.wake.clear()
+            now = time.monotonic()
+            timeout = None
+            for sub in self.subscriptions:
+                if now >= sub.due:
+                    # 전달했으면 interval 동안은 모음, 조용했으면 다음 변경을 바로 전달
+                    if sub.flush() and sub.interval:
+                        sub.due = now + sub.interval
+                if sub.due > now:
+                    timeout = sub.due - now if timeout is None else min(timeout, sub.due - now)
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+def _change_dispatcher():
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = _ChangeDispatcher()
+            _dispatcher.start()
+        return _dispatcher
+
 # QReadWriteLock 사용
 class QTableManager:
     """
@@ -189,6 +945,9 @@ class QTableManager:
             - '실수': 실수형으로 변환할 컬럼 리스트
             - '컬럼': 전체 컬럼 리스트
             - '헤더': 화면용 컬럼 리스트 또는 리스트의 리스트 (여러 헤더 셋)
+            - '인덱스': 보조 인덱스를 둘 컬럼 리스트 (filter 조회 가속)
+            - '집계': 합계/최소/최대를 유지할 숫자 컬럼 리스트, '집계그룹': 그룹별 집계 기준 컬럼
+            - '컬럼형': True면 컬럼별 배열로 저장 (numpy 필요)
         """
         self.data = []
         self.data_dict = {}  # 키 기반 검색을 위한 딕셔너리
@@ -251,10 +1010,61 @@ class QTableManager:
 
         # 리사이즈
         self._resize = True
+
+        # 쓰기 추적 (행 줄무늬 락, 진행 중 쓰기 수, 끝난 쓰기 수) - 락 없는 읽기 검증용
+        self._writes = _RowWrites()
+        self.row_locking = True  # False면 이전 방식 (모든 쓰기 테이블 락, 읽기도 테이블 락)
         
         # 키 없는 모드인지 여부
         self.no_key_mode = self.key_columns is None
+
+        # 보조 인덱스 ('인덱스': 컬럼 리스트) - filter 조회 시 전체 행 대신 후보 행만 검사
+        self.index_columns = [column for column in config.get('인덱스', []) if column in self.all_columns]
+        # 집계 ('집계': 숫자 컬럼 리스트, '집계그룹': 그룹 컬럼) - 행 추가/수정/삭제 때 합계/개수/최소/최대 갱신
+        self.agg_columns = [column for column in config.get('집계', []) if column in self.int_columns + self.float_columns]
+        self.agg_group = config.get('집계그룹') if config.get('집계그룹') in self.all_columns else None
+        self._row_seq_next = 0
+        # 변경 기록 [(순번, 'add'|'del'|'set'|'reset', 행, 컬럼 - 'del'은 키)] - 화면 모델/변경 구독이 바뀐 행/셀만 반영
+        self.changes = deque(maxlen=_CHANGE_LOG_SIZE)
+        self._change_counter = count(1)
+        self._change_lock = threading.Lock()  # 순번과 기록 순서를 맞춤 (행 단위 쓰기는 동시에 기록)
+        self._subscribers = 0  # 콜백 구독 수 - 있으면 기록할 때 디스패처를 깨움
+        self._models = {}  # {id(QTableView): TableModel}
+        # 컬럼형 저장 ('컬럼형': True) - 행 사전 대신 컬럼 배열 (커지는 기록 테이블: 메모리 절약, 필터/합계/DataFrame 배열 연산)
+        self.store = None
+        if config.get('컬럼형'):
+            try:
+                self.store = ColumnStore(self.all_columns, self.int_columns, self.float_columns)
+            except ImportError:
+                print("경고: numpy가 설치되지 않아 컬럼형 대신 행 사전으로 저장합니다.")
+        self._rebuild_indexes()
     
+    @property
+    def version(self):
+        """변경 버전 (set/delete 때마다 증가, 복사 없이 조회한 쪽에서 변경 여부 확인용)"""
+        return self._writes.seq
+
+    def get_lock_stats(self):
+        """락 없는 읽기 통계 - 겹친 쓰기로 다시 읽은 횟수, 테이블 락으로 읽은 횟수"""
+        return {'version': self._writes.seq, 'retries': self._writes.retries, 'fallbacks': self._writes.fallbacks}
+
+    def subscribe(self, callback=None, columns=None, interval=0):
+        """
+        subscribe(callback) -> TableSubscription                  # 변경 즉시 callback(events) 호출 (공용 디스패처 스레드)
+        subscribe(callback, interval=1.0) -> TableSubscription    # 한 번 전달 후 1초 동안은 모아서 전달
+        subscribe(callback, columns=['감시']) -> TableSubscription # update는 지정 컬럼이 바뀐 것만 (insert/delete/reset은 모두)
+        subscribe() -> TableSubscription                          # 콜백 없이 sub.poll()로 직접 가져감
+        이벤트 형식은 TableSubscription 참고
+        """
+        sub = TableSubscription(self, callback, columns, interval)
+        if callback is not None:
+            _change_dispatcher().add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """구독 해제"""
+        sub.close()
+
     def _get_key_for_item(self, item):
         """
         항목에서 키 값을 추출
@@ -285,23 +1095,23 @@ class QTableManager:
         Returns:
         변환된 값
         """
-        # 기본값 정의
-        default_values = {
-            'int': 0,
-            'float': 0.0,
-            'str': ""
-        }
-        
-        # 문자열 처리
+        # 문자열 처리 (문자열 컬럼은 여기서 끝 - 틱마다 불리는 경로)
         if isinstance(value, str):
             value = value.strip()
-            if column not in self.int_columns + self.float_columns:
+            if column not in self.int_columns and column not in self.float_columns:
                 return value
             
             # 쉼표가 포함된 숫자 문자열 처리
             if any(c.isdigit() for c in value):
                 value = value.replace(',', '')
         
+        # 기본값 정의
+        default_values = {
+            'int': 0,
+            'float': 0.0,
+            'str': ""
+        }
+        
         # None이나 빈 문자열은 기본값으로
         if value is None or value == "":
             return default_values['int'] if column in self.int_columns else \
@@ -350,6 +1160,52 @@ class QTableManager:
         
         return processed_item
 
+    def _read(self, read):
+        """
+        락 없는 낙관적 읽기 - 읽는 동안 끝나거나 진행 중인 쓰기가 없었으면 그 결과 사용
+        겹친 쓰기가 있으면 다시 읽고, _READ_RETRIES번 넘게 겹치면 테이블 락(배타)으로 읽음
+        """
+        writes = self._writes
+        if self.row_locking:
+            for _ in range(_READ_RETRIES):
+                seq = writes.seq
+                if not writes.active:
+                    try:
+                        result = read()
+                    except Exception:
+                        # 읽는 중 구조가 바뀌어 생긴 예외 (dict 크기 변경 등) 는 다시 읽음
+                        if not writes.active and writes.seq == seq:
+                            raise
+                    else:
+                        if not writes.active and writes.seq == seq:
+                            return result
+                writes.retries += 1
+                time.sleep(0)  # 쓰기 쓰레드에 양보
+            writes.fallbacks += 1
+        self.lock.lockForWrite()  # 행 단위 쓰기(공유)까지 끝나기를 기다림
+        try:
+            return read()
+        finally:
+            self.lock.unlock()
+
+    def _set_row(self, key, data):
+        """기존 행 값 수정 - 테이블 락은 공유, 행은 줄무늬 락 (읽기와 다른 행 쓰기를 막지 않음). 행이 없으면 False"""
+        if self.no_key_mode:
+            return False
+        self.lock.lockForRead()
+        try:
+            items = self._find_items_by_key(key)
+            if not items:
+                return False
+            item = items[0] if isinstance(items, list) else items
+            with self._writes.stripe(key), self._writes.writing():
+                for column, value in data.items():
+                    if column not in self.key_columns:
+                        self._set_value(item, column, value)
+            return True
+        finally:
+            self.lock.unlock()
+
     def get(self, key=None, filter=None, type=None, column=None):
         """
         get() -> [{}]                     # 전체 데이터 사전 리스트 반환
@@ -364,14 +1220,12 @@ class QTableManager:
         get(key='key', column='col') -> 값  # 특정 행의 특정 컬럼 값 반환
         get(key='key', column=['c1','c2']) -> (값1, 값2, ...)  # 특정 행의 여러 컬럼 값 튜플 반환
         """
-        import copy
         # 읽기 락 사용
-        self.lock.lockForRead()
-        try:
+        def read():
             # 0. 키가 정수형인 경우 (인덱스로 접근)
             if isinstance(key, int):
                 if 0 <= key < len(self.data):
-                    return copy.deepcopy(self.data[key])
+                    return _copy_row(self.data[key])
                 return None
             
             # 1. 특정 키 + 특정 컬럼 조회
@@ -404,10 +1258,12 @@ class QTableManager:
                     for item in self.data:
                         filtered_item = {col: item.get(col) for col in column if col in item}
                         result.append(filtered_item)
-                    return copy.deepcopy(result)
+                    return [_copy_row(item) for item in result]
                 # 컬럼이 문자열인 경우
                 elif isinstance(column, str):
                     # 단일 컬럼이면 값만 추출하여 리스트로 반환
+                    if self.store is not None and column in self.store.kinds:
+                        return self.store.column_values(column)
                     return [item.get(column) for item in self.data]
                 
             # 3. 특정 키 조회
@@ -417,17 +1273,24 @@ class QTableManager:
 
                 # 키 중복 허용이면 여러 항목 반환 가능
                 if self.allow_duplicate_keys and isinstance(items, list):
-                    return copy.deepcopy(items)
+                    return [_copy_row(item) for item in items]
                 else:
                     # 중복 허용 아니면 첫 번째 항목만 반환
-                    return copy.deepcopy(items)
+                    return _copy_row(items)
             
             # 4. 필터링 조회
             if filter is not None:
                 return self._filter_data(filter)
             
+            # 컬럼형이면 DataFrame은 컬럼 배열에서 바로
+            if type == 'df' and self.store is not None:
+                try:
+                    return self.store.to_frame()
+                except ImportError:
+                    pass
+
             # 5. 전체 데이터 조회
-            data_copy = copy.deepcopy(self.data)
+            data_copy = self.store.to_dicts() if self.store is not None else [_copy_row(item) for item in self.data]
             
             # 6. DataFrame 반환 요청인 경우
             if type == 'df':
@@ -440,9 +1303,30 @@ class QTableManager:
             
             # 기본적으로 리스트 반환
             return data_copy
-        finally:
-            self.lock.unlock()
+        return self._read(read)
     
+    def view(self, key=None, filter=None):
+        """
+        view() -> (행, ...)               # 전체 행
+        view(key='key') -> 행             # 키로 찾은 행 (중복 키면 행 튜플)
+        view(key=숫자) -> 행              # 인덱스로 행
+        view(filter={}) -> (행, ...)      # 조건에 맞는 행들
+        복사 없는 읽기 전용 조회 - 행은 MappingProxyType (수정 불가, 이후 set() 결과가 그대로 보임)
+        값을 고쳐 쓰거나 다른 쓰레드/큐로 넘길 때는 get() (복사본) 사용
+        """
+        def read():
+            if isinstance(key, int):
+                return MappingProxyType(self.data[key]) if 0 <= key < len(self.data) else None
+            if key is not None:
+                items = self._find_items_by_key(key)
+                if not items: return None
+                if isinstance(items, list):
+                    return tuple(MappingProxyType(item) for item in items)
+                return MappingProxyType(items)
+            rows = self.data if filter is None else self._filter_data(filter, copy_rows=False)
+            return tuple(MappingProxyType(row) for row in rows)
+        return self._read(read)
+
     def _find_items_by_key(self, key):
         """
         키 값으로 항목 찾기
@@ -479,6 +1363,173 @@ class QTableManager:
             # 중복 키 비허용 모드: 단일 항목 저장
             self.data_dict[key_value] = item
 
+    def _rebuild_indexes(self):
+        """보조 인덱스/집계 전체 재구성 (데이터 대체/전체 삭제 후)"""
+        self.indexes = {column: {} for column in self.index_columns}  # {컬럼: {값: {id(행): 행}}}
+        self._index_maxlen = {column: 0 for column in self.index_columns}  # 문자열 값 최대 길이
+        self._row_seq = {}  # {id(행): 추가 순번} - 후보 행을 data 순서로 돌려주기 위함
+        self._aggs = {}  # {그룹값 (None은 전체): {'count': 행수, 'sum': {}, 'min': {}, 'max': {}}}
+        if self.agg_columns:
+            self._agg_bucket(None)
+        for item in self.data:
+            self._index_add(item)
+        self._log_change('reset')
+
+    def _index_add(self, item):
+        """새 행을 보조 인덱스에 등록"""
+        self._row_seq_next += 1
+        self._row_seq[id(item)] = self._row_seq_next
+        for column, index in self.indexes.items():
+            self._index_put(column, index, item.get(column), item)
+        if self.agg_columns:
+            self._agg_add(item)
+
+    def _index_put(self, column, index, value, item):
+        index.setdefault(value, {})[id(item)] = item
+        if isinstance(value, str) and len(value) > self._index_maxlen[column]:
+            self._index_maxlen[column] = len(value)
+
+    def _index_discard(self, index, value, item):
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.pop(id(item), None)
+            if not bucket:
+                del index[value]
+
+    def _set_value(self, item, column, value):
+        """행의 컬럼 값 설정 (인덱스/집계 컬럼이면 보조 인덱스와 집계도 갱신, 값이 바뀌면 변경 기록)"""
+        value = self._convert_value(column, value)
+        if id(item) not in self._row_seq:
+            item[column] = value  # 등록 전인 새 행
+            return
+        old_value = item.get(column)
+        if column in self.indexes or column in self.agg_columns or column == self.agg_group:
+            # 다른 행의 행 단위 쓰기와 인덱스/집계를 같이 고치므로 짧게 잠금
+            with self._writes.lock:
+                index = self.indexes.get(column)
+                if index is not None and (old_value != value or type(old_value) is not type(value)):
+                    self._index_discard(index, old_value, item)
+                    self._index_put(column, index, value, item)
+                if column in self.agg_columns:
+                    for bucket in self._agg_buckets_of(item):
+                        bucket['sum'][column] += value - old_value
+                        self._agg_shrink(bucket, column, old_value)
+                        self._agg_extend(bucket, column, value, False)
+                    item[column] = value
+                elif column == self.agg_group and old_value != value:
+                    self._agg_remove(item)
+                    item[column] = value
+                    self._agg_add(item)
+                else:
+                    item[column] = value
+        else:
+            item[column] = value
+        if old_value != value:
+            self._log_change('set', item, column)
+
+    def _new_row(self, item):
+        """새 행 객체 - 컬럼형이면 저장소 행 (ColumnRow), 아니면 사전 그대로"""
+        return item if self.store is None else self.store.add(item)
+
+    def _log_change(self, op, item=None, column=None):
+        with self._change_lock:
+            self.changes.append((next(self._change_counter), op, item, column))
+        if self._subscribers:
+            _dispatcher.wake.set()
+
+    def _remove_row(self, item):
+        """행 삭제 (같은 객체 기준) - 보조 인덱스에서도 제거"""
+        for idx, row in enumerate(self.data):
+            if row is item:
+                del self.data[idx]
+                self._log_change('del', item, self._get_key_for_item(item))
+                break
+        if self._row_seq.pop(id(item), None) is not None:
+            for column, index in self.indexes.items():
+                self._index_discard(index, item.get(column), item)
+            if self.agg_columns:
+                self._agg_remove(item)
+            if self.store is not None:
+                self.store.free(item)  # 값을 다 읽은 뒤에 (압축되면 행 번호가 바뀜)
+
+    def _agg_bucket(self, group):
+        bucket = self._aggs.get(group)
+        if bucket is None:
+            bucket = self._aggs[group] = {'count': 0, 'sum': dict.fromkeys(self.agg_columns, 0), 'min': {}, 'max': {}}
+        return bucket
+
+    def _agg_buckets_of(self, item):
+        """행이 속한 집계 (전체 + 그룹)"""
+        buckets = [self._aggs[None]]
+        if self.agg_group is not None:
+            buckets.append(self._agg_bucket(item.get(self.agg_group)))
+        return buckets
+
+    def _agg_extend(self, bucket, column, value, first):
+        # 최소/최대가 없는 컬럼은 무효화된 상태 - 조회 때 다시 계산
+        mins, maxs = bucket['min'], bucket['max']
+        if first or (column in mins and value < mins[column]):
+            mins[column] = value
+        if first or (column in maxs and value > maxs[column]):
+            maxs[column] = value
+
+    def _agg_shrink(self, bucket, column, value):
+        if bucket['min'].get(column) == value:
+            bucket['min'].pop(column)
+        if bucket['max'].get(column) == value:
+            bucket['max'].pop(column)
+
+    def _agg_add(self, item):
+        for bucket in self._agg_buckets_of(item):
+            first = bucket['count'] == 0
+            bucket['count'] += 1
+            for column in self.agg_columns:
+                value = item.get(column, 0)
+                bucket['sum'][column] += value
+                self._agg_extend(bucket, column, value, first)
+
+    def _agg_remove(self, item):
+        group = item.get(self.agg_group) if self.agg_group is not None else None
+        for bucket in self._agg_buckets_of(item):
+            bucket['count'] -= 1
+            for column in self.agg_columns:
+                value = item.get(column, 0)
+                bucket['sum'][column] -= value
+                self._agg_shrink(bucket, column, value)
+        if group is not None and self._aggs[group]['count'] == 0:
+            del self._aggs[group]
+
+    def _candidate_rows(self, conditions):
+        """
+        조건 검사 대상 행 - 인덱스 컬럼 조건이 있으면 가장 적은 후보 행만 (data 순서 유지), 없으면 전체 행
+        문자열 조건은 포함 검사이므로, 조건보다 긴 값이 있으면 조건을 포함하는 값들의 행을 모두 후보로 삼는다
+        후보 행도 필터 검사 함수로 다시 검사하므로 결과는 전체 검사와 같다
+        """
+        best = None
+        for column, value in conditions.items():
+            index = self.indexes.get(column)
+            if index is None or isinstance(value, (list, tuple)):
+                continue
+            if isinstance(value, str) and len(value) < self._index_maxlen[column]:
+                rows = {}
+                for index_value, bucket in index.items():
+                    if (value in index_value) if isinstance(index_value, str) else (index_value == value):
+                        rows.update(bucket)
+            else:
+                try:
+                    rows = index.get(value, {})
+                except TypeError:  # 해시 불가 조건값
+                    continue
+            if best is None or len(rows) < len(best):
+                best = rows
+                if not best:
+                    return []
+        if best is None:
+            return self.data
+        if len(best) == 1:
+            return list(best.values())
+        return sorted(best.values(), key=lambda row: self._row_seq[id(row)])
+
     def set(self, key=None, filter=None, data=None):
         """
         set(key='key', data={}) -> bool   # 특정 키 행 추가/업데이트
@@ -494,6 +1545,7 @@ class QTableManager:
         if isinstance(data, list):
             # 쓰기 락 사용
             self.lock.lockForWrite()
+            self._writes.begin()
             try:
                 # 키 모드일 때 키 필드 검증
                 if not self.no_key_mode:
@@ -505,17 +1557,21 @@ class QTableManager:
                 # 데이터 대체
                 self.data = []
                 self.data_dict = {}
+                if self.store is not None:
+                    self.store.clear()
                 for item in data:
-                    processed_item = self._process_item(item)
+                    processed_item = self._new_row(self._process_item(item))
                     self.data.append(processed_item)
                 
                     # 키 모드일 때 딕셔너리에 추가
                     if not self.no_key_mode:
                         key_value = self._get_key_for_item(processed_item)
                         self._add_to_dict(key_value, processed_item)
-                
+
+                self._rebuild_indexes()
                 return True
             finally:
+                self._writes.end()
                 self.lock.unlock()
             
         # 딕셔너리 타입 체크 (업데이트 모드)
@@ -525,8 +1581,13 @@ class QTableManager:
             if not valid_data:
                 return False
             
+            # 기존 행 수정은 행 단위 쓰기 (테이블 락은 공유로)
+            if key is not None and self.row_locking and self._set_row(key, valid_data):
+                return True
+
             # 쓰기 락 사용    
             self.lock.lockForWrite()
+            self._writes.begin()
             try:
                 # 1. 특정 키 업데이트/추가
                 if key is not None:
@@ -539,6 +1600,7 @@ class QTableManager:
                 # 3. 전체 항목 업데이트
                 return self._update_all_items(valid_data)
             finally:
+                self._writes.end()
                 self.lock.unlock()
                 
         return False
@@ -560,7 +1622,7 @@ class QTableManager:
                 if 0 <= key < len(self.data):
                     for column, value in data.items():
                         if column in self.all_columns:
-                            self.data[key][column] = self._convert_value(column, value)
+                            self._set_value(self.data[key], column, value)
                     return True
             return False
         
@@ -573,13 +1635,13 @@ class QTableManager:
                 # 첫 번째 항목만 업데이트
                 for column, value in data.items():
                     if column in self.all_columns and column not in self.key_columns:
-                        items[0][column] = self._convert_value(column, value)
+                        self._set_value(items[0], column, value)
                 return True
         elif items:
             # 중복 비허용 모드일 때 항목 업데이트
             for column, value in data.items():
                 if column in self.all_columns and column not in self.key_columns:
-                    items[column] = self._convert_value(column, value)
+                    self._set_value(items, column, value)
             return True
         
         # 신규 항목 추가
@@ -606,23 +1668,27 @@ class QTableManager:
         # 데이터 채우기
         for column, value in data.items():
             if column in self.all_columns:
-                item[column] = self._convert_value(column, value)
+                self._set_value(item, column, value)
         
         # 데이터 추가
+        item = self._new_row(item)
         self.data.append(item)
         self._add_to_dict(key, item)
+        self._index_add(item)
+        self._log_change('add', item)
         self._resize = True
         return True
     
     def _update_filtered_items(self, filter, data):
         """필터링된 항목 업데이트"""
         updated = False
-        for item in self.data:
-            if self._match_conditions(item, filter):
+        match = _compile_filter(filter)
+        for item in self._candidate_rows(filter):
+            if match(item):
                 # 키 컬럼은 업데이트하지 않음
                 for column, value in data.items():
                     if column in self.all_columns and (self.no_key_mode or column not in self.key_columns):
-                        item[column] = self._convert_value(column, value)
+                        self._set_value(item, column, value)
                 updated = True
         return updated
     
@@ -634,7 +1700,7 @@ class QTableManager:
         for item in self.data:
             for column, value in data.items():
                 if column in self.all_columns and (self.no_key_mode or column not in self.key_columns):
-                    item[column] = self._convert_value(column, value)
+                    self._set_value(item, column, value)
         return True
     
     def delete(self, key=None, filter=None):
@@ -646,13 +1712,14 @@ class QTableManager:
         """
         # 쓰기 락 사용
         self.lock.lockForWrite()
+        self._writes.begin()
         try:
             # 1. 특정 키 삭제
             if key is not None:
                 # 키 없는 모드에서는 인덱스로 처리
                 if self.no_key_mode:
                     if isinstance(key, int) and 0 <= key < len(self.data):
-                        del self.data[key]
+                        self._remove_row(self.data[key])
                         self._resize = True
                         return True
                     return False
@@ -665,14 +1732,12 @@ class QTableManager:
                 if self.allow_duplicate_keys:
                     # 중복 키 허용 모드: 모든 항목 삭제
                     for item in items[:]:  # 복사본으로 반복
-                        if item in self.data:
-                            self.data.remove(item)
+                        self._remove_row(item)
                     # 딕셔너리에서 키 삭제
                     self.data_dict.pop(key, None)
                 else:
                     # 중복 키 비허용 모드: 단일 항목 삭제
-                    if items in self.data:
-                        self.data.remove(items)
+                    self._remove_row(items)
                     self.data_dict.pop(key, None)
                     
                 self._resize = True
@@ -680,7 +1745,8 @@ class QTableManager:
             
             # 2. 필터링된 항목 삭제
             if filter is not None:
-                items_to_delete = [item for item in self.data if self._match_conditions(item, filter)]
+                match = _compile_filter(filter)
+                items_to_delete = [item for item in self._candidate_rows(filter) if match(item)]
                 if not items_to_delete:
                     return False
                 
@@ -702,8 +1768,7 @@ class QTableManager:
                             # 중복 키 비허용 모드: 키 삭제
                             self.data_dict.pop(key_val, None)
                 
-                    if item in self.data:
-                        self.data.remove(item)
+                    self._remove_row(item)
                     
                     if items_to_delete:
                         self._resize = True
@@ -713,12 +1778,16 @@ class QTableManager:
             # 3. 전체 데이터 삭제
             self.data = []
             self.data_dict = {}
+            if self.store is not None:
+                self.store.clear()
+            self._rebuild_indexes()
             self._resize = True
             return True
         finally:
+            self._writes.end()
             self.lock.unlock()
     
-    def _filter_data(self, conditions):
+    def _filter_data(self, conditions, copy_rows=True):
         """
         # conditions : {컬럼: 값} 컬럼과 값 비교
         {'col': 값}
@@ -730,78 +1799,32 @@ class QTableManager:
         {'col': ('==', 값)}               # col == 값
         {'col': ('!=', 값)}               # col != 값
         {'col': ('>', '@other_col')}      # col > other_col (컬럼 간 비교)
-        """
-        import copy
-        result = []
-        for row in self.data:
-            if self._match_conditions(row, conditions):
-                result.append(copy.deepcopy(row))
-        return result
+        copy_rows=False면 내부 행을 그대로 반환 (락 안에서 읽기만 할 때)
+        """
+        if copy_rows and self.store is not None:
+            rows = self.store.to_dicts(conditions)
+            if rows is not None:
+                return rows
+        rows = self.store.filter_rows(conditions) if self.store is not None else None
+        if rows is None:
+            match = _compile_filter(conditions)
+            rows = [row for row in self._candidate_rows(conditions) if match(row)]
+        if not copy_rows:
+            return rows
+        return [_copy_row(row) for row in rows]
     
-    def _match_conditions(self, row, conditions):
-        """항목이 조건에 맞는지 확인"""
-        for column, value in conditions.items():
-            if column not in row:
-                return False
-                
-            item_value = row[column]
-            
-            # 문자열인 경우 포함 여부 확인
-            if isinstance(item_value, str) and isinstance(value, str):
-                if value not in item_value:
-                    return False
-            # 컬럼 간 비교인 경우 ('컬럼' 또는 '@컬럼')
-            elif isinstance(value, (list, tuple)) and len(value) == 2:
-                op, compare_value = value
-                # '@'로 시작하는 문자열은 다른 컬럼을 참조
-                if isinstance(compare_value, str) and compare_value.startswith('@'):
-                    other_column = compare_value[1:]  # '@' 제거
-                    if other_column not in row:
-                        return False
-                    other_value = row[other_column]
-                    if not self._compare_values(item_value, op, other_value):
-                        return False
-                # 일반 비교값
-                else:
-                    if not self._compare_values(item_value, op, compare_value):
-                        return False
-            # 그 외의 경우 정확히 일치하는지 확인
-            elif item_value != value:
-                return False
-                
-        return True
-    
-    def _compare_values(self, item_value, operator, compare_value):
-        """숫자형 값 비교 연산"""
-        ops = {
-            '>': lambda x, y: x > y,
-            '<': lambda x, y: x < y,
-            '>=': lambda x, y: x >= y,
-            '<=': lambda x, y: x <= y,
-            '==': lambda x, y: x == y,
-            '!=': lambda x, y: x != y
-        }
-        
-        if operator in ops:
-            try:
-                return ops[operator](item_value, compare_value)
-            except (TypeError, ValueError):
-                return False
-        return False
-
     def len(self, filter=None):
         """
         len() -> int                      # 전체 행 수 반환
         len(filter={}) -> int             # 조건 만족 행 수 반환
         """
         # 읽기 락 사용
-        self.lock.lockForRead()
-        try:
+        def read():
             if filter is not None:
-                return len(self._filter_data(filter))
+                counted = self.store.count(filter) if self.store is not None else None
+                return counted if counted is not None else len(self._filter_data(filter, copy_rows=False))
             return len(self.data)
-        finally:
-            self.lock.unlock()
+        return self._read(read)
     
     def in_key(self, key):
         """
@@ -813,31 +1836,59 @@ class QTableManager:
             return False
             
         # 읽기 락 사용
-        self.lock.lockForRead()
-        try:
-            return key in self.data_dict
-        finally:
-            self.lock.unlock()
+        return key in self.data_dict  # dict 조회는 원자적 - 락 불필요
     
     def in_column(self, column, value):
         """
         in_column('col', 값) -> bool      # 컬럼에 값 존재 여부
         """
         # 읽기 락 사용
-        self.lock.lockForRead()
-        try:
+        def read():
             if column not in self.all_columns:
                 return False
             
             # 타입 변환
             converted_value = self._convert_value(column, value)
-            
+
+            if column in self.indexes:
+                return converted_value in self.indexes[column]
+
             for item in self.data:
                 if item.get(column) == converted_value:
                     return True
             return False
-        finally:
-            self.lock.unlock()
+        return self._read(read)
+
+    def find(self, column, value, filter=None):
+        """
+        find('col', 값) -> 행 | None                  # 컬럼 값이 같은 첫 행 (in_column처럼 일치 비교)
+        find('col', 값, filter={}) -> 행 | None       # 그 중 조건도 만족하는 첫 행
+        view()처럼 복사 없는 읽기 전용 행 (MappingProxyType) - 인덱스 컬럼이면 그 값의 행 묶음만 봄 (실시간 틱 경로용)
+        """
+        if column not in self.all_columns:
+            return None
+        converted_value = self._convert_value(column, value)
+        match = None
+        def read():
+            nonlocal match
+            index = self.indexes.get(column)
+            rows = self.data if index is None else index.get(converted_value)
+            if not rows:
+                return None  # 대부분의 틱 - 조건 컴파일 없이 끝
+            if filter and match is None:
+                match = _compile_filter(filter)
+            if index is None:
+                for item in rows:
+                    if item.get(column) == converted_value and (match is None or match(item)):
+                        return MappingProxyType(item)
+                return None
+            found = None
+            for item in rows.values():
+                # 묶음 안 순서는 값이 바뀐 순서라서 data 순서(먼저 들어온 행)로 고름
+                if (match is None or match(item)) and (found is None or self._row_seq[id(item)] < self._row_seq[id(found)]):
+                    found = item
+            return None if found is None else MappingProxyType(found)
+        return self._read(read)
     
     def sum(self, column=None, filter=None):
         """
@@ -845,21 +1896,30 @@ class QTableManager:
         sum(column=[], filter={}) -> (합1, 합2, ...)  # 조건 만족 행들의 합계 반환
         """
         # 읽기 락 사용
-        self.lock.lockForRead()
-        try:
+        def read():
             if not column:
                 return ()
+            columns = [column] if isinstance(column, str) else column
+
+            # 집계 컬럼만 요청하면 유지 중인 합계 사용 (행 순회 없음)
+            if filter is None and self.agg_columns and all(col in self.agg_columns for col in columns):
+                totals = self._aggs[None]['sum']
+                return tuple(totals[col] for col in columns)
             
+            # 컬럼형이면 배열 합계
+            if self.store is not None:
+                result = self.store.sum(columns, filter)
+                if result is not None:
+                    return result
+
             # 합계 계산할 데이터 선택
             data_to_sum = self.data
             if filter is not None:
-                data_to_sum = self._filter_data(filter)
+                data_to_sum = self._filter_data(filter, copy_rows=False)
             
             # 각 컬럼별 합계 계산
             result = []
-            if isinstance(column, str):
-                column = [column]
-            for col in column:
+            for col in columns:
                 if col in self.int_columns or col in self.float_columns:
                     total = sum(item.get(col, 0) for item in data_to_sum)
                     result.append(total)
@@ -868,8 +1928,42 @@ class QTableManager:
                     result.append(0)
             
             return tuple(result)
-        finally:
-            self.lock.unlock()
+        return self._read(read)
+
+    def aggregate(self, column=None, func='sum', group=None):
+        """
+        aggregate('col') -> 합계                      # '집계' 컬럼 전체 합계
+        aggregate('col', 'min') / ('col', 'max') -> 값  # 최소/최대 (없으면 None)
+        aggregate(func='count') -> int                # 행 수
+        aggregate('col', group='값') -> 합계           # '집계그룹' 컬럼 값별 집계
+        행 추가/수정/삭제 때 갱신해 둔 값을 반환 - 최소/최대는 해당 값 행이 바뀐 뒤 처음 조회할 때만 다시 계산
+        '집계' 컬럼이 아니면 None
+        """
+        def read():
+            bucket = self._aggs.get(group)
+            if func == 'count':
+                if group is None:
+                    return len(self.data)
+                return bucket['count'] if bucket else 0
+            if column not in self.agg_columns:
+                return None
+            if func == 'sum':
+                return bucket['sum'][column] if bucket else 0
+            if func not in ('min', 'max') or not bucket or not bucket['count']:
+                return None
+            cache = bucket[func]
+            if column in cache:
+                return cache[column]
+            writes = self._writes
+            seq, active = writes.seq, writes.active
+            rows = self.data if group is None else (row for row in self.data if row.get(self.agg_group) == group)
+            value = (min if func == 'min' else max)(row.get(column, 0) for row in rows)
+            # 계산 중 쓰기가 겹쳤으면 캐시하지 않음 (반환값은 _read가 다시 읽음) - 시작 표시(begin)와 같은 락 안에서 확인 후 저장
+            with writes.lock:
+                if not active and not writes.active and writes.seq == seq:
+                    cache[column] = value
+            return value
+        return self._read(read)
     
     def update_table_widget(self, table_widget, stretch=True, header=0):
         """
@@ -879,29 +1973,28 @@ class QTableManager:
         table_widget (QTableWidget): 데이터를 표시할 테이블 위젯
         stretch (bool): 마지막 열을 테이블 너비에 맞게 늘릴지 여부
         header (int): 사용할 헤더 세트의 인덱스 (기본값: 0)
+        QTableView면 TableModel로 바뀐 행/셀만 반영 (update_table_view)
         """
-        import copy
-        from PyQt5.QtWidgets import QTableWidgetItem
+        from PyQt5.QtWidgets import QTableWidgetItem, QTableWidget
         from PyQt5.QtCore import Qt
+
+        if not isinstance(table_widget, QTableWidget):
+            return self.update_table_view(table_widget, stretch, header)
         
         # 락 사용 최소화 - 데이터 스냅샷만 빠르게 복사
-        self.lock.lockForRead()
-        try:
-            if not self.data:
-                table_widget.setRowCount(0)
-                return
-                
-            data_copy = copy.deepcopy(self.data)
-            if header < 0 or header >= len(self.display_columns):
-                header = 0
+        data_copy = self._read(lambda: [_copy_row(item) for item in self.data])
+        if not data_copy:
+            table_widget.setRowCount(0)
+            return
 
-            columns = self.display_columns[header]
-            resize_needed = self._resize
-            
-            if resize_needed:
-                self._resize = False
-        finally:
-            self.lock.unlock()
+        if header < 0 or header >= len(self.display_columns):
+            header = 0
+
+        columns = self.display_columns[header]
+        resize_needed = self._resize
+        
+        if resize_needed:
+            self._resize = False
         
         # UI 업데이트는 락 없이 수행
         table_widget.setUpdatesEnabled(False)
@@ -937,27 +2030,64 @@ class QTableManager:
             table_widget.setUpdatesEnabled(True)
             table_widget.setSortingEnabled(True)
             
+    def update_table_view(self, table_view, stretch=True, header=0):
+        """
+        QTableView에 표시 - 처음엔 TableModel + 정렬용 QSortFilterProxyModel 연결, 이후엔 변경 기록만 반영
+        행 추가/삭제가 있었을 때만 컬럼 폭 조정
+        """
+        from PyQt5.QtCore import QSortFilterProxyModel
+
+        if header < 0 or header >= len(self.display_columns):
+            header = 0
+        columns = self.display_columns[header]
+
+        try:
+            model = self._models.get(id(table_view))
+            if model is None or model.columns != columns:
+                model = TableModel(self, columns, table_view)
+                proxy = QSortFilterProxyModel(table_view)
+                proxy.setSourceModel(model)
+                proxy.setSortRole(Qt.UserRole)  # 표시 문자열 대신 원래 값으로 정렬
+                table_view.setModel(proxy)
+                table_view.setSortingEnabled(True)
+                self._models[id(table_view)] = model
+                resize_needed = True
+            else:
+                resize_needed = model.sync() and self._resize
+
+            if resize_needed:
+                self._resize = False
+                table_view.resizeColumnsToContents()
+                table_view.resizeRowsToContents()
+                if stretch:
+                    table_view.horizontalHeader().setStretchLastSection(stretch)
+        except Exception as e:
+            import logging
+            logging.error(f'update_table_view 오류: {type(e).__name__} - {e}', exc_info=True)
+
+    def _display_text(self, column, value):
+        """셀 표시 문자열"""
+        # 숫자 형식화
+        if column in self.int_columns and isinstance(value, int):
+            return f"{value:,}"
+        if column in self.float_columns and isinstance(value, float):
+            return f"{value:,.2f}"
+        display_value = str(value).rstrip() # 빈 줄 제거
+        # "스크립트" 컬럼의 경우 마지막 줄만 표시
+        if column in ['스크립트', '설명'] and '\n' in display_value:
+            lines = display_value.split('\n')
+            # 마지막 줄이 비어있으면 그 전 줄을 사용
+            last_line = lines[-1] if lines[-1].strip() else lines[-2] if len(lines) > 1 else lines[0]
+            display_value = last_line[:35]
+        return display_value
+
     def _set_table_cell(self, table_widget, row, col, column, value):
         """테이블의 특정 셀에 값 설정"""
         from PyQt5.QtWidgets import QTableWidgetItem
         from PyQt5.QtCore import Qt
         
         original_value = str(value)
-        
-        # 숫자 형식화
-        if column in self.int_columns and isinstance(value, int):
-            display_value = f"{value:,}"
-        elif column in self.float_columns and isinstance(value, float):
-            display_value = f"{value:,.2f}"
-        else:
-            display_value = str(value).rstrip() # 빈 줄 제거
-            # "스크립트" 컬럼의 경우 마지막 줄만 표시
-            if column in ['스크립트', '설명'] and '\n' in display_value:
-                lines = display_value.split('\n')
-                # 마지막 줄이 비어있으면 그 전 줄을 사용
-                last_line = lines[-1] if lines[-1].strip() else lines[-2] if len(lines) > 1 else lines[0]
-                display_value = last_line[:35]
-                #display_value = last_line if last_line.strip() else "(빈 줄)"
+        display_value = self._display_text(column, value)
                 
         # 기존 아이템 재사용
         existing_item = table_widget.item(row, col)
@@ -989,7 +2119,7 @@ class QTableManager:
                 else:
                     cell_item.setForeground(self.color_zero)      # 0은 검정색
 
-# 표준 threading.RLock 사용
+# 표준 threading 락 사용 (구조 변경은 배타, 기존 행 수정은 공유 + 행 줄무늬 락, 읽기는 락 없음)
 class TableManager:
     """
     # 1. 단일 키 사용 (기존 방식)
@@ -1042,12 +2172,15 @@ class TableManager:
             - '실수': 실수형으로 변환할 컬럼 리스트
             - '컬럼': 전체 컬럼 리스트
             - '헤더': 화면용 컬럼 리스트 또는 리스트의 리스트 (여러 헤더 셋)
+            - '인덱스': 보조 인덱스를 둘 컬럼 리스트 (filter 조회 가속)
+            - '집계': 합계/최소/최대를 유지할 숫자 컬럼 리스트, '집계그룹': 그룹별 집계 기준 컬럼
+            - '컬럼형': True면 컬럼별 배열로 저장 (numpy 필요)
         """
         self.data = []
         self.data_dict = {}  # 키 기반 검색을 위한 딕셔너리
         
-        # 표준 threading.RLock 사용 (재진입 가능한 락)
-        self.lock = threading.RLock()
+        # 공유/배타 락 (배타는 재진입 가능)
+        self.lock = _SharedLock()  # 배타: 구조 변경 (행 추가/삭제/대체), 공유: 기존 행 값 수정
         
         # 설정 정보 저장
         self.key_columns = config.get('키', None)
@@ -1103,10 +2236,61 @@ class TableManager:
 
         # 리사이즈
         self._resize = True
+
+        # 쓰기 추적 (행 줄무늬 락, 진행 중 쓰기 수, 끝난 쓰기 수) - 락 없는 읽기 검증용
+        self._writes = _RowWrites()
+        self.row_locking = True  # False면 이전 방식 (모든 쓰기 테이블 락, 읽기도 테이블 락)
         
         # 키 없는 모드인지 여부
         self.no_key_mode = self.key_columns is None
+
+        # 보조 인덱스 ('인덱스': 컬럼 리스트) - filter 조회 시 전체 행 대신 후보 행만 검사
+        self.index_columns = [column for column in config.get('인덱스', []) if column in self.all_columns]
+        # 집계 ('집계': 숫자 컬럼 리스트, '집계그룹': 그룹 컬럼) - 행 추가/수정/삭제 때 합계/개수/최소/최대 갱신
+        self.agg_columns = [column for column in config.get('집계', []) if column in self.int_columns + self.float_columns]
+        self.agg_group = config.get('집계그룹') if config.get('집계그룹') in self.all_columns else None
+        self._row_seq_next = 0
+        # 변경 기록 [(순번, 'add'|'del'|'set'|'reset', 행, 컬럼 - 'del'은 키)] - 화면 모델/변경 구독이 바뀐 행/셀만 반영
+        self.changes = deque(maxlen=_CHANGE_LOG_SIZE)
+        self._change_counter = count(1)
+        self._change_lock = threading.Lock()  # 순번과 기록 순서를 맞춤 (행 단위 쓰기는 동시에 기록)
+        self._subscribers = 0  # 콜백 구독 수 - 있으면 기록할 때 디스패처를 깨움
+        self._models = {}  # {id(QTableView): TableModel}
+        # 컬럼형 저장 ('컬럼형': True) - 행 사전 대신 컬럼 배열 (커지는 기록 테이블: 메모리 절약, 필터/합계/DataFrame 배열 연산)
+        self.store = None
+        if config.get('컬럼형'):
+            try:
+                self.store = ColumnStore(self.all_columns, self.int_columns, self.float_columns)
+            except ImportError:
+                print("경고: numpy가 설치되지 않아 컬럼형 대신 행 사전으로 저장합니다.")
+        self._rebuild_indexes()
     
+    @property
+    def version(self):
+        """변경 버전 (set/delete 때마다 증가, 복사 없이 조회한 쪽에서 변경 여부 확인용)"""
+        return self._writes.seq
+
+    def get_lock_stats(self):
+        """락 없는 읽기 통계 - 겹친 쓰기로 다시 읽은 횟수, 테이블 락으로 읽은 횟수"""
+        return {'version': self._writes.seq, 'retries': self._writes.retries, 'fallbacks': self._writes.fallbacks}
+
+    def subscribe(self, callback=None, columns=None, interval=0):
+        """
+        subscribe(callback) -> TableSubscription                  # 변경 즉시 callback(events) 호출 (공용 디스패처 스레드)
+        subscribe(callback, interval=1.0) -> TableSubscription    # 한 번 전달 후 1초 동안은 모아서 전달
+        subscribe(callback, columns=['감시']) -> TableSubscription # update는 지정 컬럼이 바뀐 것만 (insert/delete/reset은 모두)
+        subscribe() -> TableSubscription                          # 콜백 없이 sub.poll()로 직접 가져감
+        이벤트 형식은 TableSubscription 참고
+        """
+        sub = TableSubscription(self, callback, columns, interval)
+        if callback is not None:
+            _change_dispatcher().add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """구독 해제"""
+        sub.close()
+
     def _get_key_for_item(self, item):
         """
         항목에서 키 값을 추출
@@ -1137,23 +2321,23 @@ class TableManager:
         Returns:
         변환된 값
         """
-        # 기본값 정의
-        default_values = {
-            'int': 0,
-            'float': 0.0,
-            'str': ""
-        }
-        
-        # 문자열 처리
+        # 문자열 처리 (문자열 컬럼은 여기서 끝 - 틱마다 불리는 경로)
         if isinstance(value, str):
             value = value.strip()
-            if column not in self.int_columns + self.float_columns:
+            if column not in self.int_columns and column not in self.float_columns:
                 return value
             
             # 쉼표가 포함된 숫자 문자열 처리
             if any(c.isdigit() for c in value):
                 value = value.replace(',', '')
         
+        # 기본값 정의
+        default_values = {
+            'int': 0,
+            'float': 0.0,
+            'str': ""
+        }
+        
         # None이나 빈 문자열은 기본값으로
         if value is None or value == "":
             return default_values['int'] if column in self.int_columns else \
@@ -1202,6 +2386,49 @@ class TableManager:
         
         return processed_item
 
+    def _read(self, read):
+        """
+        락 없는 낙관적 읽기 - 읽는 동안 끝나거나 진행 중인 쓰기가 없었으면 그 결과 사용
+        겹친 쓰기가 있으면 다시 읽고, _READ_RETRIES번 넘게 겹치면 테이블 락(배타)으로 읽음
+        """
+        writes = self._writes
+        if self.row_locking:
+            for _ in range(_READ_RETRIES):
+                seq = writes.seq
+                if not writes.active:
+                    try:
+                        result = read()
+                    except Exception:
+                        # 읽는 중 구조가 바뀌어 생긴 예외 (dict 크기 변경 등) 는 다시 읽음
+                        if not writes.active and writes.seq == seq:
+                            raise
+                    else:
+                        if not writes.active and writes.seq == seq:
+                            return result
+                writes.retries += 1
+                time.sleep(0)  # 쓰기 쓰레드에 양보
+            writes.fallbacks += 1
+        with self.lock:  # 행 단위 쓰기(공유)까지 끝나기를 기다림
+            return read()
+
+    def _set_row(self, key, data):
+        """기존 행 값 수정 - 테이블 락은 공유, 행은 줄무늬 락 (읽기와 다른 행 쓰기를 막지 않음). 행이 없으면 False"""
+        if self.no_key_mode:
+            return False
+        self.lock.acquire_shared()
+        try:
+            items = self._find_items_by_key(key)
+            if not items:
+                return False
+            item = items[0] if isinstance(items, list) else items
+            with self._writes.stripe(key), self._writes.writing():
+                for column, value in data.items():
+                    if column not in self.key_columns:
+                        self._set_value(item, column, value)
+            return True
+        finally:
+            self.lock.release_shared()
+
     def get(self, key=None, filter=None, type=None, column=None):
         """
         get() -> [{}]                     # 전체 데이터 사전 리스트 반환
@@ -1216,11 +2443,11 @@ class TableManager:
         get(key='key', column='col') -> 값  # 특정 행의 특정 컬럼 값 반환
         get(key='key', column=['c1','c2']) -> (값1, 값2, ...)  # 특정 행의 여러 컬럼 값 튜플 반환
         """
-        with self.lock:
+        def read():
             # 0. 키가 정수형인 경우 (인덱스로 접근)
             if isinstance(key, int):
                 if 0 <= key < len(self.data):
-                    return copy.deepcopy(self.data[key])
+                    return _copy_row(self.data[key])
                 return None
             
             # 1. 특정 키 + 특정 컬럼 조회
@@ -1253,10 +2480,12 @@ class TableManager:
                     for item in self.data:
                         filtered_item = {col: item.get(col) for col in column if col in item}
                         result.append(filtered_item)
-                    return copy.deepcopy(result)
+                    return [_copy_row(item) for item in result]
                 # 컬럼이 문자열인 경우
                 elif isinstance(column, str):
                     # 단일 컬럼이면 값만 추출하여 리스트로 반환
+                    if self.store is not None and column in self.store.kinds:
+                        return self.store.column_values(column)
                     return [item.get(column) for item in self.data]
                 
             # 3. 특정 키 조회
@@ -1266,17 +2495,24 @@ class TableManager:
 
                 # 키 중복 허용이면 여러 항목 반환 가능
                 if self.allow_duplicate_keys and isinstance(items, list):
-                    return copy.deepcopy(items)
+                    return [_copy_row(item) for item in items]
                 else:
                     # 중복 허용 아니면 첫 번째 항목만 반환
-                    return copy.deepcopy(items)
+                    return _copy_row(items)
             
             # 4. 필터링 조회
             if filter is not None:
                 return self._filter_data(filter)
             
+            # 컬럼형이면 DataFrame은 컬럼 배열에서 바로
+            if type == 'df' and self.store is not None:
+                try:
+                    return self.store.to_frame()
+                except ImportError:
+                    pass
+
             # 5. 전체 데이터 조회
-            data_copy = copy.deepcopy(self.data)
+            data_copy = self.store.to_dicts() if self.store is not None else [_copy_row(item) for item in self.data]
             
             # 6. DataFrame 반환 요청인 경우
             if type == 'df':
@@ -1289,7 +2525,30 @@ class TableManager:
             
             # 기본적으로 리스트 반환
             return data_copy
-    
+        return self._read(read)
+
+    def view(self, key=None, filter=None):
+        """
+        view() -> (행, ...)               # 전체 행
+        view(key='key') -> 행             # 키로 찾은 행 (중복 키면 행 튜플)
+        view(key=숫자) -> 행              # 인덱스로 행
+        view(filter={}) -> (행, ...)      # 조건에 맞는 행들
+        복사 없는 읽기 전용 조회 - 행은 MappingProxyType (수정 불가, 이후 set() 결과가 그대로 보임)
+        값을 고쳐 쓰거나 다른 쓰레드/큐로 넘길 때는 get() (복사본) 사용
+        """
+        def read():
+            if isinstance(key, int):
+                return MappingProxyType(self.data[key]) if 0 <= key < len(self.data) else None
+            if key is not None:
+                items = self._find_items_by_key(key)
+                if not items: return None
+                if isinstance(items, list):
+                    return tuple(MappingProxyType(item) for item in items)
+                return MappingProxyType(items)
+            rows = self.data if filter is None else self._filter_data(filter, copy_rows=False)
+            return tuple(MappingProxyType(row) for row in rows)
+        return self._read(read)
+
     def _find_items_by_key(self, key):
         """
         키 값으로 항목 찾기
@@ -1326,6 +2585,173 @@ class TableManager:
             # 중복 키 비허용 모드: 단일 항목 저장
             self.data_dict[key_value] = item
 
+    def _rebuild_indexes(self):
+        """보조 인덱스/집계 전체 재구성 (데이터 대체/전체 삭제 후)"""
+        self.indexes = {column: {} for column in self.index_columns}  # {컬럼: {값: {id(행): 행}}}
+        self._index_maxlen = {column: 0 for column in self.index_columns}  # 문자열 값 최대 길이
+        self._row_seq = {}  # {id(행): 추가 순번} - 후보 행을 data 순서로 돌려주기 위함
+        self._aggs = {}  # {그룹값 (None은 전체): {'count': 행수, 'sum': {}, 'min': {}, 'max': {}}}
+        if self.agg_columns:
+            self._agg_bucket(None)
+        for item in self.data:
+            self._index_add(item)
+        self._log_change('reset')
+
+    def _index_add(self, item):
+        """새 행을 보조 인덱스에 등록"""
+        self._row_seq_next += 1
+        self._row_seq[id(item)] = self._row_seq_next
+        for column, index in self.indexes.items():
+            self._index_put(column, index, item.get(column), item)
+        if self.agg_columns:
+            self._agg_add(item)
+
+    def _index_put(self, column, index, value, item):
+        index.setdefault(value, {})[id(item)] = item
+        if isinstance(value, str) and len(value) > self._index_maxlen[column]:
+            self._index_maxlen[column] = len(value)
+
+    def _index_discard(self, index, value, item):
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.pop(id(item), None)
+            if not bucket:
+                del index[value]
+
+    def _set_value(self, item, column, value):
+        """행의 컬럼 값 설정 (인덱스/집계 컬럼이면 보조 인덱스와 집계도 갱신, 값이 바뀌면 변경 기록)"""
+        value = self._convert_value(column, value)
+        if id(item) not in self._row_seq:
+            item[column] = value  # 등록 전인 새 행
+            return
+        old_value = item.get(column)
+        if column in self.indexes or column in self.agg_columns or column == self.agg_group:
+            # 다른 행의 행 단위 쓰기와 인덱스/집계를 같이 고치므로 짧게 잠금
+            with self._writes.lock:
+                index = self.indexes.get(column)
+                if index is not None and (old_value != value or type(old_value) is not type(value)):
+                    self._index_discard(index, old_value, item)
+                    self._index_put(column, index, value, item)
+                if column in self.agg_columns:
+                    for bucket in self._agg_buckets_of(item):
+                        bucket['sum'][column] += value - old_value
+                        self._agg_shrink(bucket, column, old_value)
+                        self._agg_extend(bucket, column, value, False)
+                    item[column] = value
+                elif column == self.agg_group and old_value != value:
+                    self._agg_remove(item)
+                    item[column] = value
+                    self._agg_add(item)
+                else:
+                    item[column] = value
+        else:
+            item[column] = value
+        if old_value != value:
+            self._log_change('set', item, column)
+
+    def _new_row(self, item):
+        """새 행 객체 - 컬럼형이면 저장소 행 (ColumnRow), 아니면 사전 그대로"""
+        return item if self.store is None else self.store.add(item)
+
+    def _log_change(self, op, item=None, column=None):
+        with self._change_lock:
+            self.changes.append((next(self._change_counter), op, item, column))
+        if self._subscribers:
+            _dispatcher.wake.set()
+
+    def _remove_row(self, item):
+        """행 삭제 (같은 객체 기준) - 보조 인덱스에서도 제거"""
+        for idx, row in enumerate(self.data):
+            if row is item:
+                del self.data[idx]
+                self._log_change('del', item, self._get_key_for_item(item))
+                break
+        if self._row_seq.pop(id(item), None) is not None:
+            for column, index in self.indexes.items():
+                self._index_discard(index, item.get(column), item)
+            if self.agg_columns:
+                self._agg_remove(item)
+            if self.store is not None:
+                self.store.free(item)  # 값을 다 읽은 뒤에 (압축되면 행 번호가 바뀜)
+
+    def _agg_bucket(self, group):
+        bucket = self._aggs.get(group)
+        if bucket is None:
+            bucket = self._aggs[group] = {'count': 0, 'sum': dict.fromkeys(self.agg_columns, 0), 'min': {}, 'max': {}}
+        return bucket
+
+    def _agg_buckets_of(self, item):
+        """행이 속한 집계 (전체 + 그룹)"""
+        buckets = [self._aggs[None]]
+        if self.agg_group is not None:
+            buckets.append(self._agg_bucket(item.get(self.agg_group)))
+        return buckets
+
+    def _agg_extend(self, bucket, column, value, first):
+        # 최소/최대가 없는 컬럼은 무효화된 상태 - 조회 때 다시 계산
+        mins, maxs = bucket['min'], bucket['max']
+        if first or (column in mins and value < mins[column]):
+            mins[column] = value
+        if first or (column in maxs and value > maxs[column]):
+            maxs[column] = value
+
+    def _agg_shrink(self, bucket, column, value):
+        if bucket['min'].get(column) == value:
+            bucket['min'].pop(column)
+        if bucket['max'].get(column) == value:
+            bucket['max'].pop(column)
+
+    def _agg_add(self, item):
+        for bucket in self._agg_buckets_of(item):
+            first = bucket['count'] == 0
+            bucket['count'] += 1
+            for column in self.agg_columns:
+                value = item.get(column, 0)
+                bucket['sum'][column] += value
+                self._agg_extend(bucket, column, value, first)
+
+    def _agg_remove(self, item):
+        group = item.get(self.agg_group) if self.agg_group is not None else None
+        for bucket in self._agg_buckets_of(item):
+            bucket['count'] -= 1
+            for column in self.agg_columns:
+                value = item.get(column, 0)
+                bucket['sum'][column] -= value
+                self._agg_shrink(bucket, column, value)
+        if group is not None and self._aggs[group]['count'] == 0:
+            del self._aggs[group]
+
+    def _candidate_rows(self, conditions):
+        """
+        조건 검사 대상 행 - 인덱스 컬럼 조건이 있으면 가장 적은 후보 행만 (data 순서 유지), 없으면 전체 행
+        문자열 조건은 포함 검사이므로, 조건보다 긴 값이 있으면 조건을 포함하는 값들의 행을 모두 후보로 삼는다
+        후보 행도 필터 검사 함수로 다시 검사하므로 결과는 전체 검사와 같다
+        """
+        best = None
+        for column, value in conditions.items():
+            index = self.indexes.get(column)
+            if index is None or isinstance(value, (list, tuple)):
+                continue
+            if isinstance(value, str) and len(value) < self._index_maxlen[column]:
+                rows = {}
+                for index_value, bucket in index.items():
+                    if (value in index_value) if isinstance(index_value, str) else (index_value == value):
+                        rows.update(bucket)
+            else:
+                try:
+                    rows = index.get(value, {})
+                except TypeError:  # 해시 불가 조건값
+                    continue
+            if best is None or len(rows) < len(best):
+                best = rows
+                if not best:
+                    return []
+        if best is None:
+            return self.data
+        if len(best) == 1:
+            return list(best.values())
+        return sorted(best.values(), key=lambda row: self._row_seq[id(row)])
+
     def set(self, key=None, filter=None, data=None):
         """
         set(key='key', data={}) -> bool   # 특정 키 행 추가/업데이트
@@ -1339,7 +2765,7 @@ class TableManager:
                 
         # 리스트 타입 체크 (데이터 대체 모드)
         if isinstance(data, list):
-            with self.lock:
+            with self.lock, self._writes.writing():
                 # 키 모드일 때 키 필드 검증
                 if not self.no_key_mode:
                     for item in data:
@@ -1350,15 +2776,18 @@ class TableManager:
                 # 데이터 대체
                 self.data = []
                 self.data_dict = {}
+                if self.store is not None:
+                    self.store.clear()
                 for item in data:
-                    processed_item = self._process_item(item)
+                    processed_item = self._new_row(self._process_item(item))
                     self.data.append(processed_item)
                 
                     # 키 모드일 때 딕셔너리에 추가
                     if not self.no_key_mode:
                         key_value = self._get_key_for_item(processed_item)
                         self._add_to_dict(key_value, processed_item)
-                
+
+                self._rebuild_indexes()
                 return True
             
         # 딕셔너리 타입 체크 (업데이트 모드)
@@ -1366,8 +2795,12 @@ class TableManager:
             # 빈 데이터 필드 제거
             valid_data = {k: v for k, v in data.items() if k in self.all_columns}
             if not valid_data: return False
+
+            # 기존 행 수정은 행 단위 쓰기 (테이블 락은 공유로)
+            if key is not None and self.row_locking and self._set_row(key, valid_data):
+                return True
             
-            with self.lock:
+            with self.lock, self._writes.writing():
                 # 1. 특정 키 업데이트/추가
                 if key is not None:
                     return self._set_item_by_key(key, valid_data)
@@ -1398,7 +2831,7 @@ class TableManager:
                 if 0 <= key < len(self.data):
                     for column, value in data.items():
                         if column in self.all_columns:
-                            self.data[key][column] = self._convert_value(column, value)
+                            self._set_value(self.data[key], column, value)
                     return True
             return False
         
@@ -1411,13 +2844,13 @@ class TableManager:
                 # 첫 번째 항목만 업데이트
                 for column, value in data.items():
                     if column in self.all_columns and column not in self.key_columns:
-                        items[0][column] = self._convert_value(column, value)
+                        self._set_value(items[0], column, value)
                 return True
         elif items:
             # 중복 비허용 모드일 때 항목 업데이트
             for column, value in data.items():
                 if column in self.all_columns and column not in self.key_columns:
-                    items[column] = self._convert_value(column, value)
+                    self._set_value(items, column, value)
             return True
         
         # 신규 항목 추가
@@ -1444,23 +2877,27 @@ class TableManager:
         # 데이터 채우기
         for column, value in data.items():
             if column in self.all_columns:
-                item[column] = self._convert_value(column, value)
+                self._set_value(item, column, value)
         
         # 데이터 추가
+        item = self._new_row(item)
         self.data.append(item)
         self._add_to_dict(key, item)
+        self._index_add(item)
+        self._log_change('add', item)
         self._resize = True
         return True
     
     def _update_filtered_items(self, filter, data):
         """필터링된 항목 업데이트"""
         updated = False
-        for item in self.data:
-            if self._match_conditions(item, filter):
+        match = _compile_filter(filter)
+        for item in self._candidate_rows(filter):
+            if match(item):
                 # 키 컬럼은 업데이트하지 않음
                 for column, value in data.items():
                     if column in self.all_columns and (self.no_key_mode or column not in self.key_columns):
-                        item[column] = self._convert_value(column, value)
+                        self._set_value(item, column, value)
                 updated = True
         return updated
     
@@ -1472,7 +2909,7 @@ class TableManager:
         for item in self.data:
             for column, value in data.items():
                 if column in self.all_columns and (self.no_key_mode or column not in self.key_columns):
-                    item[column] = self._convert_value(column, value)
+                    self._set_value(item, column, value)
         return True
     
     def delete(self, key=None, filter=None):
@@ -1482,13 +2919,13 @@ class TableManager:
         delete(key=(값1,값2)) -> bool     # 복합 키 행 삭제
         delete(filter={}) -> bool         # 조건 만족 행들 삭제
         """
-        with self.lock:
+        with self.lock, self._writes.writing():
             # 1. 특정 키 삭제
             if key is not None:
                 # 키 없는 모드에서는 인덱스로 처리
                 if self.no_key_mode:
                     if isinstance(key, int) and 0 <= key < len(self.data):
-                        del self.data[key]
+                        self._remove_row(self.data[key])
                         self._resize = True
                         return True
                     return False
@@ -1501,14 +2938,12 @@ class TableManager:
                 if self.allow_duplicate_keys:
                     # 중복 키 허용 모드: 모든 항목 삭제
                     for item in items[:]:  # 복사본으로 반복
-                        if item in self.data:
-                            self.data.remove(item)
+                        self._remove_row(item)
                     # 딕셔너리에서 키 삭제
                     self.data_dict.pop(key, None)
                 else:
                     # 중복 키 비허용 모드: 단일 항목 삭제
-                    if items in self.data:
-                        self.data.remove(items)
+                    self._remove_row(items)
                     self.data_dict.pop(key, None)
                     
                 self._resize = True
@@ -1516,7 +2951,8 @@ class TableManager:
             
             # 2. 필터링된 항목 삭제
             if filter is not None:
-                items_to_delete = [item for item in self.data if self._match_conditions(item, filter)]
+                match = _compile_filter(filter)
+                items_to_delete = [item for item in self._candidate_rows(filter) if match(item)]
                 if not items_to_delete:
                     return False
                 
@@ -1538,8 +2974,7 @@ class TableManager:
                             # 중복 키 비허용 모드: 키 삭제
                             self.data_dict.pop(key_val, None)
                 
-                    if item in self.data:
-                        self.data.remove(item)
+                    self._remove_row(item)
                     
                     if items_to_delete:
                         self._resize = True
@@ -1549,10 +2984,13 @@ class TableManager:
             # 3. 전체 데이터 삭제
             self.data = []
             self.data_dict = {}
+            if self.store is not None:
+                self.store.clear()
+            self._rebuild_indexes()
             self._resize = True
             return True
     
-    def _filter_data(self, conditions):
+    def _filter_data(self, conditions, copy_rows=True):
         """
         # conditions : {컬럼: 값} 컬럼과 값 비교
         {'col': 값}
@@ -1564,72 +3002,32 @@ class TableManager:
         {'col': ('==', 값)}               # col == 값
         {'col': ('!=', 값)}               # col != 값
         {'col': ('>', '@other_col')}      # col > other_col (컬럼 간 비교)
-        """
-        result = []
-        for row in self.data:
-            if self._match_conditions(row, conditions):
-                result.append(copy.deepcopy(row))
-        return result
+        copy_rows=False면 내부 행을 그대로 반환 (락 안에서 읽기만 할 때)
+        """
+        if copy_rows and self.store is not None:
+            rows = self.store.to_dicts(conditions)
+            if rows is not None:
+                return rows
+        rows = self.store.filter_rows(conditions) if self.store is not None else None
+        if rows is None:
+            match = _compile_filter(conditions)
+            rows = [row for row in self._candidate_rows(conditions) if match(row)]
+        if not copy_rows:
+            return rows
+        return [_copy_row(row) for row in rows]
     
-    def _match_conditions(self, row, conditions):
-        """항목이 조건에 맞는지 확인"""
-        for column, value in conditions.items():
-            if column not in row: return False
-                
-            item_value = row[column]
-            
-            # 문자열인 경우 포함 여부 확인
-            if isinstance(item_value, str) and isinstance(value, str):
-                if value not in item_value: return False
-            # 컬럼 간 비교인 경우 ('컬럼' 또는 '@컬럼')
-            elif isinstance(value, (list, tuple)) and len(value) == 2:
-                op, compare_value = value
-                # '@'로 시작하는 문자열은 다른 컬럼을 참조
-                if isinstance(compare_value, str) and compare_value.startswith('@'):
-                    other_column = compare_value[1:]  # '@' 제거
-                    if other_column not in row:
-                        return False
-                    other_value = row[other_column]
-                    if not self._compare_values(item_value, op, other_value):
-                        return False
-                # 일반 비교값
-                else:
-                    if not self._compare_values(item_value, op, compare_value):
-                        return False
-            # 그 외의 경우 정확히 일치하는지 확인
-            elif item_value != value:
-                return False
-                
-        return True
-    
-    def _compare_values(self, item_value, operator, compare_value):
-        """숫자형 값 비교 연산"""
-        ops = {
-            '>': lambda x, y: x > y,
-            '<': lambda x, y: x < y,
-            '>=': lambda x, y: x >= y,
-            '<=': lambda x, y: x <= y,
-            '==': lambda x, y: x == y,
-            '!=': lambda x, y: x != y
-        }
-        
-        if operator in ops:
-            try:
-                return ops[operator](item_value, compare_value)
-            except (TypeError, ValueError):
-                return False
-        return False
-
     def len(self, filter=None):
         """
         len() -> int                      # 전체 행 수 반환
         len(filter={}) -> int             # 조건 만족 행 수 반환
         """
-        with self.lock:
+        def read():
             if filter is not None:
-                return len(self._filter_data(filter))
+                counted = self.store.count(filter) if self.store is not None else None
+                return counted if counted is not None else len(self._filter_data(filter, copy_rows=False))
             return len(self.data)
-    
+        return self._read(read)
+
     def in_key(self, key):
         """
         in_key('key') -> bool             # 키 존재 여부
@@ -1637,7 +3035,7 @@ class TableManager:
         """
         # 키 없는 모드에서는 항상 False
         if self.no_key_mode: return False
-        with self.lock: return key in self.data_dict
+        return key in self.data_dict  # dict 조회는 원자적 - 락 불필요
     
     def in_key_set(self, key, data):
         """
@@ -1646,49 +3044,97 @@ class TableManager:
         # 키 없는 모드에서는 항상 False
         if self.no_key_mode: return False
             
-        with self.lock:
+        # 빈 데이터 필드 제거
+        valid_data = {k: v for k, v in data.items() if k in self.all_columns}
+        if not valid_data: return False
+
+        # 기존 행만 수정 - 행 단위 쓰기 (없으면 False)
+        if self.row_locking:
+            return self._set_row(key, valid_data)
+        with self.lock, self._writes.writing():
             if key not in self.data_dict: return False
-            # 빈 데이터 필드 제거
-            valid_data = {k: v for k, v in data.items() if k in self.all_columns}
-            if not valid_data: return False
-            
             return self._set_item_by_key(key, valid_data)
             
     def in_column(self, column, value):
         """
         in_column('col', 값) -> bool      # 컬럼에 값 존재 여부
         """
-        with self.lock:
+        def read():
             if column not in self.all_columns:
                 return False
             
             # 타입 변환
             converted_value = self._convert_value(column, value)
-            
+
+            if column in self.indexes:
+                return converted_value in self.indexes[column]
+
             for item in self.data:
                 if item.get(column) == converted_value:
                     return True
             return False
-    
+        return self._read(read)
+
+    def find(self, column, value, filter=None):
+        """
+        find('col', 값) -> 행 | None                  # 컬럼 값이 같은 첫 행 (in_column처럼 일치 비교)
+        find('col', 값, filter={}) -> 행 | None       # 그 중 조건도 만족하는 첫 행
+        view()처럼 복사 없는 읽기 전용 행 (MappingProxyType) - 인덱스 컬럼이면 그 값의 행 묶음만 봄 (실시간 틱 경로용)
+        """
+        if column not in self.all_columns:
+            return None
+        converted_value = self._convert_value(column, value)
+        match = None
+        def read():
+            nonlocal match
+            index = self.indexes.get(column)
+            rows = self.data if index is None else index.get(converted_value)
+            if not rows:
+                return None  # 대부분의 틱 - 조건 컴파일 없이 끝
+            if filter and match is None:
+                match = _compile_filter(filter)
+            if index is None:
+                for item in rows:
+                    if item.get(column) == converted_value and (match is None or match(item)):
+                        return MappingProxyType(item)
+                return None
+            found = None
+            for item in rows.values():
+                # 묶음 안 순서는 값이 바뀐 순서라서 data 순서(먼저 들어온 행)로 고름
+                if (match is None or match(item)) and (found is None or self._row_seq[id(item)] < self._row_seq[id(found)]):
+                    found = item
+            return None if found is None else MappingProxyType(found)
+        return self._read(read)
+
     def sum(self, column=None, filter=None):
         """
         sum(column=['c1', 'c2']) -> (합1, 합2, ...)  # 지정 컬럼 합계 튜플 반환
         sum(column=[], filter={}) -> (합1, 합2, ...)  # 조건 만족 행들의 합계 반환
         """
-        with self.lock:
+        def read():
             if not column:
                 return ()
+            columns = [column] if isinstance(column, str) else column
+
+            # 집계 컬럼만 요청하면 유지 중인 합계 사용 (행 순회 없음)
+            if filter is None and self.agg_columns and all(col in self.agg_columns for col in columns):
+                totals = self._aggs[None]['sum']
+                return tuple(totals[col] for col in columns)
             
+            # 컬럼형이면 배열 합계
+            if self.store is not None:
+                result = self.store.sum(columns, filter)
+                if result is not None:
+                    return result
+
             # 합계 계산할 데이터 선택
             data_to_sum = self.data
             if filter is not None:
-                data_to_sum = self._filter_data(filter)
+                data_to_sum = self._filter_data(filter, copy_rows=False)
             
             # 각 컬럼별 합계 계산
             result = []
-            if isinstance(column, str):
-                column = [column]
-            for col in column:
+            for col in columns:
                 if col in self.int_columns or col in self.float_columns:
                     total = sum(item.get(col, 0) for item in data_to_sum)
                     result.append(total)
@@ -1697,7 +3143,43 @@ class TableManager:
                     result.append(0)
             
             return tuple(result)
-    
+        return self._read(read)
+
+    def aggregate(self, column=None, func='sum', group=None):
+        """
+        aggregate('col') -> 합계                      # '집계' 컬럼 전체 합계
+        aggregate('col', 'min') / ('col', 'max') -> 값  # 최소/최대 (없으면 None)
+        aggregate(func='count') -> int                # 행 수
+        aggregate('col', group='값') -> 합계           # '집계그룹' 컬럼 값별 집계
+        행 추가/수정/삭제 때 갱신해 둔 값을 반환 - 최소/최대는 해당 값 행이 바뀐 뒤 처음 조회할 때만 다시 계산
+        '집계' 컬럼이 아니면 None
+        """
+        def read():
+            bucket = self._aggs.get(group)
+            if func == 'count':
+                if group is None:
+                    return len(self.data)
+                return bucket['count'] if bucket else 0
+            if column not in self.agg_columns:
+                return None
+            if func == 'sum':
+                return bucket['sum'][column] if bucket else 0
+            if func not in ('min', 'max') or not bucket or not bucket['count']:
+                return None
+            cache = bucket[func]
+            if column in cache:
+                return cache[column]
+            writes = self._writes
+            seq, active = writes.seq, writes.active
+            rows = self.data if group is None else (row for row in self.data if row.get(self.agg_group) == group)
+            value = (min if func == 'min' else max)(row.get(column, 0) for row in rows)
+            # 계산 중 쓰기가 겹쳤으면 캐시하지 않음 (반환값은 _read가 다시 읽음) - 시작 표시(begin)와 같은 락 안에서 확인 후 저장
+            with writes.lock:
+                if not active and not writes.active and writes.seq == seq:
+                    cache[column] = value
+            return value
+        return self._read(read)
+
     def update_table_widget(self, table_widget, stretch=True, header=0):
         """
         저장된 데이터를 테이블 위젯에 표시
@@ -1706,25 +3188,28 @@ class TableManager:
         table_widget (QTableWidget): 데이터를 표시할 테이블 위젯
         stretch (bool): 마지막 열을 테이블 너비에 맞게 늘릴지 여부
         header (int): 사용할 헤더 세트의 인덱스 (기본값: 0)
+        QTableView면 TableModel로 바뀐 행/셀만 반영 (update_table_view)
         """
-        from PyQt5.QtWidgets import QTableWidgetItem
+        from PyQt5.QtWidgets import QTableWidgetItem, QTableWidget
         from PyQt5.QtCore import Qt
+
+        if not isinstance(table_widget, QTableWidget):
+            return self.update_table_view(table_widget, stretch, header)
         
         # 락 사용 최소화 - 데이터 스냅샷만 빠르게 복사
-        with self.lock:
-            if not self.data:
-                table_widget.setRowCount(0)
-                return
-                
-            data_copy = copy.deepcopy(self.data)
-            if header < 0 or header >= len(self.display_columns):
-                header = 0
+        data_copy = self._read(lambda: [_copy_row(item) for item in self.data])
+        if not data_copy:
+            table_widget.setRowCount(0)
+            return
 
-            columns = self.display_columns[header]
-            resize_needed = self._resize
-            
-            if resize_needed:
-                self._resize = False
+        if header < 0 or header >= len(self.display_columns):
+            header = 0
+
+        columns = self.display_columns[header]
+        resize_needed = self._resize
+        
+        if resize_needed:
+            self._resize = False
         
         # UI 업데이트는 락 없이 수행
         table_widget.setUpdatesEnabled(False)
@@ -1760,27 +3245,64 @@ class TableManager:
             table_widget.setUpdatesEnabled(True)
             table_widget.setSortingEnabled(True)
             
+    def update_table_view(self, table_view, stretch=True, header=0):
+        """
+        QTableView에 표시 - 처음엔 TableModel + 정렬용 QSortFilterProxyModel 연결, 이후엔 변경 기록만 반영
+        행 추가/삭제가 있었을 때만 컬럼 폭 조정
+        """
+        from PyQt5.QtCore import QSortFilterProxyModel
+
+        if header < 0 or header >= len(self.display_columns):
+            header = 0
+        columns = self.display_columns[header]
+
+        try:
+            model = self._models.get(id(table_view))
+            if model is None or model.columns != columns:
+                model = TableModel(self, columns, table_view)
+                proxy = QSortFilterProxyModel(table_view)
+                proxy.setSourceModel(model)
+                proxy.setSortRole(Qt.UserRole)  # 표시 문자열 대신 원래 값으로 정렬
+                table_view.setModel(proxy)
+                table_view.setSortingEnabled(True)
+                self._models[id(table_view)] = model
+                resize_needed = True
+            else:
+                resize_needed = model.sync() and self._resize
+
+            if resize_needed:
+                self._resize = False
+                table_view.resizeColumnsToContents()
+                table_view.resizeRowsToContents()
+                if stretch:
+                    table_view.horizontalHeader().setStretchLastSection(stretch)
+        except Exception as e:
+            import logging
+            logging.error(f'update_table_view 오류: {type(e).__name__} - {e}', exc_info=True)
+
+    def _display_text(self, column, value):
+        """셀 표시 문자열"""
+        # 숫자 형식화
+        if column in self.int_columns and isinstance(value, int):
+            return f"{value:,}"
+        if column in self.float_columns and isinstance(value, float):
+            return f"{value:,.2f}"
+        display_value = str(value).rstrip() # 빈 줄 제거
+        # "스크립트" 컬럼의 경우 마지막 줄만 표시
+        if column in ['스크립트', '설명'] and '\n' in display_value:
+            lines = display_value.split('\n')
+            # 마지막 줄이 비어있으면 그 전 줄을 사용
+            last_line = lines[-1] if lines[-1].strip() else lines[-2] if len(lines) > 1 else lines[0]
+            display_value = last_line[:35]
+        return display_value
+
     def _set_table_cell(self, table_widget, row, col, column, value):
         """테이블의 특정 셀에 값 설정"""
         from PyQt5.QtWidgets import QTableWidgetItem
         from PyQt5.QtCore import Qt
         
         original_value = str(value)
-        
-        # 숫자 형식화
-        if column in self.int_columns and isinstance(value, int):
-            display_value = f"{value:,}"
-        elif column in self.float_columns and isinstance(value, float):
-            display_value = f"{value:,.2f}"
-        else:
-            display_value = str(value).rstrip() # 빈 줄 제거
-            # "스크립트" 컬럼의 경우 마지막 줄만 표시
-            if column in ['스크립트', '설명'] and '\n' in display_value:
-                lines = display_value.split('\n')
-                # 마지막 줄이 비어있으면 그 전 줄을 사용
-                last_line = lines[-1] if lines[-1].strip() else lines[-2] if len(lines) > 1 else lines[0]
-                display_value = last_line[:35]
-                #display_value = last_line if last_line.strip() else "(빈 줄)"
+        display_value = self._display_text(column, value)
                 
         # 기존 아이템 재사용
         existing_item = table_widget.item(row, col)
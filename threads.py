@@ -1,6 +1,6 @@
 from PyQt5.QtCore import QThread, QTimer
 from classes import TimeLimiter, QData
-from public import gm, dc, Work,QWork, save_json, hoga, com_market_status, profile_operation
+from public import gm, dc, Work,QWork, TickRing, save_json, hoga, com_market_status, profile_operation
 from chart import ChartData
 from datetime import datetime, timedelta
 import queue
@@ -34,6 +34,29 @@ class RealReceiver():
     def proxy_method(self, qwork):
         self.emit_q.put(qwork) # qwork = QWork()
 
+class TickReader(QThread):
+    """
+    공유메모리 링(TickRing)의 실시간 체결을 묶음으로 꺼내 rcv 시그널로 전달 (RealReceiver 경로와 동일한 QWork, 같은 문자열 값)
+    - 링 체결끼리는 순서대로지만 RealReceiver 경로(조건검색 등)와의 앞뒤 순서는 보장하지 않음
+    """
+    def __init__(self, rcv, tick_ring):
+        super().__init__()
+        self.daemon = True
+        self.name = 'tkr'
+        self.rcv = rcv
+        self.tick_ring = tick_ring
+        self.running = False
+
+    def stop(self):
+        self.running = False
+
+    def run(self):
+        self.running = True
+        while self.running:
+            if not self.tick_ring.wait(dc.INTERVAL_SLOW): continue
+            for code, fid in self.tick_ring.read_batch(dc.QUEUE_BATCH_MAX):
+                self.rcv.receive_signal.emit(QWork(method='on_receive_real_data', args=(code, TickRing.RTYPE, fid)))
+
 class PriceUpdater(QThread):
     def __init__(self, prx, price_q):
         super().__init__()
@@ -42,14 +65,23 @@ class PriceUpdater(QThread):
         self.price_q = price_q
         self.running = True
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self.holdings_sub = None
 
     def stop(self):
         self.running = False
         self.price_q.put(None)
         self.executor.shutdown(wait=True)
+        if self.holdings_sub:
+            # 먼저 해제해서 전달 스레드를 멈춘 뒤, 아직 저장 안 된 마지막 변경을 직접 저장
+            self.holdings_sub.close()
+            self.holdings_sub.flush()
+            self.holdings_sub = None
     
     def run(self):
         self.running = True
+        # 감시/보존 상태 저장은 틱마다 하지 않고 바뀐 것만 모아서
+        if self.holdings_sub is None:  # 다시 시작해도 구독은 하나만
+            self.holdings_sub = gm.잔고목록.subscribe(self.save_holdings, columns=['감시', '보존'], interval=1.0)
         while self.running:
             batch = set()
             start_time = time.time()
@@ -148,14 +180,22 @@ class PriceUpdater(QThread):
             }, key=0)
             gm.l2잔고합산_copy = gm.잔고합산.get(key=0)
 
-            if 새감시 != 감시 or 새보존 != 보존:
-                gm.holdings[code]['감시'] = 새감시
-                gm.holdings[code]['보존'] = 새보존
-                save_json(dc.fp.holdings_file, gm.holdings)
-
         except Exception as e:
             logging.error(f'실시간 배치 오류: {type(e).__name__} - {e}', exc_info=True)
 
+    def save_holdings(self, events):
+        """잔고목록 감시/보존 변경분만 holdings에 반영해 저장 (변경 구독 콜백 - 1초 단위로 모아서)"""
+        changed = False
+        for op, code, row, columns in events:
+            if op != 'update' or code not in gm.holdings:
+                continue
+            for column in ('감시', '보존'):
+                if column in columns and gm.holdings[code].get(column) != row[column]:
+                    gm.holdings[code][column] = row[column]
+                    changed = True
+        if changed:
+            save_json(dc.fp.holdings_file, gm.holdings)
+
 class ChartUpdater(QThread):
     def __init__(self, prx, chart_q):
         super().__init__()
@@ -208,13 +248,18 @@ class ChartUpdater(QThread):
             self.executor.submit(self.update_chart, code, fid)
 
     def update_chart(self, code, fid):
-        self.cht_dt.update_chart(
-            code, 
-            abs(int(fid['현재가'])) if fid['현재가'] else 0,
-            abs(int(fid['누적거래량'])) if fid['누적거래량'] else 0,
-            abs(int(fid['누적거래대금'])) if fid['누적거래대금'] else 0,
-            dc.ToDay+fid['체결시간']
-        )
+        price = abs(int(fid['현재가'])) if fid['현재가'] else 0
+        volume = abs(int(fid['누적거래량'])) if fid['누적거래량'] else 0
+        amount = abs(int(fid['누적거래대금'])) if fid['누적거래대금'] else 0
+        dt = dc.ToDay+fid['체결시간']
+
+        # 병합된 체결(ConflatingQueue): 구간 시가/고가/저가를 먼저 반영 (누적값 기준이라 거래량은 중복되지 않음)
+        if '_conflated' in fid:
+            for extreme in (fid['_open'], fid['_high'], fid['_low']):
+                if extreme and extreme != price:
+                    self.cht_dt.update_chart(code, extreme, volume, amount, dt)
+
+        self.cht_dt.update_chart(code, price, volume, amount, dt)
 
 class ChartSetter(QThread):
     def __init__(self, prx, setter_q):
@@ -248,6 +293,15 @@ class ChartSetter(QThread):
     def request_chart_data(self, code):
         if self.cht_dt.is_code_registered(code):
             return
+        if not self.cht_dt.needs_daily():
+            # 전략 스크립트가 분봉만 사용하면 1분봉만 요청
+            logging.debug(f"get_chart_data(mi1) 요청: {code}")
+            dict_list = self.prx.answer('api', 'get_chart_data', code, 'mi', 1)
+            if not dict_list:
+                logging.warning(f"차트 데이터 없음: {code}")
+                return
+            self.cht_dt.set_chart_data(code, dict_list, 'mi', 1)
+            return
         logging.debug(f"get_first_chart_data 요청: {code}")
         dict_tuple = self.prx.answer('api', 'get_first_chart_data', code)
         if not dict_tuple or not all(dict_tuple):
@@ -308,7 +362,7 @@ class OrderCommander(QThread):
         전략명칭 = gm.실행전략['전략명칭']
         매수전략 = gm.설정전략['매수전략']
 
-        name = self.prx.answer('api', 'GetMasterCodeName', code)
+        name = gm.master.get_name(code)
         #logging.debug(f'주문 요청 확인: code={code}, name={name}')
         주문유형 = dc.fid.주문유형FID[ordtype]
 
@@ -349,9 +403,21 @@ class EvalStrategy(QThread):
             for key, value in new_dict.items():
                 setattr(self, key, value)
             self.set_clear_timer()
+            self.set_script_cycles()
         except Exception as e:
             logging.error(f'딕셔너리 설정 오류: {type(e).__name__} - {e}', exc_info=True)
 
+    def set_script_cycles(self):
+        """적용 중인 매수/매도 스크립트가 사용하는 차트 주기를 미리 등록"""
+        try:
+            script_names = []
+            if getattr(self, '매수스크립트적용', False): script_names.append(getattr(self, '매수스크립트', ''))
+            if getattr(self, '매도스크립트적용', False): script_names.append(getattr(self, '매도스크립트', ''))
+            cycles = gm.scm.prepare_strategy_scripts(script_names)
+            logging.info(f'스크립트 사용 주기 등록: {cycles if cycles is not None else "전체"}')
+        except Exception as e:
+            logging.error(f'스크립트 사용 주기 등록 오류: {type(e).__name__} - {e}', exc_info=True)
+
     def stop(self):
         self.running = False
         if self.clear_timer:
@@ -471,13 +537,13 @@ class EvalStrategy(QThread):
                 if self.cht_dt.is_code_registered(code):
                     try:
                         매수일시 = datetime.now().strftime('%Y%m%d%H%M%S')
-                        result = gm.scm.run_script(self.매수스크립트, kwargs={'code': code, 'name': name, 'price': price, 'qty': send_data['quantity'], 'buy_dt': ''})
+                        result = (gm.scp or gm.scm).run_script(self.매수스크립트, kwargs={'code': code, 'name': name, 'price': price, 'qty': send_data['quantity'], 'buy_dt': ''})
                         gm.qwork['msg'].put(Work('스크립트', job={'msg': result['logs']}))
                         if result.get('error') or not result.get('result', False):
                             if result.get('flag', False):
                                 # 매수검색목록에 있고 이탈하지 않았으면 재시도 (차트미비 로직 활용)
                                 if gm.매수검색목록.in_key(code):
-                                    search_row = gm.매수검색목록.get(key=code)
+                                    search_row = gm.매수검색목록.view(key=code)
                                     if not search_row.get('이탈'):  # 이탈 표시가 없으면 재시도
                                         # 10초 후 재시도 (차트미비와 동일한 로직 사용)
                                         gm.eval_q.put((code, 'buy', {'rqname': rqname, 'price': price, 'time': datetime.now(), 'retry_seconds': 10.0}))
@@ -593,7 +659,7 @@ class EvalStrategy(QThread):
             # not sell_condition or not script_or
             elif self.매도스크립트적용 and gm.sim_no != 1:
                 if self.cht_dt.is_code_registered(code):
-                    result = gm.scm.run_script(self.매도스크립트, kwargs={'code': code, 'name': 종목명, 'price': 매입가, 'qty': 보유수량, 'buy_dt': 매수일시})
+                    result = (gm.scp or gm.scm).run_script(self.매도스크립트, kwargs={'code': code, 'name': 종목명, 'price': 매입가, 'qty': 보유수량, 'buy_dt': 매수일시})
                     if not result['error']:
                         if result.get('result', False): # self.매도스크립트AND 조건
                             send_data['msg'] = '전략매도'
@@ -611,7 +677,7 @@ class EvalStrategy(QThread):
 
             if self.로스컷 and self.로스컷율 != 0:
                 send_list = []
-                매입금액, 평가손익 = gm.잔고목록.sum(columns=['매입금액', '평가손익'])
+                매입금액, 평가손익 = gm.잔고목록.sum(column=['매입금액', '평가손익'])
                 수익율 = (평가손익 / 매입금액) * 100 if 매입금액 > 0 else 0
 
                 if self.로스컷율 > 0 and 수익율 <= self.로스컷율 or self.로스컷율 < 0 and 수익율 >= self.로스컷율: 
@@ -619,7 +685,7 @@ class EvalStrategy(QThread):
                 
                 gm.admin.매도취소 = False
 
-                rows = gm.잔고목록.get()
+                rows = gm.잔고목록.view()
                 if self.로스컷시장가:
                     send_list = [{**send_data, 'code': row['종목번호'], 'price': 0, 'quantity': row['보유수량'], 'msg': '로스컷장'} for row in rows]
                 else: